@@ -1,10 +1,18 @@
-from fastapi import APIRouter, Depends
+import datetime
+from fastapi import APIRouter, Depends, HTTPException, Response
 from typing import List, Optional
 from pydantic import BaseModel
 from app.services.admin_service import AdminService
-from app.schemas.user import User, UserRole
-from app.core.security import require_role, get_current_user
-from app.core.dependencies import get_admin_service
+from app.schemas.user import User, UserRole, Principal
+from app.core.security import require_role, get_current_principal
+from app.core.pagination import PageParams
+from app.repositories.checklist_template import TEMPLATE_FIELDS
+from app.core.dependencies import (
+    get_admin_service, get_user_cache, get_unread_count_cache,
+    get_dashboard_summary_cache, get_dashboard_notice_cache, get_notification_dispatcher,
+    get_template_snapshot_cache,
+)
+from app.schemas.checklist_template import ChecklistTemplateUpdate
 
 router = APIRouter(dependencies=[Depends(require_role([UserRole.ADMIN, UserRole.MANAGER]))])
 
@@ -42,7 +50,7 @@ class FeedbackCreateRequest(BaseModel):
 
 @router.get("/staff/pending", response_model=List[User])
 async def get_pending_staff(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AdminService = Depends(get_admin_service),
 ):
     return await service.get_pending_staff(current_user.company_id)
@@ -60,7 +68,7 @@ async def reject_staff(user_id: str, service: AdminService = Depends(get_admin_s
 
 @router.get("/company")
 async def get_company(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AdminService = Depends(get_admin_service),
 ):
     return await service.get_company(current_user.company_id)
@@ -68,7 +76,7 @@ async def get_company(
 @router.patch("/company")
 async def update_company(
     body: CompanyUpdateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AdminService = Depends(get_admin_service),
 ):
     data = body.model_dump(exclude_unset=True)
@@ -79,7 +87,7 @@ async def update_company(
 
 @router.get("/brands")
 async def list_brands(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AdminService = Depends(get_admin_service),
 ):
     return await service.list_brands(current_user.company_id)
@@ -87,7 +95,7 @@ async def list_brands(
 @router.post("/brands", status_code=201)
 async def create_brand(
     body: BrandCreateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AdminService = Depends(get_admin_service),
 ):
     return await service.create_brand({"company_id": current_user.company_id, "name": body.name})
@@ -155,7 +163,7 @@ async def delete_group(group_id: str, service: AdminService = Depends(get_admin_
 @router.post("/checklist-templates", status_code=201)
 async def create_template(
     data: dict,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AdminService = Depends(get_admin_service),
 ):
     data["company_id"] = current_user.company_id
@@ -164,37 +172,89 @@ async def create_template(
 @router.get("/checklist-templates")
 async def list_templates(
     branch_id: Optional[str] = None,
-    current_user: User = Depends(get_current_user),
+    select: str = Depends(TEMPLATE_FIELDS),
+    current_user: Principal = Depends(get_current_principal),
     service: AdminService = Depends(get_admin_service),
 ):
-    return await service.list_checklist_templates(current_user.company_id, branch_id)
+    """Items and groups are only embedded with ``include=items,groups``."""
+    return await service.list_checklist_templates(current_user.company_id, branch_id, select=select)
+
+@router.patch("/checklist-templates/{template_id}")
+async def update_template(
+    template_id: str,
+    body: ChecklistTemplateUpdate,
+    service: AdminService = Depends(get_admin_service),
+):
+    return await service.update_checklist_template(template_id, body.model_dump(exclude_unset=True))
+
+@router.delete("/checklist-templates/{template_id}")
+async def delete_template(template_id: str, service: AdminService = Depends(get_admin_service)):
+    await service.delete_checklist_template(template_id)
+    return {"message": "Template deleted."}
 
 
 # ── Dashboard ────────────────────────────────────────
 
 @router.get("/dashboard/checklist-compliance")
-async def get_compliance(branch_id: str, date: str, service: AdminService = Depends(get_admin_service)):
-    return await service.get_compliance_summary(branch_id, date)
+async def get_compliance(
+    branch_id: str,
+    date: Optional[datetime.date] = None,
+    date_from: Optional[datetime.date] = None,
+    date_to: Optional[datetime.date] = None,
+    service: AdminService = Depends(get_admin_service),
+):
+    """Completion rates for one ``date`` or a ``date_from``..``date_to`` range, with a timing breakdown."""
+    date_from = date_from or date
+    date_to = date_to or date_from
+    if not date_from:
+        raise HTTPException(status_code=400, detail="date or date_from is required.")
+    if date_to < date_from:
+        raise HTTPException(status_code=400, detail="date_from must not be after date_to.")
+    return await service.get_compliance_summary(branch_id, date_from.isoformat(), date_to.isoformat())
+
+
+# ── System ───────────────────────────────────────────
+
+@router.get("/system/cache-stats")
+async def get_cache_stats():
+    return {
+        "user_cache": (await get_user_cache()).stats(),
+        "unread_count_cache": (await get_unread_count_cache()).stats(),
+        "dashboard_summary_cache": (await get_dashboard_summary_cache()).stats(),
+        "dashboard_notice_cache": (await get_dashboard_notice_cache()).stats(),
+        "template_snapshot_cache": (await get_template_snapshot_cache()).stats(),
+    }
+
+
+@router.get("/system/notification-metrics")
+async def get_notification_metrics():
+    return {"channels": (await get_notification_dispatcher()).metrics()}
 
 
 # ── Feedbacks ────────────────────────────────────────
 
 @router.get("/feedbacks")
 async def list_feedbacks(
+    response: Response,
     target_user_id: Optional[str] = None,
     assignment_id: Optional[str] = None,
-    current_user: User = Depends(get_current_user),
+    page: PageParams = Depends(),
+    current_user: Principal = Depends(get_current_principal),
     service: AdminService = Depends(get_admin_service),
 ):
-    return await service.list_feedbacks(current_user.company_id, {
+    """Newest first. When more feedbacks exist, X-Next-Cursor holds the cursor for the next page."""
+    feedbacks, next_cursor = await service.list_feedbacks(current_user.company_id, {
         "target_user_id": target_user_id,
         "assignment_id": assignment_id,
-    })
+    }, limit=page.limit, cursor=page.cursor)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return feedbacks
 
 @router.post("/feedbacks", status_code=201)
 async def create_feedback(
     body: FeedbackCreateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AdminService = Depends(get_admin_service),
 ):
     data = body.model_dump()
@@ -1,13 +1,17 @@
-from fastapi import APIRouter, HTTPException, Depends
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from typing import List, Optional
 from pydantic import BaseModel
 from app.schemas.assignment import AssignmentCreate, AssignmentUpdate, Comment
 from app.services.assignment_service import AssignmentService
 from app.services.comment_service import CommentService
-from app.models.enums import AssignmentStatus
-from app.core.security import get_current_user
+from app.services.recurrence import InvalidRecurrence
+from app.models.enums import AssignmentStatus, Priority
+from app.core.security import get_current_user, get_current_principal
 from app.core.dependencies import get_assignment_service, get_comment_service
-from app.schemas.user import User
+from app.core.pagination import PageParams
+from app.repositories.assignment import ASSIGNMENT_LIST_FIELDS, ASSIGNMENT_DETAIL_FIELDS
+from app.schemas.user import User, Principal
 
 router = APIRouter()
 
@@ -30,34 +34,71 @@ class StatusUpdateRequest(BaseModel):
 
 @router.get("/")
 async def list_assignments(
-    status: Optional[str] = None,
+    response: Response,
+    status: Optional[List[AssignmentStatus]] = Query(None),
+    priority: Optional[List[Priority]] = Query(None),
     branch_id: Optional[str] = None,
-    current_user: User = Depends(get_current_user),
+    due_from: Optional[datetime] = None,
+    due_to: Optional[datetime] = None,
+    page: PageParams = Depends(),
+    select: str = Depends(ASSIGNMENT_LIST_FIELDS),
+    current_user: Principal = Depends(get_current_principal),
     service: AssignmentService = Depends(get_assignment_service),
 ):
+    """Newest first. Repeat status/priority to match any of several values
+    (``?status=todo&status=in_progress``); due_from/due_to bound the due date.
+    Assignees are only embedded with ``include=assignees``. When more
+    assignments exist, X-Next-Cursor holds the cursor for the next page."""
+    if due_from and due_to and due_from > due_to:
+        raise HTTPException(status_code=400, detail="due_from must not be after due_to.")
     filters = {}
     if status:
-        filters["status"] = status
+        filters["status"] = sorted({s.value for s in status})
+    if priority:
+        filters["priority"] = sorted({p.value for p in priority})
     if branch_id:
         filters["branch_id"] = branch_id
-    return await service.list_assignments(current_user.company_id, filters)
+    if due_from:
+        filters["due_from"] = due_from.isoformat()
+    if due_to:
+        filters["due_to"] = due_to.isoformat()
+    assignments, next_cursor = await service.list_assignments(
+        current_user.company_id, filters, limit=page.limit, cursor=page.cursor, select=select
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return assignments
 
 
 @router.get("/my")
 async def get_my_assignments(
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    status: Optional[List[AssignmentStatus]] = Query(None),
+    page: PageParams = Depends(),
+    select: str = Depends(ASSIGNMENT_LIST_FIELDS),
+    current_user: Principal = Depends(get_current_principal),
     service: AssignmentService = Depends(get_assignment_service),
 ):
-    return await service.get_my_assignments(current_user.id, current_user.company_id)
+    """Newest first. When more assignments exist, X-Next-Cursor holds the cursor for the next page."""
+    assignments, next_cursor = await service.get_my_assignments(
+        current_user.id, current_user.company_id,
+        status=sorted({s.value for s in status}) if status else None,
+        limit=page.limit, cursor=page.cursor, select=select,
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return assignments
 
 
 @router.get("/{assignment_id}")
 async def get_assignment(
     assignment_id: str,
-    current_user: User = Depends(get_current_user),
+    select: str = Depends(ASSIGNMENT_DETAIL_FIELDS),
+    current_user: Principal = Depends(get_current_principal),
     service: AssignmentService = Depends(get_assignment_service),
 ):
-    assignment = await service.get_assignment(assignment_id)
+    """Embeds assignees by default; ``include=assignees,comments`` adds comments."""
+    assignment = await service.get_assignment(assignment_id, select=select)
     if not assignment:
         raise HTTPException(status_code=404, detail="Assignment not found.")
     return assignment
@@ -66,7 +107,7 @@ async def get_assignment(
 @router.post("/", status_code=201)
 async def create_assignment(
     body: AssignmentCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AssignmentService = Depends(get_assignment_service),
 ):
     data = body.model_dump(exclude={"assignee_ids"})
@@ -75,14 +116,17 @@ async def create_assignment(
     # Convert enums to values
     data["priority"] = data["priority"].value if hasattr(data["priority"], "value") else data["priority"]
     data["status"] = data["status"].value if hasattr(data["status"], "value") else data["status"]
-    return await service.create_assignment(data, body.assignee_ids)
+    try:
+        return await service.create_assignment(data, body.assignee_ids)
+    except InvalidRecurrence as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.patch("/{assignment_id}")
 async def update_assignment(
     assignment_id: str,
     body: AssignmentUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AssignmentService = Depends(get_assignment_service),
 ):
     data = body.model_dump(exclude_unset=True)
@@ -90,13 +134,16 @@ async def update_assignment(
         data["status"] = data["status"].value
     if "priority" in data and hasattr(data["priority"], "value"):
         data["priority"] = data["priority"].value
-    return await service.update_assignment(assignment_id, data)
+    try:
+        return await service.update_assignment(assignment_id, data)
+    except InvalidRecurrence as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.delete("/{assignment_id}")
 async def delete_assignment(
     assignment_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AssignmentService = Depends(get_assignment_service),
 ):
     await service.delete_assignment(assignment_id)
@@ -107,7 +154,7 @@ async def delete_assignment(
 async def update_status(
     assignment_id: str,
     body: StatusUpdateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AssignmentService = Depends(get_assignment_service),
 ):
     return await service.update_status(assignment_id, body.status.value)
@@ -119,7 +166,7 @@ async def update_status(
 async def add_assignees(
     assignment_id: str,
     body: AssigneeUpdateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AssignmentService = Depends(get_assignment_service),
 ):
     result = await service.add_assignees(assignment_id, body.user_ids)
@@ -130,7 +177,7 @@ async def add_assignees(
 async def remove_assignee(
     assignment_id: str,
     user_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AssignmentService = Depends(get_assignment_service),
 ):
     await service.remove_assignee(assignment_id, user_id)
@@ -142,10 +189,16 @@ async def remove_assignee(
 @router.get("/{assignment_id}/comments", response_model=List[Comment])
 async def list_comments(
     assignment_id: str,
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    page: PageParams = Depends(),
+    current_user: Principal = Depends(get_current_principal),
     service: CommentService = Depends(get_comment_service),
 ):
-    return await service.list_comments(assignment_id)
+    """Oldest first. When more comments exist, X-Next-Cursor holds the cursor for the next page."""
+    comments, next_cursor = await service.list_comments(assignment_id, limit=page.limit, cursor=page.cursor)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return comments
 
 
 @router.post("/{assignment_id}/comments", status_code=201)
@@ -170,7 +223,7 @@ async def create_comment(
 async def delete_comment(
     assignment_id: str,
     comment_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: CommentService = Depends(get_comment_service),
 ):
     await service.delete_comment(comment_id)
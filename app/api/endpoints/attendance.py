@@ -4,15 +4,15 @@ from datetime import date
 from app.schemas.attendance import AttendanceRecord, ClockInRequest, AttendanceHistoryResponse
 from app.services.attendance_service import AttendanceService
 from app.core.dependencies import get_attendance_service
-from app.core.security import get_current_user
-from app.schemas.user import User
+from app.core.security import get_current_principal
+from app.schemas.user import Principal
 
 router = APIRouter()
 
 
 @router.get("/today", response_model=Optional[AttendanceRecord])
 async def get_today_status(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AttendanceService = Depends(get_attendance_service),
 ):
     return await service.get_today_status(current_user.id, current_user.company_id)
@@ -21,7 +21,7 @@ async def get_today_status(
 @router.post("/clock-in", response_model=AttendanceRecord, status_code=201)
 async def clock_in(
     body: ClockInRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AttendanceService = Depends(get_attendance_service),
 ):
     try:
@@ -37,7 +37,7 @@ async def clock_in(
 
 @router.post("/clock-out", response_model=AttendanceRecord)
 async def clock_out(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AttendanceService = Depends(get_attendance_service),
 ):
     try:
@@ -50,7 +50,7 @@ async def clock_out(
 async def get_history(
     year: Optional[int] = None,
     month: Optional[int] = None,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AttendanceService = Depends(get_attendance_service),
 ):
     today = date.today()
@@ -2,8 +2,9 @@ from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, EmailStr
 from app.services.auth_service import AuthService
 from app.core.dependencies import get_auth_service
-from app.core.security import get_current_user
-from app.schemas.user import User, UserCreate
+from app.core.password import PasswordHasherBusy
+from app.core.security import get_current_user, get_current_principal
+from app.schemas.user import User, UserCreate, Principal
 
 router = APIRouter()
 
@@ -39,6 +40,8 @@ class SendVerificationRequest(BaseModel):
 async def login(body: LoginRequest, service: AuthService = Depends(get_auth_service)):
     try:
         return await service.login(body.login_id, body.password)
+    except PasswordHasherBusy:
+        raise HTTPException(status_code=503, detail="Server is busy. Please try again.")
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid login ID or password.")
 
@@ -55,6 +58,8 @@ async def signup(body: SignupRequest, service: AuthService = Depends(get_auth_se
             language=body.language,
         )
         return await service.signup(user_data, company_code=body.company_code)
+    except PasswordHasherBusy:
+        raise HTTPException(status_code=503, detail="Server is busy. Please try again.")
     except Exception as e:
         msg = str(e)
         if "not verified" in msg.lower():
@@ -68,7 +73,7 @@ async def signup(body: SignupRequest, service: AuthService = Depends(get_auth_se
 
 @router.post("/logout")
 async def logout(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: AuthService = Depends(get_auth_service),
 ):
     return await service.logout()
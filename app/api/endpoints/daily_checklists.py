@@ -1,10 +1,12 @@
+from datetime import date as Date
 from fastapi import APIRouter, HTTPException, Depends
 from typing import Optional, List
-from pydantic import BaseModel
-from app.services.daily_checklist_service import DailyChecklistService
-from app.core.security import get_current_user
+from pydantic import BaseModel, Field
+from app.services.daily_checklist_service import DailyChecklistService, ChecklistVersionConflict
+from app.core.config import settings
+from app.core.security import get_current_principal, require_role
 from app.core.dependencies import get_daily_checklist_service
-from app.schemas.user import User
+from app.schemas.user import Principal, UserRole
 
 router = APIRouter()
 
@@ -17,9 +19,24 @@ class GenerateChecklistRequest(BaseModel):
     date: str
     group_ids: Optional[List[str]] = None
 
+class BulkGenerateRequest(BaseModel):
+    date_from: Date
+    date_to: Date
+    branch_ids: Optional[List[str]] = None
+
 class ChecklistItemUpdateRequest(BaseModel):
     is_completed: bool
     verification_data: Optional[str] = None
+    expected_version: Optional[int] = None
+
+class ChecklistItemChange(BaseModel):
+    item_index: int
+    is_completed: bool
+    verification_data: Optional[str] = None
+    base_completed: Optional[bool] = None  # state the client last saw; a mismatch is a conflict
+
+class ChecklistItemsUpdateRequest(BaseModel):
+    changes: List[ChecklistItemChange] = Field(min_length=1, max_length=500)
 
 
 # ── Endpoints ────────────────────────────────────────
@@ -28,7 +45,7 @@ class ChecklistItemUpdateRequest(BaseModel):
 async def list_daily_checklists(
     branch_id: str,
     date: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: DailyChecklistService = Depends(get_daily_checklist_service),
 ):
     return await service.list_by_branch_date(branch_id, date)
@@ -37,7 +54,7 @@ async def list_daily_checklists(
 @router.get("/{checklist_id}")
 async def get_daily_checklist(
     checklist_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: DailyChecklistService = Depends(get_daily_checklist_service),
 ):
     checklist = await service.get_checklist(checklist_id)
@@ -49,7 +66,7 @@ async def get_daily_checklist(
 @router.post("/generate", status_code=201)
 async def generate_daily_checklist(
     body: GenerateChecklistRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: DailyChecklistService = Depends(get_daily_checklist_service),
 ):
     try:
@@ -63,14 +80,52 @@ async def generate_daily_checklist(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/generate-bulk")
+async def generate_daily_checklists_bulk(
+    body: BulkGenerateRequest,
+    current_user: Principal = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER])),
+    service: DailyChecklistService = Depends(get_daily_checklist_service),
+):
+    """Generate the missing checklists of every active template of the
+    company for a date range. Safe to repeat; existing checklists are skipped."""
+    days = (body.date_to - body.date_from).days + 1
+    if days < 1:
+        raise HTTPException(status_code=400, detail="date_from must not be after date_to.")
+    if days > settings.CHECKLIST_BULK_MAX_DAYS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {settings.CHECKLIST_BULK_MAX_DAYS} days per request."
+        )
+    return await service.generate_bulk(
+        current_user.company_id, body.date_from, body.date_to, branch_ids=body.branch_ids
+    )
+
+
+@router.patch("/{checklist_id}/items")
+async def update_checklist_items(
+    checklist_id: str,
+    body: ChecklistItemsUpdateRequest,
+    current_user: Principal = Depends(get_current_principal),
+    service: DailyChecklistService = Depends(get_daily_checklist_service),
+):
+    """Apply several item changes in one atomic write. Every change is
+    reported as applied, unchanged, conflict or invalid_index."""
+    changes = [c.model_dump(exclude_none=True) for c in body.changes]
+    try:
+        return await service.update_checklist_items(checklist_id, current_user.id, changes)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.patch("/{checklist_id}/items/{item_index}")
 async def update_checklist_item(
     checklist_id: str,
     item_index: int,
     body: ChecklistItemUpdateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: DailyChecklistService = Depends(get_daily_checklist_service),
 ):
+    """Returns the updated item and the checklist's new version. Send
+    expected_version to get a 409 instead of applying over someone else's change."""
     try:
         return await service.update_checklist_item(
             checklist_id=checklist_id,
@@ -78,6 +133,11 @@ async def update_checklist_item(
             user_id=current_user.id,
             is_completed=body.is_completed,
             verification_data=body.verification_data,
+            expected_version=body.expected_version,
+        )
+    except ChecklistVersionConflict as e:
+        raise HTTPException(
+            status_code=409, detail={"message": str(e), "current_version": e.current_version}
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
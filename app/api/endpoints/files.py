@@ -2,8 +2,8 @@ from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Query
 from pydantic import BaseModel
 from app.services.file_service import FileService
 from app.core.dependencies import get_file_service
-from app.core.security import get_current_user
-from app.schemas.user import User
+from app.core.security import get_current_principal
+from app.schemas.user import Principal
 
 router = APIRouter()
 
@@ -24,7 +24,7 @@ class DeleteFileRequest(BaseModel):
 async def upload_file(
     file: UploadFile = File(...),
     folder: str = Query(default="uploads"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: FileService = Depends(get_file_service),
 ):
     content = await file.read()
@@ -39,7 +39,7 @@ async def upload_file(
 @router.post("/presigned-url")
 async def get_presigned_url(
     body: PresignedUrlRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: FileService = Depends(get_file_service),
 ):
     url = await service.get_presigned_url(body.file_path)
@@ -49,7 +49,7 @@ async def get_presigned_url(
 @router.delete("/delete")
 async def delete_file(
     body: DeleteFileRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: FileService = Depends(get_file_service),
 ):
     await service.delete_file(body.file_path)
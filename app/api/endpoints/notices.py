@@ -3,8 +3,8 @@ from typing import List, Optional
 from app.schemas.notice import Notice, NoticeCreate
 from app.services.notice_service import NoticeService
 from app.core.dependencies import get_notice_service
-from app.core.security import get_current_user, require_role
-from app.schemas.user import User, UserRole
+from app.core.security import get_current_user, get_current_principal, require_role
+from app.schemas.user import User, UserRole, Principal
 
 router = APIRouter()
 
@@ -14,7 +14,7 @@ router = APIRouter()
 @router.get("/", response_model=List[Notice])
 async def read_notices(
     limit: Optional[int] = None,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: NoticeService = Depends(get_notice_service),
 ):
     return await service.list_notices(current_user.company_id, limit=limit)
@@ -23,7 +23,7 @@ async def read_notices(
 @router.get("/{notice_id}")
 async def read_notice(
     notice_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: NoticeService = Depends(get_notice_service),
 ):
     notice = await service.get_notice(notice_id)
@@ -35,7 +35,7 @@ async def read_notice(
 @router.post("/{notice_id}/confirm")
 async def confirm_notice(
     notice_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: NoticeService = Depends(get_notice_service),
 ):
     return await service.confirm_notice(notice_id, current_user.id)
@@ -43,10 +43,15 @@ async def confirm_notice(
 
 # ── Admin CRUD endpoints ────────────────────────────
 
-@router.post("/", response_model=dict, status_code=201)
+@router.post(
+    "/",
+    response_model=dict,
+    status_code=201,
+    dependencies=[Depends(require_role([UserRole.ADMIN, UserRole.MANAGER]))],
+)
 async def create_notice(
     body: NoticeCreate,
-    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER])),
+    current_user: User = Depends(get_current_user),
     service: NoticeService = Depends(get_notice_service),
 ):
     return await service.create_notice(
@@ -62,7 +67,7 @@ async def create_notice(
 async def update_notice(
     notice_id: str,
     body: NoticeCreate,
-    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER])),
+    current_user: Principal = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER])),
     service: NoticeService = Depends(get_notice_service),
 ):
     data = body.model_dump(exclude_unset=True)
@@ -72,7 +77,7 @@ async def update_notice(
 @router.delete("/{notice_id}")
 async def delete_notice(
     notice_id: str,
-    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER])),
+    current_user: Principal = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER])),
     service: NoticeService = Depends(get_notice_service),
 ):
     await service.delete_notice(notice_id)
@@ -1,26 +1,48 @@
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+import uuid
+from fastapi import APIRouter, Depends, Header, Request
+from fastapi.responses import StreamingResponse
 from typing import Optional
 from app.schemas.notification import NotificationListResponse
 from app.services.notification_service import NotificationService
-from app.core.dependencies import get_notification_service
-from app.core.security import get_current_user
-from app.schemas.user import User
+from app.notifications.hub import NotificationHub
+from app.core.config import settings
+from app.core.pagination import PageParams
+from app.core.dependencies import get_notification_service, get_notification_hub
+from app.core.security import get_current_principal
+from app.schemas.user import Principal
 
 router = APIRouter()
 
 
+def _resume_id(last_event_id: Optional[str]) -> Optional[str]:
+    """The Last-Event-ID as a notification id, or None (stream from now) if it is not a UUID."""
+    try:
+        return str(uuid.UUID(last_event_id)) if last_event_id else None
+    except ValueError:
+        return None
+
+
+def _sse_event(notification: dict) -> str:
+    return f"id: {notification['id']}\nevent: notification\ndata: {json.dumps(notification)}\n\n"
+
+
 @router.get("/", response_model=NotificationListResponse)
 async def get_notifications(
-    current_user: User = Depends(get_current_user),
+    page: PageParams = Depends(),
+    current_user: Principal = Depends(get_current_principal),
     service: NotificationService = Depends(get_notification_service),
 ):
-    return await service.get_notifications(current_user.id, current_user.company_id)
+    return await service.get_notifications(
+        current_user.id, current_user.company_id, limit=page.limit, cursor=page.cursor
+    )
 
 
 @router.patch("/{notification_id}/read")
 async def mark_as_read(
     notification_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: NotificationService = Depends(get_notification_service),
 ):
     result = await service.mark_as_read(notification_id, current_user.id)
@@ -29,8 +51,62 @@ async def mark_as_read(
 
 @router.patch("/read-all")
 async def mark_all_as_read(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: NotificationService = Depends(get_notification_service),
 ):
     count = await service.mark_all_as_read(current_user.id, current_user.company_id)
     return {"message": f"{count} notifications marked as read.", "count": count}
+
+
+@router.get("/stream")
+async def stream_notifications(
+    request: Request,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    current_user: Principal = Depends(get_current_principal),
+    service: NotificationService = Depends(get_notification_service),
+    hub: NotificationHub = Depends(get_notification_hub),
+):
+    """Server-Sent Events stream of new notifications.
+
+    Reconnecting clients send Last-Event-ID and receive what they missed
+    before live events resume; an id that is not a UUID is ignored. A comment line is sent every
+    NOTIFICATION_STREAM_HEARTBEAT_SECONDS to keep proxies from closing the
+    connection.
+    """
+    # Subscribe before replaying so nothing created in between is lost.
+    queue = hub.subscribe(current_user.id)
+    resume_id = _resume_id(last_event_id)
+
+    async def events():
+        try:
+            yield "retry: 3000\n\n"
+            replayed = set()
+            if resume_id:
+                missed = await service.list_since(
+                    current_user.id, current_user.company_id, resume_id,
+                    limit=settings.NOTIFICATION_STREAM_REPLAY_LIMIT,
+                )
+                for n in missed:
+                    replayed.add(n.id)
+                    yield _sse_event(n.model_dump(mode="json"))
+
+            while not await request.is_disconnected():
+                try:
+                    notification = await asyncio.wait_for(
+                        queue.get(), timeout=settings.NOTIFICATION_STREAM_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                if notification is None:
+                    break  # cut off for lagging; the client resumes from its last id
+                if notification["id"] not in replayed:
+                    yield _sse_event(notification)
+        finally:
+            hub.unsubscribe(current_user.id, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
-from app.core.security import get_current_user
+from app.core.security import get_current_user, get_current_principal
 from app.core.dependencies import get_user_service
+from app.core.password import PasswordHasherBusy
 from app.services.user_service import UserService
-from app.schemas.user import User, UserUpdate
+from app.schemas.user import User, UserUpdate, Principal
 
 router = APIRouter()
 
@@ -25,7 +26,7 @@ async def get_my_profile(current_user: User = Depends(get_current_user)):
 @router.patch("/me/profile", response_model=User)
 async def update_my_profile(
     body: UserUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: UserService = Depends(get_user_service),
 ):
     update_data = body.model_dump(exclude_none=True)
@@ -37,7 +38,7 @@ async def update_my_profile(
 @router.post("/me/password")
 async def change_password(
     body: ChangePasswordRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     service: UserService = Depends(get_user_service),
 ):
     try:
@@ -46,6 +47,8 @@ async def change_password(
             current_password=body.current_password,
             new_password=body.new_password,
         )
+    except PasswordHasherBusy:
+        raise HTTPException(status_code=503, detail="Server is busy. Please try again.")
     except Exception as e:
         if "incorrect" in str(e).lower():
             raise HTTPException(status_code=400, detail="Current password is incorrect.")
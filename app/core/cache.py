@@ -0,0 +1,47 @@
+from typing import Any, Hashable, Optional
+
+from cachetools import TTLCache
+
+
+class StatsTTLCache:
+    """In-process LRU + TTL cache that counts hits and misses.
+
+    Entries expire after ``ttl`` seconds; when ``maxsize`` is reached the least
+    recently used entry is evicted. The cache is per process, so the TTL bounds
+    how long another worker's write can go unnoticed.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        value = self._cache.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._cache[key] = value
+
+    def invalidate(self, key: Hashable) -> None:
+        self._cache.pop(key, None)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._cache),
+            "maxsize": self._cache.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
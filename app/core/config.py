@@ -10,11 +10,34 @@ class Settings(BaseSettings):
     SUPABASE_URL: str = ""
     SUPABASE_KEY: str = ""
 
+    # Supabase HTTP connection pool (shared by the async PostgREST/storage client)
+    SUPABASE_HTTP2: bool = True
+    SUPABASE_POOL_MAX_CONNECTIONS: int = 100
+    SUPABASE_POOL_MAX_KEEPALIVE: int = 20
+    SUPABASE_POOL_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    SUPABASE_HTTP_TIMEOUT_SECONDS: float = 10.0
+
     # JWT
     JWT_SECRET_KEY: str = "change-me-in-production"
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Sign role/company_id/status/token version into access tokens so
+    # get_current_principal and require_role skip the users lookup.
+    JWT_STATELESS_ACCESS_TOKENS: bool = False
+    TOKEN_VERSION_CACHE_TTL_SECONDS: int = 30
+
+    # Password hashing (bcrypt runs in a bounded thread pool)
+    PASSWORD_HASH_ROUNDS: int = 0  # 0 = auto-tune to PASSWORD_HASH_TARGET_MS at startup
+    PASSWORD_HASH_TARGET_MS: float = 250.0
+    PASSWORD_HASH_MIN_ROUNDS: int = 10
+    PASSWORD_HASH_MAX_ROUNDS: int = 14
+    PASSWORD_HASH_MAX_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # Authenticated-user cache (get_current_user)
+    USER_CACHE_MAXSIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: int = 60
 
     # Google SMTP
     SMTP_HOST: str = "smtp.gmail.com"
@@ -23,10 +46,69 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = ""
     SMTP_FROM_EMAIL: str = ""
     SMTP_FROM_NAME: str = "TaskManager"
+    # Pooled SMTP sessions (app/core/smtp.py)
+    SMTP_POOL_SIZE: int = 4
+    SMTP_TIMEOUT_SECONDS: float = 10.0  # per SMTP command, so per message
+    SMTP_HEALTHCHECK_AFTER_SECONDS: float = 15.0  # NOOP idle sessions older than this
+    SMTP_MAX_IDLE_SECONDS: float = 60.0
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100
+
+    # Notification outbox: notify() persists a dispatch job and OutboxWorker
+    # delivers it. Run the worker in the API process or via
+    # `python -m app.jobs.notification_outbox`.
+    NOTIFICATION_OUTBOX_ENABLED: bool = True
+    NOTIFICATION_OUTBOX_IN_PROCESS_WORKER: bool = True
+    NOTIFICATION_OUTBOX_BATCH_SIZE: int = 50
+    NOTIFICATION_OUTBOX_CONCURRENCY: int = 10
+    NOTIFICATION_OUTBOX_LEASE_SECONDS: int = 60
+    NOTIFICATION_OUTBOX_MAX_ATTEMPTS: int = 5
+    NOTIFICATION_OUTBOX_BASE_BACKOFF_SECONDS: float = 5.0
+    NOTIFICATION_OUTBOX_MAX_BACKOFF_SECONDS: float = 900.0
+    NOTIFICATION_OUTBOX_POLL_INTERVAL_SECONDS: float = 1.0
+    # Unread-notification counter cache
+    UNREAD_COUNT_CACHE_MAXSIZE: int = 10000
+    UNREAD_COUNT_CACHE_TTL_SECONDS: int = 30
+    # GET /notifications/stream (SSE)
+    NOTIFICATION_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    NOTIFICATION_STREAM_QUEUE_SIZE: int = 100
+    NOTIFICATION_STREAM_REPLAY_LIMIT: int = 100
+    # Per-channel defaults for NotificationDispatcher
+    NOTIFICATION_CHANNEL_TIMEOUT_SECONDS: float = 10.0
+    NOTIFICATION_CHANNEL_MAX_CONCURRENCY: int = 20
+    # Email deadline: a fresh session is connect + STARTTLS + login + send,
+    # each up to SMTP_TIMEOUT_SECONDS, so keep this well above 4x that.
+    NOTIFICATION_EMAIL_TIMEOUT_SECONDS: float = 60.0
 
     # Email verification (6-digit OTP)
     EMAIL_VERIFY_CODE_EXPIRE_MINUTES: int = 10
     APP_BASE_URL: str = "http://localhost:8000"
+    # How often a cached email template checks its file for changes
+    EMAIL_TEMPLATE_RELOAD_CHECK_SECONDS: float = 5.0
+
+    # GET /dashboard/summary
+    DASHBOARD_URGENT_ALERT_LIMIT: int = 10
+    # Writes in this process invalidate cached summaries; the TTL bounds
+    # staleness from writes made by other processes.
+    DASHBOARD_CACHE_MAXSIZE: int = 10000
+    DASHBOARD_CACHE_TTL_SECONDS: int = 60
+
+    # Checklist compliance reads checklist_compliance_rollups (migration 011)
+    # instead of scanning daily_checklists.
+    COMPLIANCE_ROLLUPS_ENABLED: bool = True
+
+    # Bulk daily checklist generation (POST /daily-checklists/generate-bulk)
+    CHECKLIST_BULK_MAX_DAYS: int = 31
+    # Compiled checklist template snapshots kept per process
+    TEMPLATE_SNAPSHOT_CACHE_MAXSIZE: int = 1000
+
+    # Recurring assignments are materialized this many days ahead, in
+    # batches of series (python -m app.jobs.materialize_recurring_assignments)
+    ASSIGNMENT_RECURRENCE_HORIZON_DAYS: int = 14
+    ASSIGNMENT_RECURRENCE_BATCH_SIZE: int = 500
+
+    # Cursor pagination (notifications, comments, feedbacks)
+    PAGE_SIZE_DEFAULT: int = 50
+    PAGE_SIZE_MAX: int = 200
 
     # CORS
     CORS_ORIGINS: str = "*"  # comma-separated, e.g. "http://localhost:3000,https://myapp.com"
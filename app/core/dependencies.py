@@ -2,8 +2,28 @@
 Dependency Injection container.
 All Repository/Service instances are managed here.
 To switch from Supabase to another implementation, modify this file only.
+
+Providers are registered with an explicit scope:
+  - Scope.SINGLETON (@singleton): built once per process (eagerly in the
+                                  FastAPI lifespan) and shared by every request.
+  - Scope.REQUEST:                built again on every resolve, for objects
+                                  that hold per-request state.
+The get_* functions keep their names, so they remain usable with Depends()
+and app.dependency_overrides. They are coroutine functions, so FastAPI
+resolves them on the event loop rather than in its threadpool; async code
+awaits them, and sync code (other factories) calls get_*.sync().
 """
-from app.core.supabase import supabase
+import functools
+import inspect
+import logging
+import threading
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from app.core.supabase import async_supabase
+from app.core.config import settings
+from app.core.cache import StatsTTLCache
+from app.core.token_version import TokenVersionStore
 from app.repositories.auth import CustomAuthRepository, IAuthRepository
 from app.repositories.user import SupabaseUserRepository
 from app.repositories.organization import OrganizationRepository, IOrganizationRepository
@@ -17,11 +37,16 @@ from app.repositories.feedback_notice import (
 )
 from app.repositories.attendance import AttendanceRepository, IAttendanceRepository
 from app.repositories.opinion import OpinionRepository, IOpinionRepository
-from app.repositories.notification import NotificationRepository, INotificationRepository
+from app.repositories.notification import (
+    NotificationRepository, INotificationRepository,
+    NotificationOutboxRepository, INotificationOutboxRepository,
+)
 from app.storage.supabase import SupabaseStorageProvider
 from app.storage.base import IStorageProvider
 from app.notifications.channel import EmailNotificationChannel
 from app.notifications.dispatcher import NotificationDispatcher
+from app.notifications.outbox import OutboxWorker
+from app.notifications.hub import NotificationHub
 
 from app.services.auth_service import AuthService
 from app.services.assignment_service import AssignmentService
@@ -35,113 +60,309 @@ from app.services.opinion_service import OpinionService
 from app.services.notification_service import NotificationService
 from app.services.file_service import FileService
 from app.services.user_service import UserService
+from app.services.template_snapshots import TemplateSnapshotCache
+
+
+logger = logging.getLogger(__name__)
+
+
+class Scope(str, Enum):
+    SINGLETON = "singleton"
+    REQUEST = "request"
+
+
+class Container:
+    """Application-scoped provider registry."""
+
+    def __init__(self):
+        self._providers: Dict[str, Tuple[Callable[[], Any], Scope]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, factory: Callable[[], Any], scope: Scope = Scope.SINGLETON) -> None:
+        self._providers[name] = (factory, scope)
+
+    def resolve(self, name: str) -> Any:
+        factory, scope = self._providers[name]
+        if scope is Scope.REQUEST:
+            return factory()
+        instance = self._instances.get(name)
+        if instance is None:
+            # Jobs may resolve from worker threads; build each singleton once.
+            with self._lock:
+                instance = self._instances.get(name)
+                if instance is None:
+                    instance = factory()
+                    self._instances[name] = instance
+        return instance
+
+    def provider(self, scope: Scope) -> Callable[[Callable[[], Any]], Callable[[], Awaitable[Any]]]:
+        """Decorator: register a factory and return an async resolver with the same name.
+
+        The resolver also gets a ``sync`` attribute for resolving from sync code.
+        """
+        def decorator(factory: Callable[[], Any]) -> Callable[[], Awaitable[Any]]:
+            name = factory.__name__
+            self.register(name, factory, scope)
+
+            @functools.wraps(factory)
+            async def resolver():
+                return self.resolve(name)
+            resolver.sync = functools.partial(self.resolve, name)
+            return resolver
+        return decorator
+
+    async def startup(self) -> None:
+        """Build every singleton up front so the first request pays nothing."""
+        for name, (_, scope) in self._providers.items():
+            if scope is Scope.SINGLETON:
+                self.resolve(name)
+
+    async def shutdown(self) -> None:
+        """Close singletons that own resources, then drop them."""
+        for name, instance in list(self._instances.items()):
+            close = getattr(instance, "aclose", None) or getattr(instance, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Failed to close {name}: {e}")
+        self._instances.clear()
+
+
+container = Container()
+singleton = container.provider(Scope.SINGLETON)
+
 
+# -- Caches --
 
-# -- Repository Instances --
+@singleton
+def get_user_cache() -> StatsTTLCache:
+    return StatsTTLCache(maxsize=settings.USER_CACHE_MAXSIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
 
+@singleton
+def get_unread_count_cache() -> StatsTTLCache:
+    return StatsTTLCache(
+        maxsize=settings.UNREAD_COUNT_CACHE_MAXSIZE,
+        ttl=settings.UNREAD_COUNT_CACHE_TTL_SECONDS,
+    )
+
+@singleton
+def get_dashboard_summary_cache() -> StatsTTLCache:
+    """Per-(user_id, company_id) assignment summary and urgent alerts."""
+    return StatsTTLCache(
+        maxsize=settings.DASHBOARD_CACHE_MAXSIZE,
+        ttl=settings.DASHBOARD_CACHE_TTL_SECONDS,
+    )
+
+@singleton
+def get_dashboard_notice_cache() -> StatsTTLCache:
+    """Per-company recent notices shown on the dashboard."""
+    return StatsTTLCache(
+        maxsize=settings.DASHBOARD_CACHE_MAXSIZE,
+        ttl=settings.DASHBOARD_CACHE_TTL_SECONDS,
+    )
+
+@singleton
+def get_template_snapshot_cache() -> TemplateSnapshotCache:
+    return TemplateSnapshotCache(maxsize=settings.TEMPLATE_SNAPSHOT_CACHE_MAXSIZE)
+
+@singleton
+def get_token_version_store() -> TokenVersionStore:
+    return TokenVersionStore(
+        auth_repo=get_auth_repo.sync(),
+        cache=StatsTTLCache(
+            maxsize=settings.USER_CACHE_MAXSIZE,
+            ttl=settings.TOKEN_VERSION_CACHE_TTL_SECONDS,
+        ),
+    )
+
+
+# -- Repository Providers --
+
+@singleton
 def get_auth_repo() -> IAuthRepository:
-    return CustomAuthRepository(supabase)
+    return CustomAuthRepository(async_supabase)
 
+@singleton
 def get_user_repo() -> SupabaseUserRepository:
     return SupabaseUserRepository()
 
+@singleton
 def get_org_repo() -> IOrganizationRepository:
     return OrganizationRepository()
 
+@singleton
 def get_assignment_repo() -> IAssignmentRepository:
     return AssignmentRepository()
 
+@singleton
 def get_daily_checklist_repo() -> IDailyChecklistRepository:
     return DailyChecklistRepository()
 
+@singleton
 def get_template_repo() -> IChecklistTemplateRepository:
     return ChecklistTemplateRepository()
 
+@singleton
 def get_feedback_repo() -> IFeedbackRepository:
     return FeedbackRepository()
 
+@singleton
 def get_notice_repo() -> INoticeRepository:
     return NoticeRepository()
 
+@singleton
 def get_comment_repo() -> ICommentRepository:
     return CommentRepository()
 
+@singleton
 def get_attendance_repo() -> IAttendanceRepository:
     return AttendanceRepository()
 
+@singleton
 def get_opinion_repo() -> IOpinionRepository:
     return OpinionRepository()
 
+@singleton
 def get_notification_repo() -> INotificationRepository:
     return NotificationRepository()
 
+@singleton
+def get_notification_outbox_repo() -> INotificationOutboxRepository:
+    return NotificationOutboxRepository()
+
+@singleton
 def get_storage_provider() -> IStorageProvider:
     return SupabaseStorageProvider()
 
 
-# -- Service Factories --
+# -- Service Providers --
 
+@singleton
 def get_auth_service() -> AuthService:
     return AuthService(
-        auth_repo=get_auth_repo(),
-        org_repo=get_org_repo(),
+        auth_repo=get_auth_repo.sync(),
+        org_repo=get_org_repo.sync(),
     )
 
+@singleton
 def get_assignment_service() -> AssignmentService:
-    return AssignmentService(assignment_repo=get_assignment_repo())
+    return AssignmentService(
+        assignment_repo=get_assignment_repo.sync(),
+        dashboard_cache=get_dashboard_summary_cache.sync(),
+    )
 
+@singleton
 def get_daily_checklist_service() -> DailyChecklistService:
     return DailyChecklistService(
-        checklist_repo=get_daily_checklist_repo(),
-        template_repo=get_template_repo(),
+        checklist_repo=get_daily_checklist_repo.sync(),
+        template_repo=get_template_repo.sync(),
+        org_repo=get_org_repo.sync(),
+        template_snapshots=get_template_snapshot_cache.sync(),
     )
 
+@singleton
 def get_comment_service() -> CommentService:
     return CommentService(
-        comment_repo=get_comment_repo(),
-        assignment_repo=get_assignment_repo(),
-        notification_service=get_notification_service(),
+        comment_repo=get_comment_repo.sync(),
+        assignment_repo=get_assignment_repo.sync(),
+        notification_service=get_notification_service.sync(),
     )
 
+@singleton
 def get_admin_service() -> AdminService:
     return AdminService(
-        user_repo=get_user_repo(),
-        org_repo=get_org_repo(),
-        template_repo=get_template_repo(),
-        assignment_repo=get_assignment_repo(),
-        feedback_repo=get_feedback_repo(),
-        notice_repo=get_notice_repo(),
-        notification_service=get_notification_service(),
+        user_repo=get_user_repo.sync(),
+        org_repo=get_org_repo.sync(),
+        template_repo=get_template_repo.sync(),
+        assignment_repo=get_assignment_repo.sync(),
+        feedback_repo=get_feedback_repo.sync(),
+        notice_repo=get_notice_repo.sync(),
+        notification_service=get_notification_service.sync(),
+        user_cache=get_user_cache.sync(),
+        token_versions=get_token_version_store.sync() if settings.JWT_STATELESS_ACCESS_TOKENS else None,
+        checklist_repo=get_daily_checklist_repo.sync(),
+        compliance_rollups=settings.COMPLIANCE_ROLLUPS_ENABLED,
+        template_snapshots=get_template_snapshot_cache.sync(),
     )
 
+@singleton
 def get_notice_service() -> NoticeService:
-    return NoticeService(notice_repo=get_notice_repo())
+    return NoticeService(
+        notice_repo=get_notice_repo.sync(),
+        dashboard_notice_cache=get_dashboard_notice_cache.sync(),
+    )
 
+@singleton
 def get_dashboard_service() -> DashboardService:
     return DashboardService(
-        assignment_repo=get_assignment_repo(),
-        notice_repo=get_notice_repo(),
-        checklist_repo=get_daily_checklist_repo(),
+        assignment_repo=get_assignment_repo.sync(),
+        notice_repo=get_notice_repo.sync(),
+        checklist_repo=get_daily_checklist_repo.sync(),
+        urgent_alert_limit=settings.DASHBOARD_URGENT_ALERT_LIMIT,
+        summary_cache=get_dashboard_summary_cache.sync(),
+        notice_cache=get_dashboard_notice_cache.sync(),
     )
 
+@singleton
 def get_attendance_service() -> AttendanceService:
-    return AttendanceService(attendance_repo=get_attendance_repo())
+    return AttendanceService(attendance_repo=get_attendance_repo.sync())
 
+@singleton
 def get_opinion_service() -> OpinionService:
-    return OpinionService(opinion_repo=get_opinion_repo())
+    return OpinionService(opinion_repo=get_opinion_repo.sync())
 
+@singleton
 def get_notification_dispatcher() -> NotificationDispatcher:
-    return NotificationDispatcher(channels=[EmailNotificationChannel()])
+    return NotificationDispatcher(
+        channels=[EmailNotificationChannel(timeout=settings.NOTIFICATION_EMAIL_TIMEOUT_SECONDS)],
+        timeout=settings.NOTIFICATION_CHANNEL_TIMEOUT_SECONDS,
+        max_concurrency=settings.NOTIFICATION_CHANNEL_MAX_CONCURRENCY,
+    )
 
+@singleton
+def get_notification_hub() -> NotificationHub:
+    return NotificationHub(queue_size=settings.NOTIFICATION_STREAM_QUEUE_SIZE)
+
+@singleton
 def get_notification_service() -> NotificationService:
     return NotificationService(
-        notification_repo=get_notification_repo(),
-        auth_repo=get_auth_repo(),
-        dispatcher=get_notification_dispatcher(),
+        notification_repo=get_notification_repo.sync(),
+        auth_repo=get_auth_repo.sync(),
+        dispatcher=get_notification_dispatcher.sync(),
+        use_outbox=settings.NOTIFICATION_OUTBOX_ENABLED,
+        hub=get_notification_hub.sync(),
+        unread_cache=get_unread_count_cache.sync(),
+    )
+
+@singleton
+def get_outbox_worker() -> OutboxWorker:
+    return OutboxWorker(
+        outbox_repo=get_notification_outbox_repo.sync(),
+        auth_repo=get_auth_repo.sync(),
+        dispatcher=get_notification_dispatcher.sync(),
+        batch_size=settings.NOTIFICATION_OUTBOX_BATCH_SIZE,
+        concurrency=settings.NOTIFICATION_OUTBOX_CONCURRENCY,
+        lease_seconds=settings.NOTIFICATION_OUTBOX_LEASE_SECONDS,
+        max_attempts=settings.NOTIFICATION_OUTBOX_MAX_ATTEMPTS,
+        base_backoff=settings.NOTIFICATION_OUTBOX_BASE_BACKOFF_SECONDS,
+        max_backoff=settings.NOTIFICATION_OUTBOX_MAX_BACKOFF_SECONDS,
+        poll_interval=settings.NOTIFICATION_OUTBOX_POLL_INTERVAL_SECONDS,
     )
 
+@singleton
 def get_file_service() -> FileService:
-    return FileService(storage_provider=get_storage_provider())
+    return FileService(storage_provider=get_storage_provider.sync())
 
+@singleton
 def get_user_service() -> UserService:
-    return UserService(user_repo=get_user_repo(), auth_repo=get_auth_repo())
+    return UserService(
+        user_repo=get_user_repo.sync(),
+        auth_repo=get_auth_repo.sync(),
+        user_cache=get_user_cache.sync(),
+        token_versions=get_token_version_store.sync() if settings.JWT_STATELESS_ACCESS_TOKENS else None,
+    )
@@ -1,40 +1,82 @@
-import smtplib
 from pathlib import Path
+from typing import List, Optional
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from app.core.config import settings
+from app.core.smtp import SMTPConnectionPool
+from app.core.email_templates import TemplateCache
 
 TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
 
+templates = TemplateCache(TEMPLATE_DIR, check_interval=settings.EMAIL_TEMPLATE_RELOAD_CHECK_SECONDS)
 
-def _load_template(name: str, **kwargs) -> str:
-    """Load an HTML template file and substitute {{variable}} placeholders."""
-    path = TEMPLATE_DIR / name
-    html = path.read_text(encoding="utf-8")
-    for key, value in kwargs.items():
-        html = html.replace(f"{{{{{key}}}}}", str(value))
-    return html
+_smtp_pool: Optional[SMTPConnectionPool] = None
 
 
-async def send_email(to: str, subject: str, html_body: str) -> bool:
-    """Send an email via Google SMTP. Returns True on success."""
+def _load_template(name: str, /, **kwargs) -> str:
+    """Render a cached, precompiled HTML template; values are HTML-escaped."""
+    return templates.render(name, **kwargs)
+
+
+def get_smtp_pool() -> SMTPConnectionPool:
+    """Shared SMTP session pool, created on first use."""
+    global _smtp_pool
     if not settings.SMTP_USER or not settings.SMTP_PASSWORD:
         raise RuntimeError("SMTP credentials are not configured.")
+    if _smtp_pool is None:
+        _smtp_pool = SMTPConnectionPool(
+            host=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            user=settings.SMTP_USER,
+            password=settings.SMTP_PASSWORD,
+            size=settings.SMTP_POOL_SIZE,
+            timeout=settings.SMTP_TIMEOUT_SECONDS,
+            healthcheck_after=settings.SMTP_HEALTHCHECK_AFTER_SECONDS,
+            max_idle=settings.SMTP_MAX_IDLE_SECONDS,
+            max_messages=settings.SMTP_MAX_MESSAGES_PER_CONNECTION,
+        )
+    return _smtp_pool
+
+
+async def close_smtp_pool() -> None:
+    global _smtp_pool
+    if _smtp_pool is not None:
+        await _smtp_pool.aclose()
+        _smtp_pool = None
 
+
+def _build_message(to: str, subject: str, html_body: str) -> MIMEMultipart:
     msg = MIMEMultipart("alternative")
     msg["From"] = f"{settings.SMTP_FROM_NAME} <{settings.SMTP_FROM_EMAIL or settings.SMTP_USER}>"
     msg["To"] = to
     msg["Subject"] = subject
     msg.attach(MIMEText(html_body, "html"))
+    return msg
 
-    with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-        server.starttls()
-        server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-        server.sendmail(msg["From"], to, msg.as_string())
 
+async def send_email(to: str, subject: str, html_body: str) -> bool:
+    """Send an email via Google SMTP. Returns True on success."""
+    pool = get_smtp_pool()
+    msg = _build_message(to, subject, html_body)
+    await pool.send(msg["From"], to, msg.as_string())
     return True
 
 
+async def send_emails(messages: List[dict]) -> List[bool]:
+    """Send several emails over one pooled session.
+
+    Each message is a dict with ``to``, ``subject`` and ``html_body``.
+    Returns one success flag per message, in order.
+    """
+    pool = get_smtp_pool()
+    envelopes = []
+    for m in messages:
+        msg = _build_message(m["to"], m["subject"], m["html_body"])
+        envelopes.append((msg["From"], m["to"], msg.as_string()))
+    errors = await pool.send_many(envelopes)
+    return [error is None for error in errors]
+
+
 async def send_verification_code(to: str, code: str) -> bool:
     """Send a 6-digit verification code email."""
     html = _load_template(
@@ -0,0 +1,76 @@
+import html
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+
+class CompiledTemplate:
+    """An HTML template split once into literal chunks and placeholder names.
+
+    Rendering is a single join over the pre-split parts; every substituted
+    value is HTML-escaped. Placeholders without a value are left as written.
+    """
+
+    def __init__(self, source: str):
+        # parts alternates literal, name, literal, name, ..., literal
+        self._parts: List[str] = _PLACEHOLDER.split(source)
+
+    def render(self, **kwargs) -> str:
+        parts = self._parts
+        out = [parts[0]]
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            value = kwargs.get(name)
+            out.append("{{" + name + "}}" if value is None else html.escape(str(value)))
+            out.append(parts[i + 1])
+        return "".join(out)
+
+
+class TemplateCache:
+    """Compiled templates keyed by file name, recompiled when the file's mtime changes.
+
+    The mtime is checked at most once every ``check_interval`` seconds per
+    template, so steady-state rendering does no filesystem access.
+    """
+
+    def __init__(self, directory: Path, check_interval: float = 5.0):
+        self.directory = directory
+        self.check_interval = check_interval
+        # name -> (template, mtime, last_checked)
+        self._entries: Dict[str, Tuple[CompiledTemplate, float, float]] = {}
+        self._lock = threading.Lock()
+
+    def _compile(self, name: str) -> CompiledTemplate:
+        path = self.directory / name
+        mtime = path.stat().st_mtime
+        template = CompiledTemplate(path.read_text(encoding="utf-8"))
+        with self._lock:
+            self._entries[name] = (template, mtime, time.monotonic())
+        return template
+
+    def get(self, name: str) -> CompiledTemplate:
+        entry: Optional[Tuple[CompiledTemplate, float, float]] = self._entries.get(name)
+        if entry is None:
+            return self._compile(name)
+
+        template, mtime, checked = entry
+        now = time.monotonic()
+        if now - checked < self.check_interval:
+            return template
+        if (self.directory / name).stat().st_mtime != mtime:
+            return self._compile(name)
+        with self._lock:
+            self._entries[name] = (template, mtime, now)
+        return template
+
+    def preload(self) -> None:
+        """Compile every *.html template up front (called at startup)."""
+        for path in self.directory.glob("*.html"):
+            self._compile(path.name)
+
+    def render(self, name: str, /, **kwargs) -> str:
+        return self.get(name).render(**kwargs)
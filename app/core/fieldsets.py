@@ -0,0 +1,70 @@
+"""Sparse fieldsets: `fields=` / `include=` query parameters compiled to a PostgREST select.
+
+Each resource declares the columns clients may ask for and the child
+embeds they may opt into. ``?fields=id,title,status&include=assignees``
+becomes ``id,created_at,title,status,assignees:assignment_assignees(*)``;
+columns the endpoint relies on (e.g. the pagination keyset) are always
+selected.
+"""
+from typing import Iterable, Mapping, Optional, Sequence
+
+from fastapi import HTTPException, Query
+
+
+class InvalidFieldSet(ValueError):
+    pass
+
+
+def _split(value: Optional[str]) -> list:
+    if not value:
+        return []
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+class FieldSet:
+    """Selectable columns and embeds of one resource.
+
+    Instances are FastAPI dependencies returning the select string, so an
+    endpoint declares ``select: str = Depends(ASSIGNMENT_LIST_FIELDS)``.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[str],
+        embeds: Mapping[str, str],
+        required: Sequence[str] = ("id",),
+        default_include: Sequence[str] = (),
+    ):
+        self.columns = tuple(columns)
+        self.embeds = dict(embeds)
+        self.required = tuple(required)
+        self.default_include = tuple(default_include)
+
+    def select(self, fields: Optional[Iterable[str]] = None, include: Optional[Iterable[str]] = None) -> str:
+        fields = list(fields or ())
+        include = self.default_include if include is None else tuple(include)
+
+        unknown = [f for f in fields if f not in self.columns]
+        if unknown:
+            raise InvalidFieldSet(f"Unknown fields: {', '.join(unknown)}.")
+        unknown = [i for i in include if i not in self.embeds]
+        if unknown:
+            raise InvalidFieldSet(f"Unknown include: {', '.join(unknown)}.")
+
+        if fields:
+            parts = list(self.required) + [f for f in fields if f not in self.required]
+            parts = list(dict.fromkeys(parts))
+        else:
+            parts = ["*"]
+        parts += [self.embeds[name] for name in dict.fromkeys(include)]
+        return ",".join(parts)
+
+    def __call__(
+        self,
+        fields: Optional[str] = Query(None, description="Comma-separated columns to return."),
+        include: Optional[str] = Query(None, description="Comma-separated child collections to embed."),
+    ) -> str:
+        try:
+            return self.select(_split(fields), None if include is None else _split(include))
+        except InvalidFieldSet as e:
+            raise HTTPException(status_code=400, detail=str(e))
@@ -17,6 +17,16 @@ def create_access_token(user_id: str, extra: Optional[dict] = None) -> str:
     return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
+def build_access_claims(user: dict) -> dict:
+    """Principal claims signed into stateless access tokens."""
+    return {
+        "role": user.get("role"),
+        "company_id": user.get("company_id"),
+        "status": user.get("status"),
+        "ver": user.get("token_version", 0),
+    }
+
+
 def create_refresh_token(user_id: str) -> str:
     now = datetime.now(timezone.utc)
     payload = {
@@ -31,5 +41,3 @@ def create_refresh_token(user_id: str) -> str:
 def decode_token(token: str) -> dict:
     """Decode and verify a JWT token. Raises jwt.PyJWTError on failure."""
     return jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-
-
@@ -0,0 +1,79 @@
+"""Keyset (cursor) pagination on (created_at, id).
+
+Cursors are opaque to clients: base64url-encoded JSON of the last row's
+created_at and id. Each page filters on the keyset instead of using an
+offset, so deep pages cost the same as the first one.
+"""
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException, Query
+
+from app.core.config import settings
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(row: dict) -> str:
+    raw = json.dumps([str(row["created_at"]), str(row["id"])], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """The (created_at, id) keyset of a cursor, re-serialized from parsed values.
+
+    Cursors come from clients and end up in a PostgREST filter string, so
+    anything that is not a timestamp and a UUID is rejected.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at).isoformat(), str(uuid.UUID(row_id))
+    except Exception:
+        raise InvalidCursor("Invalid cursor.")
+
+
+def paginate(query, cursor: Optional[str], limit: int, desc: bool = True):
+    """Apply keyset filter, (created_at, id) ordering and a limit+1 fetch to a PostgREST query."""
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        op = "lt" if desc else "gt"
+        query = query.or_(
+            f'created_at.{op}."{created_at}",'
+            f'and(created_at.eq."{created_at}",id.{op}.{row_id})'
+        )
+    return (
+        query.order("created_at", desc=desc)
+        .order("id", desc=desc)
+        .limit(limit + 1)
+    )
+
+
+def split_page(rows: List[dict], limit: int) -> Tuple[List[dict], Optional[str]]:
+    """Trim a limit+1 fetch to one page and return the cursor for the next one."""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(page[-1])
+
+
+class PageParams:
+    """`limit` / `cursor` query parameters for paginated list endpoints."""
+
+    def __init__(
+        self,
+        limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+        cursor: Optional[str] = Query(None),
+    ):
+        if cursor:
+            try:
+                decode_cursor(cursor)
+            except InvalidCursor as e:
+                raise HTTPException(status_code=400, detail=str(e))
+        self.limit = limit
+        self.cursor = cursor
@@ -1,9 +1,132 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
 import bcrypt
 
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# bcrypt releases the GIL while hashing, so a thread pool gives real
+# parallelism without the pickling overhead of a process pool.
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_pending = 0
+_rounds = settings.PASSWORD_HASH_ROUNDS or 12
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many hash/verify jobs are already queued."""
+
+
+# -- Sync API (setup scripts, tests) --
 
 def hash_password(plain: str) -> str:
-    return bcrypt.hashpw(plain.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    return bcrypt.hashpw(plain.encode("utf-8"), bcrypt.gensalt(rounds=_rounds)).decode("utf-8")
 
 
 def verify_password(plain: str, hashed: str) -> bool:
     return bcrypt.checkpw(plain.encode("utf-8"), hashed.encode("utf-8"))
+
+
+def get_rounds() -> int:
+    return _rounds
+
+
+def needs_rehash(hashed: str) -> bool:
+    """True when the stored hash was made with a lower cost than the current one.
+
+    Auto-calibrated costs differ slightly between processes and startups;
+    only upgrading keeps workers from rehashing the same user back and forth
+    and a slow calibration sample from downgrading stronger hashes.
+    """
+    try:
+        return int(hashed.split("$")[2]) < _rounds
+    except (IndexError, ValueError):
+        return False
+
+
+# -- Async API (request path) --
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+                    thread_name_prefix="bcrypt",
+                )
+    return _executor
+
+
+async def _run(fn: Callable[..., T], *args) -> T:
+    global _pending
+    if _pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise PasswordHasherBusy("Password hashing queue is full.")
+    _pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), fn, *args)
+    finally:
+        _pending -= 1
+
+
+async def hash_password_async(plain: str) -> str:
+    return await _run(hash_password, plain)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await _run(verify_password, plain, hashed)
+
+
+# -- Cost calibration --
+
+def calibrate_rounds(target_ms: float, min_rounds: int, max_rounds: int) -> int:
+    """Highest cost whose hash time stays within target_ms (never below min_rounds).
+
+    Each extra round doubles the work, so one measurement at min_rounds is
+    enough to extrapolate the rest.
+    """
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds=min_rounds))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    rounds = min_rounds
+    while rounds < max_rounds and elapsed_ms * 2 <= target_ms:
+        elapsed_ms *= 2
+        rounds += 1
+    return rounds
+
+
+async def configure_password_hashing() -> int:
+    """Pick the bcrypt cost at startup. PASSWORD_HASH_ROUNDS pins it; 0 auto-tunes."""
+    global _rounds
+    if settings.PASSWORD_HASH_ROUNDS:
+        _rounds = settings.PASSWORD_HASH_ROUNDS
+    else:
+        loop = asyncio.get_running_loop()
+        _rounds = await loop.run_in_executor(
+            _get_executor(),
+            calibrate_rounds,
+            settings.PASSWORD_HASH_TARGET_MS,
+            settings.PASSWORD_HASH_MIN_ROUNDS,
+            settings.PASSWORD_HASH_MAX_ROUNDS,
+        )
+    logger.info(f"bcrypt cost set to {_rounds}")
+    return _rounds
+
+
+def shutdown_password_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
@@ -1,40 +1,84 @@
 from fastapi import HTTPException, Header, Depends
 from typing import Optional
+from app.core.config import settings
 from app.core.jwt import decode_token
-from app.core.dependencies import get_user_repo
-from app.schemas.user import User, UserRole
+from app.core.dependencies import get_user_repo, get_user_cache, get_token_version_store
+from app.schemas.user import User, UserRole, Principal
 import jwt as pyjwt
 
 
-async def get_current_user(authorization: Optional[str] = Header(None)) -> User:
+def _decode_access_token(authorization: Optional[str]) -> dict:
     if not authorization:
         raise HTTPException(status_code=401, detail="Authorization token is missing.")
 
     token = authorization.replace("Bearer ", "")
     try:
         payload = decode_token(token)
-        if payload.get("type") != "access":
-            raise HTTPException(status_code=401, detail="Invalid token type.")
-        user_id = payload["sub"]
-
-        user_repo = get_user_repo()
-        user = await user_repo.get_by_id(user_id)
-        if not user:
-            raise HTTPException(status_code=404, detail="User profile not found.")
-
-        return user
     except pyjwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired.")
     except pyjwt.PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid token.")
+    if payload.get("type") != "access":
+        raise HTTPException(status_code=401, detail="Invalid token type.")
+    return payload
+
+
+async def get_current_user(authorization: Optional[str] = Header(None)) -> User:
+    payload = _decode_access_token(authorization)
+    try:
+        user_id = payload["sub"]
+
+        user_cache = await get_user_cache()
+        user = user_cache.get(user_id)
+        if user is None:
+            user_repo = await get_user_repo()
+            user = await user_repo.get_by_id(user_id)
+            if not user:
+                raise HTTPException(status_code=404, detail="User profile not found.")
+            user_cache.set(user_id, user)
+
+        return user
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=401, detail=f"Authentication failed: {str(e)}")
 
 
+async def get_current_principal(authorization: Optional[str] = Header(None)) -> Principal:
+    """Resolve the caller's id, company, role and status.
+
+    With JWT_STATELESS_ACCESS_TOKENS enabled, tokens carrying principal claims
+    are trusted as-is once their version matches the user's current token
+    version, so no users row is read. Otherwise the principal is derived from
+    get_current_user.
+    """
+    if settings.JWT_STATELESS_ACCESS_TOKENS:
+        payload = _decode_access_token(authorization)
+        if "role" in payload and "ver" in payload:
+            try:
+                token_versions = await get_token_version_store()
+                current_version = await token_versions.get(payload["sub"])
+                if current_version is None:
+                    raise HTTPException(status_code=404, detail="User profile not found.")
+                if payload["ver"] != current_version:
+                    raise HTTPException(status_code=401, detail="Token has been revoked.")
+                return Principal(
+                    id=payload["sub"],
+                    company_id=payload["company_id"],
+                    role=payload["role"],
+                    status=payload["status"],
+                )
+            except HTTPException:
+                raise
+            except Exception as e:
+                raise HTTPException(status_code=401, detail=f"Authentication failed: {str(e)}")
+
+    user = await get_current_user(authorization)
+    return Principal(id=user.id, company_id=user.company_id, role=user.role, status=user.status)
+
+
 def require_role(roles: list[UserRole]):
-    async def role_checker(current_user: User = Depends(get_current_user)):
+    async def role_checker(current_user: Principal = Depends(get_current_principal)):
         if current_user.role not in roles:
             raise HTTPException(
                 status_code=403,
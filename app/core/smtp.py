@@ -0,0 +1,209 @@
+import asyncio
+import smtplib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+
+@dataclass
+class _Connection:
+    server: smtplib.SMTP
+    last_used: float = field(default_factory=time.monotonic)
+    sent: int = 0
+
+
+# (from_addr, to_addr, raw message)
+Envelope = Tuple[str, str, str]
+
+
+class SMTPConnectionPool:
+    """Persistent, health-checked SMTP sessions shared by all senders.
+
+    smtplib is blocking, so every network call runs on the pool's own
+    threads; at most ``size`` sessions are open and each is used by one
+    sender at a time. Idle sessions are NOOP-checked before reuse, recycled
+    after ``max_messages`` messages or ``max_idle`` seconds, and replaced
+    transparently when the server has dropped them.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        size: int = 4,
+        timeout: float = 10.0,
+        healthcheck_after: float = 15.0,
+        max_idle: float = 60.0,
+        max_messages: int = 100,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.size = size
+        self.timeout = timeout
+        self.healthcheck_after = healthcheck_after
+        self.max_idle = max_idle
+        self.max_messages = max_messages
+
+        self._idle: List[_Connection] = []
+        self._slots = asyncio.Semaphore(size)
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="smtp")
+        self._closed = False
+
+    # -- Blocking helpers (run on the pool threads) --
+
+    def _connect(self) -> _Connection:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            server.starttls()
+            server.login(self.user, self.password)
+        except BaseException:
+            server.close()
+            raise
+        return _Connection(server=server)
+
+    @staticmethod
+    def _envelope(server: smtplib.SMTP, from_addr: str, to_addr: str) -> None:
+        """MAIL FROM and RCPT TO; failures here are before the message was handed over."""
+        server.ehlo_or_helo_if_needed()
+        code, resp = server.mail(from_addr)
+        if code != 250:
+            server.rset()
+            raise smtplib.SMTPSenderRefused(code, resp, from_addr)
+        code, resp = server.rcpt(to_addr)
+        if code not in (250, 251):
+            server.rset()
+            raise smtplib.SMTPRecipientsRefused({to_addr: (code, resp)})
+
+    @staticmethod
+    def _quit(conn: _Connection) -> None:
+        try:
+            conn.server.quit()
+        except Exception:
+            conn.server.close()
+
+    @staticmethod
+    def _discard(conn: Optional[_Connection]) -> None:
+        if conn is not None:
+            conn.server.close()
+        return None
+
+    def _is_usable(self, conn: _Connection) -> bool:
+        now = time.monotonic()
+        if conn.sent >= self.max_messages or now - conn.last_used > self.max_idle:
+            return False
+        if now - conn.last_used > self.healthcheck_after:
+            try:
+                return conn.server.noop()[0] == 250
+            except OSError:  # includes SMTPException
+                return False
+        return True
+
+    def _send_batch(
+        self, conn: Optional[_Connection], envelopes: List[Envelope]
+    ) -> Tuple[Optional[_Connection], List[Optional[Exception]]]:
+        """Send envelopes over one session; returns the session (if still good) and per-message errors.
+
+        A message whose session fails before DATA is retried once on a new
+        session. A failure once DATA has started is not retried here, since
+        the server may already have accepted the message; it is reported as
+        an error, so callers that retry failures deliver at least once.
+        """
+        if conn is not None and not self._is_usable(conn):
+            self._quit(conn)
+            conn = None
+
+        errors: List[Optional[Exception]] = []
+        for from_addr, to_addr, raw in envelopes:
+            error: Optional[Exception] = None
+            for _ in range(2):
+                data_started = False
+                try:
+                    if conn is None:
+                        conn = self._connect()
+                    self._envelope(conn.server, from_addr, to_addr)
+                    data_started = True
+                    code, resp = conn.server.data(raw)
+                    if code != 250:
+                        conn.server.rset()
+                        raise smtplib.SMTPDataError(code, resp)
+                    conn.sent += 1
+                    conn.last_used = time.monotonic()
+                    error = None
+                    break
+                except smtplib.SMTPServerDisconnected as e:
+                    # Session dropped: reconnect and retry once unless the message may be out.
+                    conn = self._discard(conn)
+                    error = e
+                    if data_started:
+                        break
+                except smtplib.SMTPException as e:
+                    # Rejected by the server; the session itself is still fine.
+                    error = e
+                    break
+                except OSError as e:
+                    # Socket error or per-command timeout.
+                    conn = self._discard(conn)
+                    error = e
+                    if data_started:
+                        break
+            errors.append(error)
+        return conn, errors
+
+    # -- Async API --
+
+    async def send_many(self, envelopes: List[Envelope]) -> List[Optional[Exception]]:
+        """Send several messages over a single session. Returns one error (or None) per message.
+
+        The batch runs to completion on its thread even if the caller is
+        cancelled (e.g. by a dispatcher deadline); the session and the slot
+        are then handed back by ``_finish_batch`` when the thread is done.
+        """
+        if self._closed:
+            raise RuntimeError("SMTP pool is closed.")
+        if not envelopes:
+            return []
+
+        await self._slots.acquire()
+        try:
+            conn = self._idle.pop() if self._idle else None
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, self._send_batch, conn, envelopes)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(self._finish_batch)
+        _, errors = await asyncio.shield(future)
+        return errors
+
+    def _finish_batch(self, future: "asyncio.Future") -> None:
+        self._slots.release()
+        if future.cancelled() or future.exception() is not None:
+            return
+        conn, _ = future.result()
+        if conn is None:
+            return
+        if not self._closed:
+            self._idle.append(conn)
+            return
+        try:
+            self._executor.submit(self._quit, conn)
+        except RuntimeError:  # executor already shut down
+            conn.server.close()
+
+    async def send(self, from_addr: str, to_addr: str, raw: str) -> None:
+        error = (await self.send_many([(from_addr, to_addr, raw)]))[0]
+        if error is not None:
+            raise error
+
+    async def aclose(self) -> None:
+        self._closed = True
+        idle, self._idle = self._idle, []
+        loop = asyncio.get_running_loop()
+        for conn in idle:
+            await loop.run_in_executor(self._executor, self._quit, conn)
+        self._executor.shutdown(wait=False)
@@ -1,4 +1,5 @@
-from supabase import create_client, Client
+import httpx
+from supabase import create_client, Client, AsyncClient, AsyncClientOptions
 from app.core.config import settings
 
 def get_supabase() -> Client:
@@ -7,4 +8,37 @@ def get_supabase() -> Client:
         # Proceed with initialization even without credentials.
     return create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
 
+
+def get_async_supabase() -> AsyncClient:
+    """Async client sharing one pooled HTTP/2 connection pool.
+
+    PostgREST and storage requests from every repository go through the same
+    httpx.AsyncClient, so connections are reused instead of opened per call.
+    """
+    http_client = httpx.AsyncClient(
+        http2=settings.SUPABASE_HTTP2,
+        limits=httpx.Limits(
+            max_connections=settings.SUPABASE_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SUPABASE_POOL_MAX_KEEPALIVE,
+            keepalive_expiry=settings.SUPABASE_POOL_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        timeout=httpx.Timeout(settings.SUPABASE_HTTP_TIMEOUT_SECONDS),
+        follow_redirects=True,
+    )
+    return AsyncClient(
+        settings.SUPABASE_URL,
+        settings.SUPABASE_KEY,
+        options=AsyncClientOptions(httpx_client=http_client),
+    )
+
+
+async def close_async_supabase() -> None:
+    """Close the shared HTTP connection pool (called on app shutdown)."""
+    await async_supabase.options.httpx_client.aclose()
+
+
+# Sync client — only for sync (threadpool) endpoints such as /setup/init.
 supabase: Client = get_supabase()
+
+# Async client — used by all repositories and storage providers.
+async_supabase: AsyncClient = get_async_supabase()
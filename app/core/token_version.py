@@ -0,0 +1,31 @@
+from typing import Optional
+
+from app.core.cache import StatsTTLCache
+from app.repositories.auth import IAuthRepository
+
+
+class TokenVersionStore:
+    """Per-user access-token versions, cached in process.
+
+    Stateless access tokens embed the version they were issued with; bumping
+    the stored version revokes every token issued before the bump. Lookups hit
+    the database only on a cache miss, and the cache TTL bounds how long a
+    bump made by another worker takes to be seen here.
+    """
+
+    def __init__(self, auth_repo: IAuthRepository, cache: StatsTTLCache):
+        self.auth_repo = auth_repo
+        self.cache = cache
+
+    async def get(self, user_id: str) -> Optional[int]:
+        version = self.cache.get(user_id)
+        if version is None:
+            version = await self.auth_repo.get_token_version(user_id)
+            if version is not None:
+                self.cache.set(user_id, version)
+        return version
+
+    async def bump(self, user_id: str) -> int:
+        version = await self.auth_repo.bump_token_version(user_id)
+        self.cache.set(user_id, version)
+        return version
@@ -0,0 +1,49 @@
+"""Pre-generate daily checklists for every company.
+
+    python -m app.jobs.generate_daily_checklists [--days-ahead 1] [--days 1]
+
+Run daily (e.g. shortly before midnight) to create tomorrow's checklists.
+Re-runs are safe: checklists that already exist are skipped.
+"""
+import argparse
+import asyncio
+import logging
+from datetime import date, timedelta
+
+from app.core.dependencies import get_daily_checklist_service, get_org_repo
+from app.core.supabase import close_async_supabase
+
+logger = logging.getLogger(__name__)
+
+
+async def run(days_ahead: int = 1, days: int = 1) -> int:
+    date_from = date.today() + timedelta(days=days_ahead)
+    date_to = date_from + timedelta(days=days - 1)
+    service = await get_daily_checklist_service()
+    org_repo = await get_org_repo()
+    created = 0
+    try:
+        for company_id in await org_repo.list_company_ids():
+            try:
+                result = await service.generate_bulk(company_id, date_from, date_to)
+            except Exception as e:
+                logger.error(f"Checklist generation failed for company {company_id}: {e}")
+                continue
+            created += result["created"]
+            logger.info(f"Company {company_id} {date_from}..{date_to}: {result}")
+        return created
+    finally:
+        await close_async_supabase()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days-ahead", type=int, default=1)
+    parser.add_argument("--days", type=int, default=1)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run(args.days_ahead, args.days))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Materialize upcoming occurrences of recurring assignments.
+
+    python -m app.jobs.materialize_recurring_assignments [--days-ahead 14]
+
+Run daily. Creates every occurrence due between today and the horizon as
+an assignment with the series' assignees. Re-runs are safe: occurrences
+that were already materialized are skipped.
+"""
+import argparse
+import asyncio
+import logging
+from datetime import date, timedelta
+from typing import Optional
+
+from app.core.config import settings
+from app.core.dependencies import get_assignment_service
+from app.core.supabase import close_async_supabase
+
+logger = logging.getLogger(__name__)
+
+
+async def run(days_ahead: Optional[int] = None) -> int:
+    if days_ahead is None:
+        days_ahead = settings.ASSIGNMENT_RECURRENCE_HORIZON_DAYS
+    date_from = date.today()
+    date_to = date_from + timedelta(days=days_ahead)
+    service = await get_assignment_service()
+    try:
+        result = await service.materialize_recurrences(
+            date_from, date_to, batch_size=settings.ASSIGNMENT_RECURRENCE_BATCH_SIZE
+        )
+        logger.info(f"Recurring assignments {date_from}..{date_to}: {result}")
+        if result["invalid"]:
+            logger.warning(f"Skipped {result['invalid']} series with an invalid recurrence rule")
+        return result["created"]
+    finally:
+        await close_async_supabase()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days-ahead", type=int, default=None)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run(args.days_ahead))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Standalone notification outbox worker.
+
+    python -m app.jobs.notification_outbox
+
+Use this instead of (or alongside) the in-process worker by setting
+NOTIFICATION_OUTBOX_IN_PROCESS_WORKER=false on the API processes.
+"""
+import asyncio
+import logging
+import signal
+
+from app.core.dependencies import container, get_outbox_worker
+from app.core.email import close_smtp_pool
+from app.core.supabase import close_async_supabase
+
+
+async def run() -> None:
+    worker = await get_outbox_worker()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    worker.start()
+    await stop.wait()
+    await container.shutdown()
+    await close_async_supabase()
+    await close_smtp_pool()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
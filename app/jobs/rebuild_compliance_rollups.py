@@ -0,0 +1,57 @@
+"""Backfill or repair the daily checklist compliance rollups.
+
+    python -m app.jobs.rebuild_compliance_rollups [--from 2026-01-01] [--to 2026-03-31]
+
+Rollups are kept current by a trigger on daily_checklists; run this to
+fill history or to recompute a range after a bulk data fix. The range is
+rebuilt one chunk of days at a time so no single call holds the rollup
+table for long.
+"""
+import argparse
+import asyncio
+import logging
+from datetime import date, timedelta
+from typing import Optional
+
+from app.core.dependencies import get_daily_checklist_repo
+from app.core.supabase import close_async_supabase
+
+logger = logging.getLogger(__name__)
+
+
+async def run(date_from: Optional[date] = None, date_to: Optional[date] = None, chunk_days: int = 31) -> int:
+    repo = await get_daily_checklist_repo()
+    try:
+        if date_from is None or date_to is None:
+            written = await repo.rebuild_compliance_rollups(
+                date_from.isoformat() if date_from else None,
+                date_to.isoformat() if date_to else None,
+            )
+            logger.info(f"Rebuilt compliance rollups: {written} rows")
+            return written
+
+        written = 0
+        start = date_from
+        while start <= date_to:
+            end = min(start + timedelta(days=chunk_days - 1), date_to)
+            chunk = await repo.rebuild_compliance_rollups(start.isoformat(), end.isoformat())
+            logger.info(f"Rebuilt compliance rollups {start}..{end}: {chunk} rows")
+            written += chunk
+            start = end + timedelta(days=1)
+        return written
+    finally:
+        await close_async_supabase()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat)
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat)
+    parser.add_argument("--chunk-days", type=int, default=31)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run(args.date_from, args.date_to, args.chunk_days))
+
+
+if __name__ == "__main__":
+    main()
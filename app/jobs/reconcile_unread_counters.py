@@ -0,0 +1,33 @@
+"""Repair drift in the unread-notification counters.
+
+    python -m app.jobs.reconcile_unread_counters
+
+Counters are kept current by triggers on notifications; run this
+periodically (e.g. nightly) to correct anything that slipped.
+"""
+import asyncio
+import logging
+
+from app.core.dependencies import get_notification_repo
+from app.core.supabase import close_async_supabase
+
+logger = logging.getLogger(__name__)
+
+
+async def run() -> int:
+    repo = await get_notification_repo()
+    try:
+        fixed = await repo.reconcile_unread_counters()
+        logger.info(f"Reconciled unread counters: {fixed} corrected")
+        return fixed
+    finally:
+        await close_async_supabase()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,34 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from app.core.config import settings
+from app.core.supabase import close_async_supabase
+from app.core.email import close_smtp_pool, templates as email_templates
+from app.core.password import configure_password_hashing, shutdown_password_executor
+from app.core.dependencies import container, get_outbox_worker
 from app.api.endpoints import auth, assignments, daily_checklists, notices, admin, users, dashboard, attendance, opinions, notifications, files, setup
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await configure_password_hashing()
+    email_templates.preload()
+    await container.startup()
+    if settings.NOTIFICATION_OUTBOX_ENABLED and settings.NOTIFICATION_OUTBOX_IN_PROCESS_WORKER:
+        (await get_outbox_worker()).start()
+    yield
+    await container.shutdown()
+    await close_async_supabase()
+    await close_smtp_pool()
+    shutdown_password_executor()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 # CORS
@@ -22,6 +43,7 @@ app.add_middleware(
     allow_credentials=settings.CORS_ORIGINS != "*",
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -1,14 +1,21 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
-from app.core.email import send_email, _load_template
+from app.core.email import send_email, send_emails, _load_template
 
 logger = logging.getLogger(__name__)
 
 
 class INotificationChannel(ABC):
-    """Abstract interface for notification delivery channels."""
+    """Abstract interface for notification delivery channels.
+
+    ``timeout`` and ``max_concurrency`` override the dispatcher's defaults
+    for this channel when set.
+    """
+
+    timeout: Optional[float] = None
+    max_concurrency: Optional[int] = None
 
     @abstractmethod
     async def send(
@@ -20,10 +27,30 @@ class INotificationChannel(ABC):
     ) -> bool:
         pass
 
+    async def send_many(
+        self,
+        recipient_emails: List[str],
+        title: str,
+        message: str,
+        context: Optional[dict] = None,
+    ) -> List[bool]:
+        """Send the same notification to several recipients. Channels that can batch override this."""
+        results = []
+        for email in recipient_emails:
+            try:
+                results.append(bool(await self.send(email, title, message, context)))
+            except Exception as e:
+                logger.error(f"{self.__class__.__name__} failed for {email}: {e}")
+                results.append(False)
+        return results
+
 
 class EmailNotificationChannel(INotificationChannel):
     """Sends notification emails via existing SMTP infrastructure."""
 
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = timeout
+
     async def send(
         self,
         recipient_email: str,
@@ -32,15 +59,37 @@ class EmailNotificationChannel(INotificationChannel):
         context: Optional[dict] = None,
     ) -> bool:
         try:
-            ctx = context or {}
-            html = _load_template(
-                "notification_email.html",
-                title=title,
-                message=message,
-                app_name=ctx.get("app_name", "Task Server"),
-            )
+            html = self._render(title, message, context)
             await send_email(to=recipient_email, subject=title, html_body=html)
             return True
         except Exception as e:
             logger.error(f"EmailNotificationChannel failed: {e}")
             return False
+
+    async def send_many(
+        self,
+        recipient_emails: List[str],
+        title: str,
+        message: str,
+        context: Optional[dict] = None,
+    ) -> List[bool]:
+        """Render once and send every copy over one pooled SMTP session."""
+        try:
+            html = self._render(title, message, context)
+            return await send_emails([
+                {"to": email, "subject": title, "html_body": html}
+                for email in recipient_emails
+            ])
+        except Exception as e:
+            logger.error(f"EmailNotificationChannel failed: {e}")
+            return [False] * len(recipient_emails)
+
+    @staticmethod
+    def _render(title: str, message: str, context: Optional[dict]) -> str:
+        ctx = context or {}
+        return _load_template(
+            "notification_email.html",
+            title=title,
+            message=message,
+            app_name=ctx.get("app_name", "Task Server"),
+        )
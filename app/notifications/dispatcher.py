@@ -1,16 +1,86 @@
+import asyncio
 import logging
-from typing import List, Optional
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
 
 from app.notifications.channel import INotificationChannel
 
 logger = logging.getLogger(__name__)
 
 
+class ChannelMetrics:
+    """Call, failure, timeout and latency counters for one channel."""
+
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float, ok: bool, timed_out: bool = False) -> None:
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if not ok:
+            self.failures += 1
+        if timed_out:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "avg_ms": round(self.total_ms / self.calls, 2) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 2),
+        }
+
+
 class NotificationDispatcher:
-    """Dispatches notifications to all registered channels."""
+    """Dispatches notifications to all registered channels concurrently.
+
+    Every channel call runs under its own deadline (``timeout`` seconds, or
+    the channel's ``timeout`` attribute) and per-channel concurrency limit
+    (``max_concurrency``, or the channel's ``max_concurrency`` attribute), so
+    a slow channel neither delays the others nor piles up unbounded work.
+    """
 
-    def __init__(self, channels: List[INotificationChannel] = None):
+    def __init__(
+        self,
+        channels: List[INotificationChannel] = None,
+        timeout: float = 10.0,
+        max_concurrency: int = 20,
+    ):
         self.channels = channels or []
+        self._timeouts: Dict[int, float] = {}
+        self._slots: Dict[int, asyncio.Semaphore] = {}
+        self._metrics: Dict[int, ChannelMetrics] = {}
+        for channel in self.channels:
+            key = id(channel)
+            self._timeouts[key] = getattr(channel, "timeout", None) or timeout
+            self._slots[key] = asyncio.Semaphore(getattr(channel, "max_concurrency", None) or max_concurrency)
+            self._metrics[key] = ChannelMetrics()
+
+    async def _call(self, channel: INotificationChannel, fn: Callable[[], Awaitable], failed):
+        """Run one channel call under its limit and deadline; returns `failed` on error."""
+        key = id(channel)
+        name = channel.__class__.__name__
+        async with self._slots[key]:
+            start = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(fn(), timeout=self._timeouts[key])
+            except asyncio.TimeoutError:
+                logger.error(f"Dispatch timed out for {name}")
+                self._metrics[key].record((time.perf_counter() - start) * 1000, ok=False, timed_out=True)
+                return failed
+            except Exception as e:
+                logger.error(f"Dispatch failed for {name}: {e}")
+                self._metrics[key].record((time.perf_counter() - start) * 1000, ok=False)
+                return failed
+            ok = all(result) if isinstance(result, list) else bool(result)
+            self._metrics[key].record((time.perf_counter() - start) * 1000, ok=ok)
+            return result
 
     async def dispatch(
         self,
@@ -18,9 +88,45 @@ class NotificationDispatcher:
         title: str,
         message: str,
         context: Optional[dict] = None,
-    ) -> None:
-        for channel in self.channels:
-            try:
-                await channel.send(recipient_email, title, message, context)
-            except Exception as e:
-                logger.error(f"Dispatch failed for {channel.__class__.__name__}: {e}")
+    ) -> bool:
+        """Send to every channel. Returns True only if all channels succeeded."""
+        results = await asyncio.gather(*(
+            self._call(
+                channel,
+                lambda channel=channel: channel.send(recipient_email, title, message, context),
+                False,
+            )
+            for channel in self.channels
+        ))
+        return all(results)
+
+    async def dispatch_many(
+        self,
+        recipient_emails: List[str],
+        title: str,
+        message: str,
+        context: Optional[dict] = None,
+    ) -> List[bool]:
+        """Send one notification to many recipients, batched per channel.
+
+        Returns, per recipient, whether every channel delivered.
+        """
+        failed = [False] * len(recipient_emails)
+        per_channel = await asyncio.gather(*(
+            self._call(
+                channel,
+                lambda channel=channel: channel.send_many(recipient_emails, title, message, context),
+                failed,
+            )
+            for channel in self.channels
+        ))
+        delivered = [True] * len(recipient_emails)
+        for results in per_channel:
+            delivered = [d and bool(r) for d, r in zip(delivered, results)]
+        return delivered
+
+    def metrics(self) -> Dict[str, dict]:
+        return {
+            channel.__class__.__name__: self._metrics[id(channel)].snapshot()
+            for channel in self.channels
+        }
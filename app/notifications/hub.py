@@ -0,0 +1,56 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationHub:
+    """In-process pub/sub of newly created notifications, keyed by user id.
+
+    Each open stream owns a bounded queue. A subscriber that falls
+    ``queue_size`` events behind is cut off (it receives ``None``) instead of
+    growing memory without bound; the client reconnects with its last event
+    id and the gap is replayed from the database.
+
+    The hub only sees notifications created in this process. Events from
+    other API processes or a standalone outbox worker reach the client when
+    it reconnects and resumes from its last event id.
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+
+    def subscribe(self, user_id: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size + 1)
+        self._subscribers[user_id].add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: str, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(user_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+
+    def publish(self, user_id: str, notification: dict) -> None:
+        for queue in list(self._subscribers.get(user_id, ())):
+            if queue.qsize() >= self.queue_size:
+                logger.warning(f"Notification stream for {user_id} is lagging; disconnecting it")
+                self._cut_off(user_id, queue)
+            else:
+                queue.put_nowait(notification)
+
+    def _cut_off(self, user_id: str, queue: asyncio.Queue) -> None:
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+        self.unsubscribe(user_id, queue)
+
+    def subscriber_count(self, user_id: Optional[str] = None) -> int:
+        if user_id is not None:
+            return len(self._subscribers.get(user_id, ()))
+        return sum(len(q) for q in self._subscribers.values())
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from app.repositories.auth import IAuthRepository
+from app.repositories.notification import INotificationOutboxRepository
+from app.notifications.dispatcher import NotificationDispatcher
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxWorker:
+    """Drains the notification outbox into the dispatcher.
+
+    Each poll leases up to ``batch_size`` due jobs, looks up all their
+    recipients in one query and dispatches jobs with the same title, message
+    and context as one grouped send, with at most ``concurrency`` groups in
+    flight. Failed jobs are retried with exponential backoff
+    (``base_backoff`` doubling per attempt, capped at ``max_backoff``) until
+    ``max_attempts``, then marked failed. A job whose worker dies
+    mid-dispatch is re-claimed once its lease expires.
+    """
+
+    def __init__(
+        self,
+        outbox_repo: INotificationOutboxRepository,
+        auth_repo: IAuthRepository,
+        dispatcher: NotificationDispatcher,
+        batch_size: int = 50,
+        concurrency: int = 10,
+        lease_seconds: int = 60,
+        max_attempts: int = 5,
+        base_backoff: float = 5.0,
+        max_backoff: float = 900.0,
+        poll_interval: float = 1.0,
+    ):
+        self.outbox_repo = outbox_repo
+        self.auth_repo = auth_repo
+        self.dispatcher = dispatcher
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.poll_interval = poll_interval
+
+        self._slots = asyncio.Semaphore(concurrency)
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    def _retry_at(self, attempts: int) -> Optional[datetime]:
+        if attempts >= self.max_attempts:
+            return None
+        delay = min(self.base_backoff * (2 ** (attempts - 1)), self.max_backoff)
+        return datetime.now(timezone.utc) + timedelta(seconds=delay)
+
+    async def _fail(self, job: dict, error: str) -> None:
+        try:
+            await self.outbox_repo.mark_failed(job["id"], error, self._retry_at(job["attempts"]))
+        except Exception as mark_error:
+            # The lease expires and the job is claimed again.
+            logger.error(f"Could not record failure for outbox job {job['id']}: {mark_error}")
+
+    async def _skip(self, job: dict) -> None:
+        try:
+            await self.outbox_repo.mark_skipped(job["id"], "Recipient has no email.")
+        except Exception as e:
+            logger.error(f"Could not skip outbox job {job['id']}: {e}")
+
+    async def _process_group(self, jobs: List[dict], emails: List[str]) -> None:
+        """Dispatch one notification to every recipient of a group, then record each job's outcome."""
+        first = jobs[0]
+        async with self._slots:
+            try:
+                delivered = await self.dispatcher.dispatch_many(
+                    recipient_emails=emails,
+                    title=first["title"],
+                    message=first["message"],
+                    context=first.get("context") or {},
+                )
+            except Exception as e:
+                logger.error(f"Outbox dispatch of {len(jobs)} jobs failed: {e}")
+                await asyncio.gather(*(self._fail(job, str(e)) for job in jobs))
+                return
+
+        async def record(job: dict, ok: bool) -> None:
+            if not ok:
+                await self._fail(job, "One or more channels failed.")
+                return
+            try:
+                await self.outbox_repo.mark_sent(job["id"])
+            except Exception as e:
+                logger.error(f"Could not mark outbox job {job['id']} sent: {e}")
+
+        await asyncio.gather(*(record(job, ok) for job, ok in zip(jobs, delivered)))
+
+    async def run_once(self) -> int:
+        """Claim and process one batch. Returns the number of jobs processed.
+
+        Recipients of the whole batch are looked up in one query, and jobs
+        carrying the same notification are dispatched together.
+        """
+        jobs = await self.outbox_repo.claim(self.batch_size, self.lease_seconds)
+        if not jobs:
+            return 0
+        try:
+            emails = await self.auth_repo.get_emails_by_ids(list({job["user_id"] for job in jobs}))
+        except Exception as e:
+            logger.error(f"Outbox recipient lookup failed: {e}")
+            await asyncio.gather(*(self._fail(job, str(e)) for job in jobs))
+            return len(jobs)
+
+        skipped: List[dict] = []
+        groups: Dict[tuple, Tuple[List[dict], List[str]]] = {}
+        for job in jobs:
+            email = emails.get(job["user_id"])
+            if not email:
+                skipped.append(job)
+                continue
+            group_jobs, group_emails = groups.setdefault(_group_key(job), ([], []))
+            group_jobs.append(job)
+            group_emails.append(email)
+
+        await asyncio.gather(
+            *(self._skip(job) for job in skipped),
+            *(self._process_group(group_jobs, group_emails) for group_jobs, group_emails in groups.values()),
+        )
+        return len(jobs)
+
+    async def run(self) -> None:
+        """Poll until stopped; a full batch is followed immediately by the next poll."""
+        while not self._stopping.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Outbox poll failed: {e}")
+                processed = 0
+            if processed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        """Run the worker as a background task on the current event loop."""
+        if self._task is None or self._task.done():
+            self._stopping.clear()
+            self._task = asyncio.create_task(self.run())
+
+    async def aclose(self) -> None:
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+
+def _group_key(job: dict) -> tuple:
+    context = json.dumps(job.get("context") or {}, sort_keys=True, default=str)
+    return job["title"], job["message"], context
@@ -1,13 +1,67 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
-from app.core.supabase import supabase
+from app.core.supabase import async_supabase
+from app.core.pagination import paginate
+from app.core.fieldsets import FieldSet
+
+
+ASSIGNMENT_COLUMNS = (
+    "id", "company_id", "branch_id", "title", "description", "priority", "status",
+    "due_date", "recurrence", "recurrence_parent_id", "occurrence_date",
+    "created_by", "created_at", "updated_at",
+)
+ASSIGNMENT_EMBEDS = {
+    "assignees": "assignees:assignment_assignees(*)",
+    "comments": "comments(*)",
+}
+# Lists page on (created_at, id) and embed nothing unless asked.
+ASSIGNMENT_LIST_FIELDS = FieldSet(
+    ASSIGNMENT_COLUMNS, {"assignees": ASSIGNMENT_EMBEDS["assignees"]}, required=("id", "created_at")
+)
+# Comments have their own paginated endpoint, so detail only embeds them on request.
+ASSIGNMENT_DETAIL_FIELDS = FieldSet(ASSIGNMENT_COLUMNS, ASSIGNMENT_EMBEDS, default_include=("assignees",))
+RECURRING_SERIES_SELECT = "id,due_date,created_at,recurrence,recurrence_materialized_through"
 
 
 class IAssignmentRepository(ABC):
     @abstractmethod
-    async def get_by_id(self, id: str) -> Optional[dict]: pass
+    async def get_by_id(self, id: str, select: Optional[str] = None) -> Optional[dict]:
+        """Defaults to the assignment with its assignees."""
+        pass
     @abstractmethod
-    async def list(self, filters: dict) -> List[dict]: pass
+    async def list(
+        self, filters: dict, limit: int = 50, cursor: Optional[str] = None, select: str = "*"
+    ) -> List[dict]:
+        """Newest first; returns up to limit+1 rows so the caller can tell if there is a next page.
+
+        List values match any of the given values; ``due_from`` / ``due_to``
+        bound ``due_date`` (inclusive).
+        """
+        pass
+    @abstractmethod
+    async def list_by_assignee(
+        self, user_id: str, company_id: str, status: Optional[List[str]] = None,
+        limit: Optional[int] = None, cursor: Optional[str] = None, select: str = "*",
+    ) -> List[dict]:
+        """Assignments the user is assigned to, newest first.
+
+        With a limit, returns up to limit+1 rows so the caller can tell if
+        there is a next page; without one, returns every match.
+        """
+        pass
+    @abstractmethod
+    async def get_assignee_summary(self, user_id: str, company_id: str, urgent_limit: int = 10) -> dict:
+        """Status counts of the user's assignments and up to urgent_limit open urgent ones."""
+        pass
+    @abstractmethod
+    async def list_recurring(self, after_id: Optional[str] = None, limit: int = 500) -> List[dict]:
+        """Recurring series (assignments with a rule that are not themselves occurrences), by id."""
+        pass
+    @abstractmethod
+    async def materialize_occurrences(self, occurrences: List[dict], series_ids: List[str], through: str) -> int:
+        """Create the missing occurrences with their series' assignees and advance the
+        series' recurrence_materialized_through; returns the number created."""
+        pass
     @abstractmethod
     async def create(self, data: dict) -> dict: pass
     @abstractmethod
@@ -26,65 +80,104 @@ class AssignmentRepository(IAssignmentRepository):
     def __init__(self):
         self.table = "assignments"
 
-    async def get_by_id(self, id: str) -> Optional[dict]:
-        res = (
-            supabase.table(self.table)
-            .select("*, assignees:assignment_assignees(*), comments(*)")
+    async def get_by_id(self, id: str, select: Optional[str] = None) -> Optional[dict]:
+        res = await (
+            async_supabase.table(self.table)
+            .select(select or ASSIGNMENT_DETAIL_FIELDS.select())
             .eq("id", id)
             .maybe_single()
             .execute()
         )
         return res.data if res else None
 
-    async def list(self, filters: dict) -> List[dict]:
-        query = supabase.table(self.table).select("*, assignees:assignment_assignees(*)")
+    async def list(
+        self, filters: dict, limit: int = 50, cursor: Optional[str] = None, select: str = "*"
+    ) -> List[dict]:
+        query = async_supabase.table(self.table).select(select)
         for key, value in filters.items():
-            if value is not None:
+            if value is None or value == []:
+                continue
+            if key == "due_from":
+                query = query.gte("due_date", value)
+            elif key == "due_to":
+                query = query.lte("due_date", value)
+            elif isinstance(value, (list, tuple, set)):
+                query = query.in_(key, list(value))
+            else:
                 query = query.eq(key, value)
-        res = query.order("created_at", desc=True).execute()
+        res = await paginate(query, cursor, limit).execute()
         return res.data
 
-    async def list_by_assignee(self, user_id: str, company_id: str) -> List[dict]:
-        assignee_res = (
-            supabase.table("assignment_assignees")
-            .select("assignment_id")
-            .eq("user_id", user_id)
-            .execute()
-        )
-        if not assignee_res.data:
-            return []
-        assignment_ids = [a["assignment_id"] for a in assignee_res.data]
-        res = (
-            supabase.table(self.table)
-            .select("*, assignees:assignment_assignees(*)")
+    async def list_by_assignee(
+        self, user_id: str, company_id: str, status: Optional[List[str]] = None,
+        limit: Optional[int] = None, cursor: Optional[str] = None, select: str = "*",
+    ) -> List[dict]:
+        # The inner-joined "mine" embed restricts rows to the user's assignments
+        # in the same request, independently of any "assignees" embed in select.
+        query = (
+            async_supabase.table(self.table)
+            .select(f"{select},mine:assignment_assignees!inner(user_id)")
             .eq("company_id", company_id)
-            .in_("id", assignment_ids)
-            .order("created_at", desc=True)
-            .execute()
+            .eq("mine.user_id", user_id)
+        )
+        if status:
+            query = query.in_("status", list(status))
+        if limit is None:
+            query = query.order("created_at", desc=True).order("id", desc=True)
+        else:
+            query = paginate(query, cursor, limit)
+        res = await query.execute()
+        for row in res.data:
+            row.pop("mine", None)
+        return res.data
+
+    async def get_assignee_summary(self, user_id: str, company_id: str, urgent_limit: int = 10) -> dict:
+        res = await async_supabase.rpc(
+            "get_assignee_dashboard_summary",
+            {"p_user_id": user_id, "p_company_id": company_id, "p_urgent_limit": urgent_limit},
+        ).execute()
+        return res.data
+
+    async def list_recurring(self, after_id: Optional[str] = None, limit: int = 500) -> List[dict]:
+        query = (
+            async_supabase.table(self.table)
+            .select(RECURRING_SERIES_SELECT)
+            .not_.is_("recurrence", "null")
+            .is_("recurrence_parent_id", "null")
         )
+        if after_id:
+            query = query.gt("id", after_id)
+        res = await query.order("id").limit(limit).execute()
         return res.data
 
+    async def materialize_occurrences(self, occurrences: List[dict], series_ids: List[str], through: str) -> int:
+        res = await async_supabase.rpc(
+            "materialize_assignment_occurrences",
+            {"p_occurrences": occurrences, "p_series_ids": series_ids, "p_through": through},
+        ).execute()
+        return res.data or 0
+
     async def create(self, data: dict) -> dict:
-        res = supabase.table(self.table).insert(data).execute()
+        res = await async_supabase.table(self.table).insert(data).execute()
         return res.data[0]
 
     async def update(self, id: str, data: dict) -> dict:
-        res = supabase.table(self.table).update(data).eq("id", id).execute()
+        res = await async_supabase.table(self.table).update(data).eq("id", id).execute()
         return res.data[0]
 
     async def delete(self, id: str) -> bool:
-        supabase.table(self.table).delete().eq("id", id).execute()
+        await async_supabase.table(self.table).delete().eq("id", id).execute()
         return True
 
     async def add_assignees(self, assignment_id: str, user_ids: List[str]) -> List[dict]:
         rows = [{"assignment_id": assignment_id, "user_id": uid} for uid in user_ids]
-        res = supabase.table("assignment_assignees").insert(rows).execute()
+        res = await async_supabase.table("assignment_assignees").insert(rows).execute()
         return res.data
 
     async def remove_assignee(self, assignment_id: str, user_id: str) -> bool:
-        supabase.table("assignment_assignees").delete().eq("assignment_id", assignment_id).eq("user_id", user_id).execute()
+        await async_supabase.table("assignment_assignees").delete().eq("assignment_id", assignment_id).eq("user_id", user_id).execute()
         return True
 
     async def get_assignees(self, assignment_id: str) -> List[dict]:
-        res = supabase.table("assignment_assignees").select("*").eq("assignment_id", assignment_id).execute()
+        res = await async_supabase.table("assignment_assignees").select("*").eq("assignment_id", assignment_id).execute()
         return res.data
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
-from app.core.supabase import supabase
+from app.core.supabase import async_supabase
 
 
 class IAttendanceRepository(ABC):
@@ -19,23 +19,23 @@ class AttendanceRepository(IAttendanceRepository):
         self.table = "attendance"
 
     async def clock_in(self, data: dict) -> dict:
-        res = supabase.table(self.table).insert(data).execute()
+        res = await async_supabase.table(self.table).insert(data).execute()
         return res.data[0]
 
     async def clock_out(self, record_id: str, data: dict) -> dict:
-        res = supabase.table(self.table).update(data).eq("id", record_id).execute()
+        res = await async_supabase.table(self.table).update(data).eq("id", record_id).execute()
         return res.data[0]
 
     async def get_today_record(self, user_id: str, company_id: str, date: str) -> Optional[dict]:
         query = (
-            supabase.table(self.table)
+            async_supabase.table(self.table)
             .select("*")
             .eq("user_id", user_id)
             .eq("company_id", company_id)
         )
         # clock_in can be NULL now, so filter by created_at or use date-based approach
         # Use gte/lte on the record creation window for the day
-        res = (
+        res = await (
             query
             .gte("clock_in", f"{date}T00:00:00")
             .lte("clock_in", f"{date}T23:59:59")
@@ -51,8 +51,8 @@ class AttendanceRepository(IAttendanceRepository):
         else:
             end = f"{year}-{month + 1:02d}-01T00:00:00"
 
-        res = (
-            supabase.table(self.table)
+        res = await (
+            async_supabase.table(self.table)
             .select("*")
             .eq("user_id", user_id)
             .eq("company_id", company_id)
@@ -1,6 +1,10 @@
+import logging
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
 
 
 class IAuthRepository(ABC):
@@ -24,6 +28,11 @@ class IAuthRepository(ABC):
     async def get_user_by_email(self, email: str) -> Optional[dict]:
         pass
 
+    @abstractmethod
+    async def get_emails_by_ids(self, user_ids: List[str]) -> Dict[str, str]:
+        """Map user id -> email for the given ids (users without an email are omitted)."""
+        pass
+
     @abstractmethod
     async def update_password(self, user_id: str, new_password_hash: str) -> bool:
         pass
@@ -36,6 +45,14 @@ class IAuthRepository(ABC):
     async def check_duplicate(self, login_id: str, email: str) -> Optional[str]:
         pass
 
+    @abstractmethod
+    async def get_token_version(self, user_id: str) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    async def bump_token_version(self, user_id: str) -> int:
+        pass
+
     # -- Verification code methods --
 
     @abstractmethod
@@ -76,25 +93,34 @@ class CustomAuthRepository(IAuthRepository):
         self.codes_table = "email_verification_codes"
 
     async def sign_up(self, data: dict) -> dict:
-        res = self.client.table(self.table).insert(data).execute()
+        res = await self.client.table(self.table).insert(data).execute()
         if not res.data:
             raise Exception("Failed to create user.")
         return res.data[0]
 
     async def sign_in(self, login_id: str, password: str) -> dict:
-        from app.core.password import verify_password
+        from app.core.password import hash_password_async, needs_rehash, verify_password_async
 
         user = await self.get_user_by_login_id(login_id)
         if not user:
             raise Exception("Invalid login ID or password.")
         if not user.get("password_hash"):
             raise Exception("Invalid login ID or password.")
-        if not verify_password(password, user["password_hash"]):
+        if not await verify_password_async(password, user["password_hash"]):
             raise Exception("Invalid login ID or password.")
+
+        # Upgrade hashes made with a lower cost while we hold the plaintext.
+        if needs_rehash(user["password_hash"]):
+            try:
+                new_hash = await hash_password_async(password)
+                await self.update_password(user["id"], new_hash)
+                user["password_hash"] = new_hash
+            except Exception as e:
+                logger.warning(f"Password rehash failed for {user['id']}: {e}")
         return user
 
     async def get_user_by_id(self, user_id: str) -> Optional[dict]:
-        res = (
+        res = await (
             self.client.table(self.table)
             .select("*")
             .eq("id", user_id)
@@ -104,7 +130,7 @@ class CustomAuthRepository(IAuthRepository):
         return res.data if res else None
 
     async def get_user_by_login_id(self, login_id: str) -> Optional[dict]:
-        res = (
+        res = await (
             self.client.table(self.table)
             .select("*")
             .eq("login_id", login_id)
@@ -114,7 +140,7 @@ class CustomAuthRepository(IAuthRepository):
         return res.data if res else None
 
     async def get_user_by_email(self, email: str) -> Optional[dict]:
-        res = (
+        res = await (
             self.client.table(self.table)
             .select("*")
             .eq("email", email)
@@ -123,21 +149,32 @@ class CustomAuthRepository(IAuthRepository):
         )
         return res.data if res else None
 
+    async def get_emails_by_ids(self, user_ids: List[str]) -> Dict[str, str]:
+        if not user_ids:
+            return {}
+        res = await (
+            self.client.table(self.table)
+            .select("id, email")
+            .in_("id", user_ids)
+            .execute()
+        )
+        return {row["id"]: row["email"] for row in res.data if row.get("email")}
+
     async def update_password(self, user_id: str, new_password_hash: str) -> bool:
-        self.client.table(self.table).update(
+        await self.client.table(self.table).update(
             {"password_hash": new_password_hash}
         ).eq("id", user_id).execute()
         return True
 
     async def verify_email(self, user_id: str) -> bool:
-        self.client.table(self.table).update(
+        await self.client.table(self.table).update(
             {"email_verified": True}
         ).eq("id", user_id).execute()
         return True
 
     async def check_duplicate(self, login_id: str, email: str) -> Optional[str]:
         """Return an error message if login_id or email is already taken, else None."""
-        existing = (
+        existing = await (
             self.client.table(self.table)
             .select("id, login_id, email")
             .or_(f"login_id.eq.{login_id},email.eq.{email}")
@@ -151,6 +188,21 @@ class CustomAuthRepository(IAuthRepository):
                     return "Email is already registered."
         return None
 
+    async def get_token_version(self, user_id: str) -> Optional[int]:
+        res = await (
+            self.client.table(self.table)
+            .select("token_version")
+            .eq("id", user_id)
+            .maybe_single()
+            .execute()
+        )
+        return res.data["token_version"] if res and res.data else None
+
+    async def bump_token_version(self, user_id: str) -> int:
+        """Atomically increment users.token_version and return the new value."""
+        res = await self.client.rpc("bump_user_token_version", {"p_user_id": user_id}).execute()
+        return res.data
+
     # -- Verification code methods --
 
     async def save_verification_code(
@@ -163,14 +215,14 @@ class CustomAuthRepository(IAuthRepository):
         }
         if user_id:
             data["user_id"] = user_id
-        res = self.client.table(self.codes_table).insert(data).execute()
+        res = await self.client.table(self.codes_table).insert(data).execute()
         if not res.data:
             raise Exception("Failed to save verification code.")
         return res.data[0]
 
     async def is_email_verified(self, email: str) -> bool:
         """Check if email has a used verification code (verified before signup)."""
-        res = (
+        res = await (
             self.client.table(self.codes_table)
             .select("id", count="exact")
             .eq("email", email)
@@ -183,7 +235,7 @@ class CustomAuthRepository(IAuthRepository):
     async def get_valid_verification_code(
         self, email: str, code: str
     ) -> Optional[dict]:
-        res = (
+        res = await (
             self.client.table(self.codes_table)
             .select("*")
             .eq("email", email)
@@ -197,19 +249,19 @@ class CustomAuthRepository(IAuthRepository):
         return res.data[0] if res.data else None
 
     async def mark_verification_code_used(self, code_id: str) -> bool:
-        self.client.table(self.codes_table).update(
+        await self.client.table(self.codes_table).update(
             {"used": True}
         ).eq("id", code_id).execute()
         return True
 
     async def invalidate_previous_codes(self, email: str) -> bool:
-        self.client.table(self.codes_table).update(
+        await self.client.table(self.codes_table).update(
             {"used": True}
         ).eq("email", email).eq("used", False).execute()
         return True
 
     async def count_recent_codes(self, email: str, since: datetime) -> int:
-        res = (
+        res = await (
             self.client.table(self.codes_table)
             .select("id", count="exact")
             .eq("email", email)
@@ -1,14 +1,34 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
-from app.core.supabase import supabase
+from app.core.supabase import async_supabase
+from app.core.fieldsets import FieldSet
+
+
+TEMPLATE_FIELDS = FieldSet(
+    (
+        "id", "company_id", "brand_id", "branch_id", "name", "recurrence", "is_active",
+        "version", "created_at", "updated_at",
+    ),
+    {"items": "items:template_items(*)", "groups": "groups:template_groups(*)"},
+)
 
 
 class IChecklistTemplateRepository(ABC):
     @abstractmethod
-    async def list_templates(self, company_id: str, branch_id: Optional[str] = None) -> List[dict]: pass
+    async def list_templates(
+        self, company_id: str, branch_id: Optional[str] = None, select: str = "*"
+    ) -> List[dict]: pass
+    @abstractmethod
+    async def list_active_templates(self, company_id: str) -> List[dict]:
+        """Active templates with their items and group ids, for checklist generation."""
+        pass
     @abstractmethod
     async def get_template_by_id(self, id: str) -> Optional[dict]: pass
     @abstractmethod
+    async def get_template_version(self, id: str) -> Optional[int]:
+        """Current version of the template, or None if it does not exist."""
+        pass
+    @abstractmethod
     async def create_template(self, data: dict) -> dict: pass
     @abstractmethod
     async def update_template(self, id: str, data: dict) -> dict: pass
@@ -18,20 +38,35 @@ class IChecklistTemplateRepository(ABC):
 
 class ChecklistTemplateRepository(IChecklistTemplateRepository):
 
-    async def list_templates(self, company_id: str, branch_id: Optional[str] = None) -> List[dict]:
+    async def list_templates(
+        self, company_id: str, branch_id: Optional[str] = None, select: str = "*"
+    ) -> List[dict]:
         query = (
-            supabase.table("checklist_templates")
-            .select("*, items:template_items(*), groups:template_groups(*)")
+            async_supabase.table("checklist_templates")
+            .select(select)
             .eq("company_id", company_id)
         )
         if branch_id:
             query = query.eq("branch_id", branch_id)
-        res = query.execute()
+        res = await query.execute()
+        return res.data
+
+    async def list_active_templates(self, company_id: str) -> List[dict]:
+        res = await (
+            async_supabase.table("checklist_templates")
+            .select(
+                "id, brand_id, branch_id, recurrence, version, created_at, "
+                "items:template_items(*), groups:template_groups(group_id)"
+            )
+            .eq("company_id", company_id)
+            .eq("is_active", True)
+            .execute()
+        )
         return res.data
 
     async def get_template_by_id(self, id: str) -> Optional[dict]:
-        res = (
-            supabase.table("checklist_templates")
+        res = await (
+            async_supabase.table("checklist_templates")
             .select("*, items:template_items(*), groups:template_groups(*)")
             .eq("id", id)
             .maybe_single()
@@ -39,29 +74,39 @@ class ChecklistTemplateRepository(IChecklistTemplateRepository):
         )
         return res.data if res else None
 
+    async def get_template_version(self, id: str) -> Optional[int]:
+        res = await (
+            async_supabase.table("checklist_templates")
+            .select("version")
+            .eq("id", id)
+            .maybe_single()
+            .execute()
+        )
+        return res.data["version"] if res and res.data else None
+
     async def create_template(self, data: dict) -> dict:
         items = data.pop("items", [])
         group_ids = data.pop("group_ids", [])
 
-        res = supabase.table("checklist_templates").insert(data).execute()
+        res = await async_supabase.table("checklist_templates").insert(data).execute()
         template = res.data[0]
         template_id = template["id"]
 
         if items:
             for item in items:
                 item["template_id"] = template_id
-            supabase.table("template_items").insert(items).execute()
+            await async_supabase.table("template_items").insert(items).execute()
 
         if group_ids:
             group_rows = [{"template_id": template_id, "group_id": gid} for gid in group_ids]
-            supabase.table("template_groups").insert(group_rows).execute()
+            await async_supabase.table("template_groups").insert(group_rows).execute()
 
         return await self.get_template_by_id(template_id)
 
     async def update_template(self, id: str, data: dict) -> dict:
-        res = supabase.table("checklist_templates").update(data).eq("id", id).execute()
+        res = await async_supabase.table("checklist_templates").update(data).eq("id", id).execute()
         return res.data[0]
 
     async def delete_template(self, id: str) -> bool:
-        supabase.table("checklist_templates").delete().eq("id", id).execute()
+        await async_supabase.table("checklist_templates").delete().eq("id", id).execute()
         return True
@@ -1,11 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import List
-from app.core.supabase import supabase
+from typing import List, Optional
+from app.core.supabase import async_supabase
+from app.core.pagination import paginate
 
 
 class ICommentRepository(ABC):
     @abstractmethod
-    async def list_by_assignment(self, assignment_id: str) -> List[dict]: pass
+    async def list_by_assignment(
+        self, assignment_id: str, limit: int = 50, cursor: Optional[str] = None
+    ) -> List[dict]:
+        """Oldest first; returns up to limit+1 rows so the caller can tell if there is a next page."""
+        pass
     @abstractmethod
     async def create(self, data: dict) -> dict: pass
     @abstractmethod
@@ -16,20 +21,21 @@ class CommentRepository(ICommentRepository):
     def __init__(self):
         self.table = "comments"
 
-    async def list_by_assignment(self, assignment_id: str) -> List[dict]:
-        res = (
-            supabase.table(self.table)
+    async def list_by_assignment(
+        self, assignment_id: str, limit: int = 50, cursor: Optional[str] = None
+    ) -> List[dict]:
+        query = (
+            async_supabase.table(self.table)
             .select("*")
             .eq("assignment_id", assignment_id)
-            .order("created_at", desc=False)
-            .execute()
         )
+        res = await paginate(query, cursor, limit, desc=False).execute()
         return res.data
 
     async def create(self, data: dict) -> dict:
-        res = supabase.table(self.table).insert(data).execute()
+        res = await async_supabase.table(self.table).insert(data).execute()
         return res.data[0]
 
     async def delete(self, id: str) -> bool:
-        supabase.table(self.table).delete().eq("id", id).execute()
+        await async_supabase.table(self.table).delete().eq("id", id).execute()
         return True
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
-from app.core.supabase import supabase
+from postgrest import CountMethod, ReturnMethod
+from app.core.supabase import async_supabase
 
 
 class IDailyChecklistRepository(ABC):
@@ -9,22 +10,73 @@ class IDailyChecklistRepository(ABC):
     @abstractmethod
     async def list_by_branch_date(self, branch_id: str, date: str) -> List[dict]: pass
     @abstractmethod
+    async def list_by_branch_range(
+        self, branch_id: str, date_from: str, date_to: str, select: str = "*"
+    ) -> List[dict]:
+        """Checklists of a branch dated date_from..date_to inclusive."""
+        pass
+    @abstractmethod
+    async def list_compliance_rollups(self, branch_id: str, date_from: str, date_to: str) -> List[dict]:
+        """checklist_compliance_rollups rows of a branch dated date_from..date_to inclusive."""
+        pass
+    @abstractmethod
+    async def rebuild_compliance_rollups(
+        self, date_from: Optional[str] = None, date_to: Optional[str] = None
+    ) -> int:
+        """Recompute rollups for the range (all dates when omitted); returns rows written."""
+        pass
+    @abstractmethod
+    async def list_existing_keys(self, template_ids: List[str], date_from: str, date_to: str) -> List[dict]:
+        """(template_id, branch_id, date) of checklists already generated for the templates and range."""
+        pass
+    @abstractmethod
+    async def create_many(self, rows: List[dict]) -> int:
+        """Insert checklists, skipping any whose (template, branch, date) exists; returns rows inserted."""
+        pass
+    @abstractmethod
     async def create(self, data: dict) -> dict: pass
     @abstractmethod
     async def update_checklist_data(self, id: str, checklist_data: list) -> dict: pass
+    @abstractmethod
+    async def update_item(
+        self,
+        id: str,
+        item_index: int,
+        user_id: str,
+        is_completed: bool,
+        verification_data: Optional[str] = None,
+        expected_version: Optional[int] = None,
+    ) -> dict:
+        """Atomically patch one checklist_data item.
+
+        Returns ``{"status": "ok", "item_index", "item", "version"}`` or
+        ``{"status": "not_found" | "invalid_index" | "version_conflict", "version"}``.
+        """
+        pass
+    @abstractmethod
+    async def update_items(self, id: str, user_id: str, changes: List[dict]) -> dict:
+        """Apply several item changes in one atomic write.
+
+        Returns ``{"status": "ok", "version", "items": [...]}`` with a per-change
+        status, or ``{"status": "not_found"}``.
+        """
+        pass
 
 
 class DailyChecklistRepository(IDailyChecklistRepository):
+    KEY_PAGE_SIZE = 1000
+    INSERT_CHUNK_SIZE = 500
+
     def __init__(self):
         self.table = "daily_checklists"
 
     async def get_by_id(self, id: str) -> Optional[dict]:
-        res = supabase.table(self.table).select("*").eq("id", id).maybe_single().execute()
+        res = await async_supabase.table(self.table).select("*").eq("id", id).maybe_single().execute()
         return res.data if res else None
 
     async def list_by_branch_date(self, branch_id: str, date: str) -> List[dict]:
-        res = (
-            supabase.table(self.table)
+        res = await (
+            async_supabase.table(self.table)
             .select("*")
             .eq("branch_id", branch_id)
             .eq("date", date)
@@ -32,9 +84,41 @@ class DailyChecklistRepository(IDailyChecklistRepository):
         )
         return res.data
 
+    async def list_by_branch_range(
+        self, branch_id: str, date_from: str, date_to: str, select: str = "*"
+    ) -> List[dict]:
+        res = await (
+            async_supabase.table(self.table)
+            .select(select)
+            .eq("branch_id", branch_id)
+            .gte("date", date_from)
+            .lte("date", date_to)
+            .execute()
+        )
+        return res.data
+
+    async def list_compliance_rollups(self, branch_id: str, date_from: str, date_to: str) -> List[dict]:
+        res = await (
+            async_supabase.table("checklist_compliance_rollups")
+            .select("template_id,group_id,completed,total,checklists")
+            .eq("branch_id", branch_id)
+            .gte("date", date_from)
+            .lte("date", date_to)
+            .execute()
+        )
+        return res.data
+
+    async def rebuild_compliance_rollups(
+        self, date_from: Optional[str] = None, date_to: Optional[str] = None
+    ) -> int:
+        res = await async_supabase.rpc(
+            "rebuild_checklist_compliance_rollups", {"p_from": date_from, "p_to": date_to}
+        ).execute()
+        return res.data or 0
+
     async def get_by_template_branch_date(self, template_id: str, branch_id: str, date: str) -> Optional[dict]:
-        res = (
-            supabase.table(self.table)
+        res = await (
+            async_supabase.table(self.table)
             .select("*")
             .eq("template_id", template_id)
             .eq("branch_id", branch_id)
@@ -44,15 +128,78 @@ class DailyChecklistRepository(IDailyChecklistRepository):
         )
         return res.data if res else None
 
+    async def list_existing_keys(self, template_ids: List[str], date_from: str, date_to: str) -> List[dict]:
+        if not template_ids:
+            return []
+        query = (
+            async_supabase.table(self.table)
+            .select("template_id,branch_id,date")
+            .in_("template_id", template_ids)
+            .gte("date", date_from)
+            .lte("date", date_to)
+            .order("id")
+        )
+        # One request unless the range exceeds a page (PostgREST caps rows per response).
+        rows: List[dict] = []
+        while True:
+            res = await query.range(len(rows), len(rows) + self.KEY_PAGE_SIZE - 1).execute()
+            rows.extend(res.data)
+            if len(res.data) < self.KEY_PAGE_SIZE:
+                return rows
+
+    async def create_many(self, rows: List[dict]) -> int:
+        created = 0
+        for start in range(0, len(rows), self.INSERT_CHUNK_SIZE):
+            res = await (
+                async_supabase.table(self.table)
+                .upsert(
+                    rows[start:start + self.INSERT_CHUNK_SIZE],
+                    on_conflict="template_id,branch_id,date",
+                    ignore_duplicates=True,
+                    count=CountMethod.exact,
+                    returning=ReturnMethod.minimal,
+                )
+                .execute()
+            )
+            created += res.count or 0
+        return created
+
     async def create(self, data: dict) -> dict:
-        res = supabase.table(self.table).insert(data).execute()
+        res = await async_supabase.table(self.table).insert(data).execute()
         return res.data[0]
 
     async def update_checklist_data(self, id: str, checklist_data: list) -> dict:
-        res = (
-            supabase.table(self.table)
+        res = await (
+            async_supabase.table(self.table)
             .update({"checklist_data": checklist_data})
             .eq("id", id)
             .execute()
         )
         return res.data[0]
+
+    async def update_item(
+        self,
+        id: str,
+        item_index: int,
+        user_id: str,
+        is_completed: bool,
+        verification_data: Optional[str] = None,
+        expected_version: Optional[int] = None,
+    ) -> dict:
+        res = await async_supabase.rpc("update_daily_checklist_item", {
+            "p_checklist_id": id,
+            "p_item_index": item_index,
+            "p_user_id": user_id,
+            "p_is_completed": is_completed,
+            "p_verification_data": verification_data,
+            "p_expected_version": expected_version,
+        }).execute()
+        return res.data
+
+    async def update_items(self, id: str, user_id: str, changes: List[dict]) -> dict:
+        res = await async_supabase.rpc("update_daily_checklist_items", {
+            "p_checklist_id": id,
+            "p_user_id": user_id,
+            "p_changes": changes,
+        }).execute()
+        return res.data
@@ -1,32 +1,38 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
-from app.core.supabase import supabase
+from app.core.supabase import async_supabase
 
 
 class IFeedbackRepository(ABC):
     @abstractmethod
     async def create_feedback(self, data: dict) -> dict: pass
     @abstractmethod
-    async def list_feedbacks(self, company_id: str, filters: dict) -> List[dict]: pass
+    async def list_feedbacks(
+        self, company_id: str, filters: dict, limit: int = 50, cursor: Optional[str] = None
+    ) -> List[dict]:
+        """Newest first; returns up to limit+1 rows so the caller can tell if there is a next page."""
+        pass
     @abstractmethod
     async def update_feedback(self, id: str, data: dict) -> dict: pass
 
 
 class FeedbackRepository(IFeedbackRepository):
     async def create_feedback(self, data: dict) -> dict:
-        res = supabase.table("feedbacks").insert(data).execute()
+        res = await async_supabase.table("feedbacks").insert(data).execute()
         return res.data[0]
 
-    async def list_feedbacks(self, company_id: str, filters: dict) -> List[dict]:
-        query = supabase.table("feedbacks").select("*").eq("company_id", company_id)
+    async def list_feedbacks(
+        self, company_id: str, filters: dict, limit: int = 50, cursor: Optional[str] = None
+    ) -> List[dict]:
+        query = async_supabase.table("feedbacks").select("*").eq("company_id", company_id)
         for key, value in filters.items():
             if value:
                 query = query.eq(key, value)
-        res = query.order("created_at", desc=True).execute()
+        res = await paginate(query, cursor, limit).execute()
         return res.data
 
     async def update_feedback(self, id: str, data: dict) -> dict:
-        res = supabase.table("feedbacks").update(data).eq("id", id).execute()
+        res = await async_supabase.table("feedbacks").update(data).eq("id", id).execute()
         return res.data[0]
 
 
@@ -48,19 +54,19 @@ class INoticeRepository(ABC):
 class NoticeRepository(INoticeRepository):
     async def list_notices(self, company_id: str, limit: Optional[int] = None) -> List[dict]:
         query = (
-            supabase.table("notices")
+            async_supabase.table("notices")
             .select("*")
             .eq("company_id", company_id)
             .order("created_at", desc=True)
         )
         if limit:
             query = query.limit(limit)
-        res = query.execute()
+        res = await query.execute()
         return res.data
 
     async def get_notice(self, id: str) -> Optional[dict]:
-        res = (
-            supabase.table("notices")
+        res = await (
+            async_supabase.table("notices")
             .select("*, confirmations:notice_confirmations(*)")
             .eq("id", id)
             .maybe_single()
@@ -69,19 +75,19 @@ class NoticeRepository(INoticeRepository):
         return res.data if res else None
 
     async def create_notice(self, data: dict) -> dict:
-        res = supabase.table("notices").insert(data).execute()
+        res = await async_supabase.table("notices").insert(data).execute()
         return res.data[0]
 
     async def update_notice(self, notice_id: str, data: dict) -> dict:
-        res = supabase.table("notices").update(data).eq("id", notice_id).execute()
+        res = await async_supabase.table("notices").update(data).eq("id", notice_id).execute()
         return res.data[0]
 
     async def delete_notice(self, notice_id: str) -> bool:
-        supabase.table("notices").delete().eq("id", notice_id).execute()
+        await async_supabase.table("notices").delete().eq("id", notice_id).execute()
         return True
 
     async def confirm_notice(self, notice_id: str, user_id: str) -> dict:
-        res = supabase.table("notice_confirmations").insert({
+        res = await async_supabase.table("notice_confirmations").insert({
             "notice_id": notice_id,
             "user_id": user_id,
         }).execute()
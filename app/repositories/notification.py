@@ -1,51 +1,108 @@
+import uuid
 from abc import ABC, abstractmethod
-from typing import List
-from app.core.supabase import supabase
+from datetime import datetime, timezone
+from typing import List, Optional
+from postgrest import CountMethod, ReturnMethod
+from app.core.supabase import async_supabase
+from app.core.pagination import paginate
 
 
 class INotificationRepository(ABC):
     @abstractmethod
-    async def list_by_user(self, user_id: str, company_id: str, limit: int = 50) -> List[dict]: pass
+    async def list_by_user(
+        self, user_id: str, company_id: str, limit: int = 50, cursor: Optional[str] = None
+    ) -> List[dict]:
+        """Newest first; returns up to limit+1 rows so the caller can tell if there is a next page."""
+        pass
     @abstractmethod
-    async def count_unread(self, user_id: str, company_id: str) -> int: pass
+    async def list_after(self, user_id: str, company_id: str, after_id: str, limit: int = 100) -> List[dict]:
+        """Notifications created after `after_id`, oldest first (for stream resume)."""
+        pass
+    @abstractmethod
+    async def count_unread(self, user_id: str, company_id: str) -> int:
+        """Read the trigger-maintained unread counter for (user, company)."""
+        pass
     @abstractmethod
     async def mark_as_read(self, notification_id: str, user_id: str) -> dict: pass
     @abstractmethod
     async def mark_all_as_read(self, user_id: str, company_id: str) -> int: pass
     @abstractmethod
     async def create(self, data: dict) -> dict: pass
+    @abstractmethod
+    async def create_with_outbox(self, data: dict) -> dict:
+        """Insert the notification and its outbox dispatch job in one transaction."""
+        pass
+    @abstractmethod
+    async def create_many(self, rows: List[dict]) -> List[dict]: pass
+    @abstractmethod
+    async def create_many_with_outbox(self, rows: List[dict]) -> List[dict]: pass
+    @abstractmethod
+    async def reconcile_unread_counters(self) -> int:
+        """Recompute every unread counter; returns how many were corrected."""
+        pass
 
 
 class NotificationRepository(INotificationRepository):
     def __init__(self):
         self.table = "notifications"
+        self.counters_table = "notification_unread_counters"
+
+    async def list_by_user(
+        self, user_id: str, company_id: str, limit: int = 50, cursor: Optional[str] = None
+    ) -> List[dict]:
+        query = (
+            async_supabase.table(self.table)
+            .select("*")
+            .eq("user_id", user_id)
+            .eq("company_id", company_id)
+        )
+        res = await paginate(query, cursor, limit).execute()
+        return res.data
 
-    async def list_by_user(self, user_id: str, company_id: str, limit: int = 50) -> List[dict]:
-        res = (
-            supabase.table(self.table)
+    async def list_after(self, user_id: str, company_id: str, after_id: str, limit: int = 100) -> List[dict]:
+        # after_id comes from a client header and is interpolated into the filter below.
+        try:
+            after_id = str(uuid.UUID(after_id))
+        except (TypeError, ValueError):
+            return []
+        anchor = await (
+            async_supabase.table(self.table)
+            .select("created_at")
+            .eq("id", after_id)
+            .eq("user_id", user_id)
+            .maybe_single()
+            .execute()
+        )
+        if not anchor or not anchor.data:
+            return []
+        created_at = anchor.data["created_at"]
+        res = await (
+            async_supabase.table(self.table)
             .select("*")
             .eq("user_id", user_id)
             .eq("company_id", company_id)
-            .order("created_at", desc=True)
+            .or_(f'created_at.gt."{created_at}",and(created_at.eq."{created_at}",id.gt.{after_id})')
+            .order("created_at")
+            .order("id")
             .limit(limit)
             .execute()
         )
         return res.data
 
     async def count_unread(self, user_id: str, company_id: str) -> int:
-        res = (
-            supabase.table(self.table)
-            .select("id", count="exact")
+        res = await (
+            async_supabase.table(self.counters_table)
+            .select("unread_count")
             .eq("user_id", user_id)
             .eq("company_id", company_id)
-            .eq("is_read", False)
+            .maybe_single()
             .execute()
         )
-        return res.count or 0
+        return max(res.data["unread_count"], 0) if res and res.data else 0
 
     async def mark_as_read(self, notification_id: str, user_id: str) -> dict:
-        res = (
-            supabase.table(self.table)
+        res = await (
+            async_supabase.table(self.table)
             .update({"is_read": True})
             .eq("id", notification_id)
             .eq("user_id", user_id)
@@ -54,16 +111,82 @@ class NotificationRepository(INotificationRepository):
         return res.data[0] if res.data else {}
 
     async def mark_all_as_read(self, user_id: str, company_id: str) -> int:
-        res = (
-            supabase.table(self.table)
-            .update({"is_read": True})
+        res = await (
+            async_supabase.table(self.table)
+            .update({"is_read": True}, count=CountMethod.exact, returning=ReturnMethod.minimal)
             .eq("user_id", user_id)
             .eq("company_id", company_id)
             .eq("is_read", False)
             .execute()
         )
-        return len(res.data) if res.data else 0
+        return res.count or 0
 
     async def create(self, data: dict) -> dict:
-        res = supabase.table(self.table).insert(data).execute()
+        res = await async_supabase.table(self.table).insert(data).execute()
+        return res.data[0]
+
+    async def create_with_outbox(self, data: dict) -> dict:
+        res = await async_supabase.rpc("create_notification_with_outbox", {"p_notification": data}).execute()
         return res.data[0]
+
+    async def create_many(self, rows: List[dict]) -> List[dict]:
+        if not rows:
+            return []
+        res = await async_supabase.table(self.table).insert(rows).execute()
+        return res.data
+
+    async def create_many_with_outbox(self, rows: List[dict]) -> List[dict]:
+        if not rows:
+            return []
+        res = await async_supabase.rpc("create_notifications_with_outbox", {"p_notifications": rows}).execute()
+        return res.data
+
+    async def reconcile_unread_counters(self) -> int:
+        res = await async_supabase.rpc("reconcile_notification_unread_counters", {}).execute()
+        return res.data or 0
+
+
+class INotificationOutboxRepository(ABC):
+    @abstractmethod
+    async def claim(self, limit: int, lease_seconds: int) -> List[dict]:
+        """Lease up to `limit` due jobs; attempts is incremented for each."""
+        pass
+    @abstractmethod
+    async def mark_sent(self, job_id: str) -> None: pass
+    @abstractmethod
+    async def mark_skipped(self, job_id: str, reason: str) -> None: pass
+    @abstractmethod
+    async def mark_failed(self, job_id: str, error: str, retry_at: Optional[datetime]) -> None:
+        """Reschedule the job at retry_at, or give up on it when retry_at is None."""
+        pass
+
+
+class NotificationOutboxRepository(INotificationOutboxRepository):
+    def __init__(self):
+        self.table = "notification_outbox"
+
+    async def _update(self, job_id: str, data: dict) -> None:
+        data["updated_at"] = datetime.now(timezone.utc).isoformat()
+        await async_supabase.table(self.table).update(data).eq("id", job_id).execute()
+
+    async def claim(self, limit: int, lease_seconds: int) -> List[dict]:
+        res = await async_supabase.rpc(
+            "claim_notification_outbox",
+            {"p_limit": limit, "p_lease_seconds": lease_seconds},
+        ).execute()
+        return res.data or []
+
+    async def mark_sent(self, job_id: str) -> None:
+        await self._update(job_id, {"status": "sent", "locked_until": None, "last_error": None})
+
+    async def mark_skipped(self, job_id: str, reason: str) -> None:
+        await self._update(job_id, {"status": "skipped", "locked_until": None, "last_error": reason})
+
+    async def mark_failed(self, job_id: str, error: str, retry_at: Optional[datetime]) -> None:
+        data = {"locked_until": None, "last_error": error}
+        if retry_at is None:
+            data["status"] = "failed"
+        else:
+            data["status"] = "pending"
+            data["next_attempt_at"] = retry_at.isoformat()
+        await self._update(job_id, data)
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
-from app.core.supabase import supabase
+from app.core.supabase import async_supabase
 
 
 class IOpinionRepository(ABC):
@@ -19,12 +19,12 @@ class OpinionRepository(IOpinionRepository):
         self.table = "opinions"
 
     async def create(self, data: dict) -> dict:
-        res = supabase.table(self.table).insert(data).execute()
+        res = await async_supabase.table(self.table).insert(data).execute()
         return res.data[0]
 
     async def list_by_user(self, user_id: str, company_id: str) -> List[dict]:
-        res = (
-            supabase.table(self.table)
+        res = await (
+            async_supabase.table(self.table)
             .select("*")
             .eq("user_id", user_id)
             .eq("company_id", company_id)
@@ -35,19 +35,19 @@ class OpinionRepository(IOpinionRepository):
 
     async def list_all(self, company_id: str, status: Optional[str] = None) -> List[dict]:
         query = (
-            supabase.table(self.table)
+            async_supabase.table(self.table)
             .select("*")
             .eq("company_id", company_id)
             .order("created_at", desc=True)
         )
         if status:
             query = query.eq("status", status)
-        res = query.execute()
+        res = await query.execute()
         return res.data
 
     async def update_status(self, opinion_id: str, status: str) -> dict:
-        res = (
-            supabase.table(self.table)
+        res = await (
+            async_supabase.table(self.table)
             .update({"status": status})
             .eq("id", opinion_id)
             .execute()
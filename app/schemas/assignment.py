@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional, Any
-from datetime import datetime
+from datetime import date, datetime
 from app.models.enums import Priority, AssignmentStatus, ContentType
 
 
@@ -43,6 +43,8 @@ class Assignment(AssignmentBase):
     created_by: str
     created_at: datetime
     updated_at: datetime
+    recurrence_parent_id: Optional[str] = None
+    occurrence_date: Optional[date] = None
     assignees: List[AssignmentAssignee] = []
     comments: List[Any] = []
 
@@ -50,6 +50,7 @@ class ChecklistTemplateUpdate(BaseModel):
 class ChecklistTemplate(ChecklistTemplateBase):
     id: str
     company_id: str
+    version: int = 0
     created_at: datetime
     updated_at: datetime
     items: List[TemplateItem] = []
@@ -30,6 +30,7 @@ class DailyChecklistCreate(BaseModel):
 
 class DailyChecklist(DailyChecklistBase):
     id: str
+    version: int = 0
     created_at: datetime
 
     class Config: from_attributes = True
@@ -38,3 +39,4 @@ class DailyChecklist(DailyChecklistBase):
 class ChecklistItemUpdate(BaseModel):
     is_completed: bool
     verification_data: Optional[str] = None
+    expected_version: Optional[int] = None
@@ -22,3 +22,4 @@ class Notification(BaseModel):
 class NotificationListResponse(BaseModel):
     unread_count: int
     notifications: List[Notification]
+    next_cursor: Optional[str] = None
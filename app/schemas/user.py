@@ -46,3 +46,11 @@ class User(UserBase):
     updated_at: datetime
 
     class Config: from_attributes = True
+
+
+class Principal(BaseModel):
+    """Lightweight identity of the caller (see get_current_principal)."""
+    id: str
+    company_id: str
+    role: UserRole
+    status: UserStatus
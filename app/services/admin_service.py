@@ -1,9 +1,16 @@
-from typing import List, Optional
+import time
+from typing import List, Optional, Tuple
+from app.core.cache import StatsTTLCache
+from app.core.pagination import split_page
+from app.core.token_version import TokenVersionStore
 from app.repositories.user import SupabaseUserRepository
 from app.repositories.organization import IOrganizationRepository
 from app.repositories.checklist_template import IChecklistTemplateRepository
 from app.repositories.assignment import IAssignmentRepository
 from app.repositories.feedback_notice import IFeedbackRepository, INoticeRepository
+from app.repositories.daily_checklist import IDailyChecklistRepository
+from app.services.compliance import summarize_checklists, summarize_rollups
+from app.services.template_snapshots import TemplateSnapshotCache
 from app.services.notification_service import NotificationService
 from app.schemas.organization import Company, Brand, Branch, GroupType, Group
 from app.schemas.user import User, UserStatus
@@ -19,6 +26,11 @@ class AdminService:
         feedback_repo: IFeedbackRepository,
         notice_repo: INoticeRepository,
         notification_service: NotificationService,
+        user_cache: Optional[StatsTTLCache] = None,
+        token_versions: Optional[TokenVersionStore] = None,
+        checklist_repo: Optional[IDailyChecklistRepository] = None,
+        compliance_rollups: bool = False,
+        template_snapshots: Optional[TemplateSnapshotCache] = None,
     ):
         self.user_repo = user_repo
         self.org_repo = org_repo
@@ -27,16 +39,30 @@ class AdminService:
         self.feedback_repo = feedback_repo
         self.notice_repo = notice_repo
         self.notification_service = notification_service
+        self.user_cache = user_cache
+        self.token_versions = token_versions
+        self.checklist_repo = checklist_repo
+        self.compliance_rollups = compliance_rollups
+        self.template_snapshots = template_snapshots
 
     # ── Staff Management ────────────────────────────
     async def get_pending_staff(self, company_id: str) -> List[User]:
         return await self.user_repo.list(filters={"status": "pending", "company_id": company_id})
 
     async def approve_staff(self, user_id: str) -> User:
-        return await self.user_repo.update(user_id, {"status": "active"})
+        return await self._update_staff_status(user_id, UserStatus.ACTIVE)
 
     async def reject_staff(self, user_id: str) -> User:
-        return await self.user_repo.update(user_id, {"status": "inactive"})
+        return await self._update_staff_status(user_id, UserStatus.INACTIVE)
+
+    async def _update_staff_status(self, user_id: str, status: UserStatus) -> User:
+        user = await self.user_repo.update(user_id, {"status": status.value})
+        if self.user_cache is not None:
+            self.user_cache.invalidate(user_id)
+        if self.token_versions:
+            # Status is signed into stateless tokens; revoke the old ones.
+            await self.token_versions.bump(user_id)
+        return user
 
     # ── Company Management ──────────────────────────
     async def get_company(self, company_id: str) -> Optional[Company]:
@@ -90,14 +116,35 @@ class AdminService:
 
     # ── Checklist Templates ─────────────────────────
     async def create_checklist_template(self, data: dict):
-        return await self.template_repo.create_template(data)
+        template = await self.template_repo.create_template(data)
+        self._invalidate_template_snapshot(template["id"])
+        return template
+
+    async def update_checklist_template(self, template_id: str, data: dict):
+        template = await self.template_repo.update_template(template_id, data)
+        self._invalidate_template_snapshot(template_id)
+        return template
+
+    async def delete_checklist_template(self, template_id: str) -> bool:
+        deleted = await self.template_repo.delete_template(template_id)
+        self._invalidate_template_snapshot(template_id)
+        return deleted
 
-    async def list_checklist_templates(self, company_id: str, branch_id: Optional[str] = None):
-        return await self.template_repo.list_templates(company_id, branch_id)
+    def _invalidate_template_snapshot(self, template_id: str) -> None:
+        # Other processes notice the change through the template's version.
+        if self.template_snapshots is not None:
+            self.template_snapshots.invalidate(template_id)
+
+    async def list_checklist_templates(self, company_id: str, branch_id: Optional[str] = None, select: str = "*"):
+        return await self.template_repo.list_templates(company_id, branch_id, select=select)
 
     # ── Feedbacks ───────────────────────────────────
-    async def list_feedbacks(self, company_id: str, filters: dict) -> List[dict]:
-        return await self.feedback_repo.list_feedbacks(company_id, filters)
+    async def list_feedbacks(
+        self, company_id: str, filters: dict, limit: int = 50, cursor: Optional[str] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """One page of feedbacks, newest first, and the cursor for the next page."""
+        rows = await self.feedback_repo.list_feedbacks(company_id, filters, limit=limit, cursor=cursor)
+        return split_page(rows, limit)
 
     async def create_feedback(self, data: dict) -> dict:
         result = await self.feedback_repo.create_feedback(data)
@@ -106,9 +153,9 @@ class AdminService:
         target_user_id = data.get("target_user_id")
         if target_user_id:
             try:
-                await self.notification_service.notify(
+                await self.notification_service.notify_many(
                     company_id=data.get("company_id", ""),
-                    user_id=target_user_id,
+                    user_ids=[target_user_id],
                     notification_type="feedback",
                     title="New feedback received",
                     message=data.get("content", "")[:100],
@@ -121,11 +168,32 @@ class AdminService:
         return result
 
     # ── Dashboard ───────────────────────────────────
-    async def get_compliance_summary(self, branch_id: str, date: str):
+    async def get_compliance_summary(self, branch_id: str, date_from: str, date_to: Optional[str] = None) -> dict:
+        """Checklist completion for a branch over date_from..date_to (one day if date_to is omitted)."""
+        date_to = date_to or date_from
+        start = time.perf_counter()
+        if self.compliance_rollups:
+            rows = await self.checklist_repo.list_compliance_rollups(branch_id, date_from, date_to)
+            fetched = time.perf_counter()
+            summary = summarize_rollups(rows).to_dict()
+        else:
+            rows = await self.checklist_repo.list_by_branch_range(
+                branch_id, date_from, date_to, select="template_id,group_ids,checklist_data"
+            )
+            fetched = time.perf_counter()
+            summary = summarize_checklists(rows).to_dict()
+        computed = time.perf_counter()
+
         return {
-            "date": date,
             "branch_id": branch_id,
-            "overall_rate": 0.0,
-            "by_group": [],
-            "by_template": [],
+            "date": date_from if date_from == date_to else None,
+            "date_from": date_from,
+            "date_to": date_to,
+            "source": "rollups" if self.compliance_rollups else "checklists",
+            **summary,
+            "timing": {
+                "fetch_ms": round((fetched - start) * 1000, 2),
+                "compute_ms": round((computed - fetched) * 1000, 2),
+                "total_ms": round((computed - start) * 1000, 2),
+            },
         }
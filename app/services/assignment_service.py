@@ -1,42 +1,163 @@
-from typing import List, Optional
+from datetime import date as Date, datetime, timedelta
+from typing import List, Optional, Tuple
 from app.repositories.assignment import IAssignmentRepository
+from app.core.pagination import split_page
+from app.core.cache import StatsTTLCache
+from app.services.recurrence import InvalidRecurrence, parse_recurrence
+
+_DASHBOARD_KEY_SELECT = "id,company_id,assignees:assignment_assignees(user_id)"
 
 
 class AssignmentService:
-    def __init__(self, assignment_repo: IAssignmentRepository):
+    def __init__(self, assignment_repo: IAssignmentRepository, dashboard_cache: Optional[StatsTTLCache] = None):
         self.assignment_repo = assignment_repo
+        # DashboardService's per-(user_id, company_id) summary cache.
+        self.dashboard_cache = dashboard_cache
 
-    async def list_assignments(self, company_id: str, filters: Optional[dict] = None) -> List[dict]:
+    async def list_assignments(
+        self, company_id: str, filters: Optional[dict] = None, limit: int = 50,
+        cursor: Optional[str] = None, select: str = "*",
+    ) -> Tuple[List[dict], Optional[str]]:
+        """One page of the company's assignments, newest first, plus the cursor for the next page."""
         all_filters = {"company_id": company_id}
         if filters:
             all_filters.update(filters)
-        return await self.assignment_repo.list(all_filters)
+        rows = await self.assignment_repo.list(all_filters, limit=limit, cursor=cursor, select=select)
+        return split_page(rows, limit)
 
-    async def get_my_assignments(self, user_id: str, company_id: str) -> List[dict]:
-        return await self.assignment_repo.list_by_assignee(user_id, company_id)
+    async def get_my_assignments(
+        self, user_id: str, company_id: str, status: Optional[List[str]] = None,
+        limit: int = 50, cursor: Optional[str] = None, select: str = "*",
+    ) -> Tuple[List[dict], Optional[str]]:
+        """One page of the user's assignments, newest first, plus the cursor for the next page."""
+        rows = await self.assignment_repo.list_by_assignee(
+            user_id, company_id, status=status, limit=limit, cursor=cursor, select=select
+        )
+        return split_page(rows, limit)
 
-    async def get_assignment(self, assignment_id: str) -> Optional[dict]:
-        return await self.assignment_repo.get_by_id(assignment_id)
+    async def get_assignment(self, assignment_id: str, select: Optional[str] = None) -> Optional[dict]:
+        return await self.assignment_repo.get_by_id(assignment_id, select=select)
 
     async def create_assignment(self, data: dict, assignee_ids: List[str]) -> dict:
+        _normalize_recurrence(data)
         assignment = await self.assignment_repo.create(data)
         if assignee_ids:
             await self.assignment_repo.add_assignees(assignment["id"], assignee_ids)
+        self._invalidate_dashboards(assignment.get("company_id"), assignee_ids)
         return await self.assignment_repo.get_by_id(assignment["id"])
 
     async def update_assignment(self, assignment_id: str, data: dict) -> dict:
+        _normalize_recurrence(data)
         await self.assignment_repo.update(assignment_id, data)
-        return await self.assignment_repo.get_by_id(assignment_id)
+        assignment = await self.assignment_repo.get_by_id(assignment_id)
+        self._invalidate_assignee_dashboards(assignment)
+        return assignment
 
     async def delete_assignment(self, assignment_id: str) -> bool:
-        return await self.assignment_repo.delete(assignment_id)
+        assignment = None
+        if self.dashboard_cache is not None:
+            assignment = await self.assignment_repo.get_by_id(assignment_id, select=_DASHBOARD_KEY_SELECT)
+        deleted = await self.assignment_repo.delete(assignment_id)
+        self._invalidate_assignee_dashboards(assignment)
+        return deleted
 
     async def update_status(self, assignment_id: str, status: str) -> dict:
         await self.assignment_repo.update(assignment_id, {"status": status})
-        return await self.assignment_repo.get_by_id(assignment_id)
+        assignment = await self.assignment_repo.get_by_id(assignment_id)
+        self._invalidate_assignee_dashboards(assignment)
+        return assignment
 
     async def add_assignees(self, assignment_id: str, user_ids: List[str]) -> List[dict]:
-        return await self.assignment_repo.add_assignees(assignment_id, user_ids)
+        result = await self.assignment_repo.add_assignees(assignment_id, user_ids)
+        await self._invalidate_dashboards_of(assignment_id, user_ids)
+        return result
 
     async def remove_assignee(self, assignment_id: str, user_id: str) -> bool:
-        return await self.assignment_repo.remove_assignee(assignment_id, user_id)
+        result = await self.assignment_repo.remove_assignee(assignment_id, user_id)
+        await self._invalidate_dashboards_of(assignment_id, [user_id])
+        return result
+
+    # -- Recurrence --
+
+    async def materialize_recurrences(
+        self, date_from: Date, date_to: Date, batch_size: int = 500
+    ) -> dict:
+        """Create the occurrences of every recurring series due in ``date_from..date_to``.
+
+        Series are read ``batch_size`` at a time and each batch is written in
+        one call. A series' own row is its first occurrence; later ones are
+        new assignments with the series' assignees. Re-runs skip occurrences
+        that exist or were already materialized (and possibly deleted since).
+        """
+        through = date_to.isoformat()
+        result = {"series": 0, "created": 0, "invalid": 0}
+        after_id = None
+        while True:
+            series = await self.assignment_repo.list_recurring(after_id=after_id, limit=batch_size)
+            if not series:
+                break
+            after_id = series[-1]["id"]
+            occurrences, series_ids = [], []
+            for row in series:
+                try:
+                    rule = parse_recurrence(row["recurrence"])
+                except InvalidRecurrence:
+                    result["invalid"] += 1
+                    continue
+                done = row.get("recurrence_materialized_through")
+                if done and done >= through:
+                    continue
+                anchor = _parse_datetime(row.get("due_date") or row["created_at"])
+                start = anchor.date() + timedelta(days=1)
+                if done:
+                    start = max(start, Date.fromisoformat(done) + timedelta(days=1))
+                for day in rule.occurrences(anchor.date(), max(start, date_from), date_to):
+                    occurrences.append({
+                        "series_id": row["id"],
+                        "occurrence_date": day.isoformat(),
+                        "due_date": datetime.combine(day, anchor.timetz()).isoformat(),
+                    })
+                series_ids.append(row["id"])
+            if series_ids:
+                result["created"] += await self.assignment_repo.materialize_occurrences(
+                    occurrences, series_ids, through
+                )
+            result["series"] += len(series_ids)
+            if len(series) < batch_size:
+                break
+        return result
+
+    # -- Dashboard cache --
+
+    def _invalidate_dashboards(self, company_id: Optional[str], user_ids: List[str]) -> None:
+        if self.dashboard_cache is None or not company_id:
+            return
+        for user_id in user_ids:
+            self.dashboard_cache.invalidate((user_id, company_id))
+
+    def _invalidate_assignee_dashboards(self, assignment: Optional[dict]) -> None:
+        if not assignment:
+            return
+        user_ids = [a["user_id"] for a in assignment.get("assignees") or [] if a.get("user_id")]
+        self._invalidate_dashboards(assignment.get("company_id"), user_ids)
+
+    async def _invalidate_dashboards_of(self, assignment_id: str, user_ids: List[str]) -> None:
+        """Invalidate the given users' summaries; looks up the assignment's company first."""
+        if self.dashboard_cache is None:
+            return
+        assignment = await self.assignment_repo.get_by_id(assignment_id, select="id,company_id")
+        if assignment:
+            self._invalidate_dashboards(assignment.get("company_id"), user_ids)
+
+
+def _normalize_recurrence(data: dict) -> None:
+    """Validate and store the canonical form of a submitted rule; raises InvalidRecurrence.
+
+    An empty rule (``{}``) means no recurrence and is stored as NULL.
+    """
+    if "recurrence" in data:
+        data["recurrence"] = parse_recurrence(data["recurrence"]).to_dict() if data["recurrence"] else None
+
+
+def _parse_datetime(value) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
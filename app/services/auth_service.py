@@ -4,8 +4,8 @@ from datetime import datetime, timedelta, timezone
 
 from app.repositories.auth import IAuthRepository
 from app.repositories.organization import IOrganizationRepository
-from app.core.password import hash_password, verify_password
-from app.core.jwt import create_access_token, create_refresh_token, decode_token
+from app.core.password import hash_password_async
+from app.core.jwt import create_access_token, create_refresh_token, decode_token, build_access_claims
 from app.core.email import send_verification_code
 from app.core.config import settings
 from app.schemas.user import UserCreate
@@ -21,9 +21,13 @@ class AuthService:
         self.auth_repo = auth_repo
         self.org_repo = org_repo
 
+    def _create_access_token(self, user: dict) -> str:
+        extra = build_access_claims(user) if settings.JWT_STATELESS_ACCESS_TOKENS else None
+        return create_access_token(user["id"], extra)
+
     async def login(self, login_id: str, password: str) -> dict:
         user = await self.auth_repo.sign_in(login_id, password)
-        access_token = create_access_token(user["id"])
+        access_token = self._create_access_token(user)
         refresh_token = create_refresh_token(user["id"])
         return {
             "access_token": access_token,
@@ -60,7 +64,7 @@ class AuthService:
             "id": str(uuid.uuid4()),
             "email": data.email,
             "login_id": data.login_id,
-            "password_hash": hash_password(data.password),
+            "password_hash": await hash_password_async(data.password),
             "full_name": data.full_name,
             "company_id": company.id,
             "role": data.role.value,
@@ -71,7 +75,7 @@ class AuthService:
         user = await self.auth_repo.sign_up(profile_data)
 
         # 5. Issue tokens
-        access_token = create_access_token(user["id"])
+        access_token = self._create_access_token(user)
         refresh_token = create_refresh_token(user["id"])
 
         return {
@@ -95,8 +99,16 @@ class AuthService:
         if payload.get("type") != "refresh":
             raise Exception("Invalid refresh token.")
         user_id = payload["sub"]
+        if settings.JWT_STATELESS_ACCESS_TOKENS:
+            # Re-read the user so refreshed claims reflect role/status changes.
+            user = await self.auth_repo.get_user_by_id(user_id)
+            if not user:
+                raise Exception("User not found.")
+            access_token = self._create_access_token(user)
+        else:
+            access_token = create_access_token(user_id)
         return {
-            "access_token": create_access_token(user_id),
+            "access_token": access_token,
             "refresh_token": create_refresh_token(user_id),
         }
 
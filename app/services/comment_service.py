@@ -1,9 +1,10 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from app.repositories.comment import ICommentRepository
 from app.repositories.assignment import IAssignmentRepository
 from app.services.notification_service import NotificationService
 from app.schemas.assignment import Comment
+from app.core.pagination import split_page
 
 
 class CommentService:
@@ -17,9 +18,13 @@ class CommentService:
         self.assignment_repo = assignment_repo
         self.notification_service = notification_service
 
-    async def list_comments(self, assignment_id: str) -> List[Comment]:
-        data = await self.comment_repo.list_by_assignment(assignment_id)
-        return [Comment(**item) for item in data]
+    async def list_comments(
+        self, assignment_id: str, limit: int = 50, cursor: Optional[str] = None
+    ) -> Tuple[List[Comment], Optional[str]]:
+        """One page of comments, oldest first, and the cursor for the next page."""
+        rows = await self.comment_repo.list_by_assignment(assignment_id, limit=limit, cursor=cursor)
+        data, next_cursor = split_page(rows, limit)
+        return [Comment(**item) for item in data], next_cursor
 
     async def create_comment(
         self,
@@ -58,7 +63,9 @@ class CommentService:
     ) -> None:
         """Send notification to all assignees except the commenter."""
         try:
-            assignment = await self.assignment_repo.get_by_id(assignment_id)
+            assignment = await self.assignment_repo.get_by_id(
+                assignment_id, select="id,company_id,title,assignees:assignment_assignees(user_id)"
+            )
             if not assignment:
                 return
 
@@ -68,18 +75,19 @@ class CommentService:
             sender = commenter_name or "Someone"
             preview = (content or "")[:100]
 
-            for assignee in assignees:
-                assignee_user_id = assignee.get("user_id")
-                if assignee_user_id and assignee_user_id != commenter_id:
-                    await self.notification_service.notify(
-                        company_id=company_id,
-                        user_id=assignee_user_id,
-                        notification_type="comment",
-                        title=f"New comment on '{title_text}'",
-                        message=f"{sender}: {preview}",
-                        reference_id=assignment_id,
-                        reference_type="assignment",
-                    )
+            recipients = [
+                a.get("user_id") for a in assignees
+                if a.get("user_id") and a.get("user_id") != commenter_id
+            ]
+            await self.notification_service.notify_many(
+                company_id=company_id,
+                user_ids=recipients,
+                notification_type="comment",
+                title=f"New comment on '{title_text}'",
+                message=f"{sender}: {preview}",
+                reference_id=assignment_id,
+                reference_type="assignment",
+            )
         except Exception:
             pass  # Never block comment creation
 
@@ -0,0 +1,105 @@
+"""Checklist compliance: completed / total item counts over daily checklists.
+
+A checklist counts toward the overall figure, its template and every group
+in its ``group_ids``. The same tallies are built either from raw checklists
+or from checklist_compliance_rollups rows. Rates are percentages rounded to
+one decimal, like the dashboard completion rate.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List
+
+
+class ComplianceTally:
+    """Completed and total checklist items, and the number of checklists counted."""
+
+    __slots__ = ("completed", "total", "checklists")
+
+    def __init__(self):
+        self.completed = 0
+        self.total = 0
+        self.checklists = 0
+
+    def add(self, completed: int, total: int, checklists: int = 1) -> None:
+        self.completed += completed
+        self.total += total
+        self.checklists += checklists
+
+    @property
+    def rate(self) -> float:
+        return round(self.completed / self.total * 100, 1) if self.total else 0.0
+
+    def snapshot(self) -> dict:
+        return {
+            "completed": self.completed,
+            "total": self.total,
+            "checklist_count": self.checklists,
+            "rate": self.rate,
+        }
+
+
+def count_items(checklist_data: Iterable[dict]) -> tuple:
+    """(completed, total) items of one checklist's checklist_data."""
+    total = completed = 0
+    for item in checklist_data or ():
+        total += 1
+        if item.get("is_completed"):
+            completed += 1
+    return completed, total
+
+
+class ComplianceSummary:
+    """Accumulates checklists into overall, per-template and per-group tallies in one pass."""
+
+    def __init__(self):
+        self.overall = ComplianceTally()
+        self.by_template: Dict[str, ComplianceTally] = defaultdict(ComplianceTally)
+        self.by_group: Dict[str, ComplianceTally] = defaultdict(ComplianceTally)
+
+    def add_checklist(self, checklist: dict) -> None:
+        completed, total = count_items(checklist.get("checklist_data"))
+        self.add_counts(checklist["template_id"], checklist.get("group_ids") or (), completed, total)
+
+    def add_counts(
+        self, template_id: str, group_ids: Iterable[str], completed: int, total: int, checklists: int = 1
+    ) -> None:
+        self.overall.add(completed, total, checklists)
+        self.by_template[template_id].add(completed, total, checklists)
+        for group_id in group_ids:
+            self.by_group[group_id].add(completed, total, checklists)
+
+    def add_rollup(self, row: dict) -> None:
+        """Add one checklist_compliance_rollups row; group_id NULL rows carry the template totals."""
+        counts = (row["completed"], row["total"], row["checklists"])
+        if row.get("group_id") is None:
+            self.overall.add(*counts)
+            self.by_template[row["template_id"]].add(*counts)
+        else:
+            self.by_group[row["group_id"]].add(*counts)
+
+    def to_dict(self) -> dict:
+        return {
+            "overall_rate": self.overall.rate,
+            "completed": self.overall.completed,
+            "total": self.overall.total,
+            "checklist_count": self.overall.checklists,
+            "by_group": _rows("group_id", self.by_group),
+            "by_template": _rows("template_id", self.by_template),
+        }
+
+
+def _rows(key: str, tallies: Dict[str, ComplianceTally]) -> List[dict]:
+    return [{key: k, **t.snapshot()} for k, t in sorted(tallies.items())]
+
+
+def summarize_checklists(checklists: Iterable[dict]) -> ComplianceSummary:
+    summary = ComplianceSummary()
+    for checklist in checklists:
+        summary.add_checklist(checklist)
+    return summary
+
+
+def summarize_rollups(rows: Iterable[dict]) -> ComplianceSummary:
+    summary = ComplianceSummary()
+    for row in rows:
+        summary.add_rollup(row)
+    return summary
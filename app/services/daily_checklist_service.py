@@ -1,7 +1,40 @@
+import asyncio
+import logging
+from datetime import date as Date, datetime
 from typing import List, Optional
-from datetime import datetime
 from app.repositories.daily_checklist import IDailyChecklistRepository
 from app.repositories.checklist_template import IChecklistTemplateRepository
+from app.repositories.organization import IOrganizationRepository
+from app.services.recurrence import InvalidRecurrence, parse_recurrence
+from app.services.template_snapshots import TemplateSnapshot, TemplateSnapshotCache, compile_template
+
+logger = logging.getLogger(__name__)
+
+
+class ChecklistVersionConflict(Exception):
+    """The checklist changed since the version the client last saw."""
+
+    def __init__(self, current_version: int):
+        super().__init__("Checklist was modified by someone else.")
+        self.current_version = current_version
+
+
+def _run_days(template: dict, date_from: Date, date_to: Date) -> List[Date]:
+    """Days in ``date_from..date_to`` on which the template's recurrence produces a checklist.
+
+    Rules follow app.services.recurrence (a missing rule means daily);
+    ``interval`` rules count from the template's creation date. Templates
+    with an unreadable rule are skipped rather than run every day.
+    """
+    try:
+        rule = parse_recurrence(template.get("recurrence") or {"type": "daily"})
+    except InvalidRecurrence as e:
+        logger.warning(f"Skipping template {template['id']}: {e}")
+        return []
+    anchor = date_from
+    if rule.needs_anchor and template.get("created_at"):
+        anchor = datetime.fromisoformat(template["created_at"]).date()
+    return rule.occurrences(anchor, date_from, date_to)
 
 
 class DailyChecklistService:
@@ -9,9 +42,13 @@ class DailyChecklistService:
         self,
         checklist_repo: IDailyChecklistRepository,
         template_repo: IChecklistTemplateRepository,
+        org_repo: Optional[IOrganizationRepository] = None,
+        template_snapshots: Optional[TemplateSnapshotCache] = None,
     ):
         self.checklist_repo = checklist_repo
         self.template_repo = template_repo
+        self.org_repo = org_repo
+        self.template_snapshots = template_snapshots
 
     async def list_by_branch_date(self, branch_id: str, date: str) -> List[dict]:
         return await self.checklist_repo.list_by_branch_date(branch_id, date)
@@ -26,39 +63,105 @@ class DailyChecklistService:
         date: str,
         group_ids: Optional[List[str]] = None,
     ) -> dict:
-        # Check if already exists
-        existing = await self.checklist_repo.get_by_template_branch_date(template_id, branch_id, date)
+        # Existence check and template version lookup in parallel
+        existing, snapshot = await asyncio.gather(
+            self.checklist_repo.get_by_template_branch_date(template_id, branch_id, date),
+            self._template_snapshot(template_id),
+        )
         if existing:
             return existing
-
-        # Get template with items
-        template = await self.template_repo.get_template_by_id(template_id)
-        if not template:
+        if snapshot is None:
             raise ValueError("Template not found.")
 
-        # Build JSONB checklist_data from template items
-        items = template.get("items", [])
-        checklist_data = []
-        for item in items:
-            checklist_data.append({
-                "item_id": item["id"],
-                "content": item["content"],
-                "verification_type": item.get("verification_type", "none"),
-                "is_completed": False,
-                "completed_by": None,
-                "completed_at": None,
-                "verification_data": None,
-            })
-
         data = {
             "template_id": template_id,
             "branch_id": branch_id,
             "date": date,
-            "checklist_data": checklist_data,
+            "checklist_data": snapshot.checklist_data(),
             "group_ids": group_ids,
         }
         return await self.checklist_repo.create(data)
 
+    async def _template_snapshot(self, template_id: str) -> Optional[TemplateSnapshot]:
+        """The compiled template, from the cache while its version is current."""
+        if self.template_snapshots is not None:
+            version = await self.template_repo.get_template_version(template_id)
+            if version is None:
+                return None
+            snapshot = self.template_snapshots.get(template_id, version)
+            if snapshot is not None:
+                return snapshot
+        template = await self.template_repo.get_template_by_id(template_id)
+        if not template:
+            return None
+        snapshot = compile_template(template)
+        if self.template_snapshots is not None:
+            self.template_snapshots.put(snapshot)
+        return snapshot
+
+    def _compiled(self, template: dict) -> TemplateSnapshot:
+        if self.template_snapshots is None:
+            return compile_template(template)
+        snapshot = self.template_snapshots.get(template["id"], template.get("version", 0))
+        if snapshot is None:
+            snapshot = compile_template(template)
+            self.template_snapshots.put(snapshot)
+        return snapshot
+
+    async def generate_bulk(
+        self,
+        company_id: str,
+        date_from: Date,
+        date_to: Date,
+        branch_ids: Optional[List[str]] = None,
+    ) -> dict:
+        """Generate every missing checklist of the company's active templates for a date range.
+
+        A template applies to its branch, else to its brand's branches, else to
+        every branch of the company, on the days its recurrence selects. Runs
+        are idempotent: existing checklists are skipped.
+        """
+        templates = await self.template_repo.list_active_templates(company_id)
+        branches = await self.org_repo.list_company_branches(company_id)
+        if branch_ids is not None:
+            wanted = set(branch_ids)
+            branches = [b for b in branches if b.id in wanted]
+
+        existing = {
+            (row["template_id"], row["branch_id"], str(row["date"]))
+            for row in await self.checklist_repo.list_existing_keys(
+                [t["id"] for t in templates], date_from.isoformat(), date_to.isoformat()
+            )
+        }
+
+        rows = []
+        planned = 0
+        for template in templates:
+            targets = [
+                b.id for b in branches
+                if (template.get("branch_id") or b.id) == b.id
+                and (template.get("brand_id") or b.brand_id) == b.brand_id
+            ]
+            run_days = [d.isoformat() for d in _run_days(template, date_from, date_to)]
+            if not targets or not run_days:
+                continue
+            snapshot = self._compiled(template)
+            for branch_id in targets:
+                for day in run_days:
+                    planned += 1
+                    if (template["id"], branch_id, day) in existing:
+                        continue
+                    rows.append({
+                        "template_id": template["id"],
+                        "branch_id": branch_id,
+                        "date": day,
+                        "checklist_data": snapshot.checklist_data(),
+                        "group_ids": snapshot.group_ids,
+                    })
+
+        created = await self.checklist_repo.create_many(rows) if rows else 0
+        return {"planned": planned, "created": created, "skipped": planned - created}
+
     async def update_checklist_item(
         self,
         checklist_id: str,
@@ -66,19 +169,38 @@ class DailyChecklistService:
         user_id: str,
         is_completed: bool,
         verification_data: Optional[str] = None,
+        expected_version: Optional[int] = None,
     ) -> dict:
-        checklist = await self.checklist_repo.get_by_id(checklist_id)
-        if not checklist:
-            raise ValueError("Checklist not found.")
+        """Patch one item in a single atomic update; returns the item and the checklist's new version.
 
-        items = checklist["checklist_data"]
-        if item_index < 0 or item_index >= len(items):
+        With expected_version, the update only applies if nobody has changed
+        the checklist since; otherwise ChecklistVersionConflict is raised.
+        """
+        result = await self.checklist_repo.update_item(
+            checklist_id,
+            item_index,
+            user_id=user_id,
+            is_completed=is_completed,
+            verification_data=verification_data,
+            expected_version=expected_version,
+        )
+        status = result["status"]
+        if status == "not_found":
+            raise ValueError("Checklist not found.")
+        if status == "invalid_index":
             raise ValueError(f"Invalid item index: {item_index}")
+        if status == "version_conflict":
+            raise ChecklistVersionConflict(result["version"])
+        return {"item_index": result["item_index"], "item": result["item"], "version": result["version"]}
 
-        items[item_index]["is_completed"] = is_completed
-        items[item_index]["completed_by"] = user_id if is_completed else None
-        items[item_index]["completed_at"] = datetime.utcnow().isoformat() if is_completed else None
-        if verification_data:
-            items[item_index]["verification_data"] = verification_data
+    async def update_checklist_items(self, checklist_id: str, user_id: str, changes: List[dict]) -> dict:
+        """Apply a batch of item changes atomically.
 
-        return await self.checklist_repo.update_checklist_data(checklist_id, items)
+        Each change is reported as applied, unchanged, conflict (the item was
+        changed by someone else since ``base_completed``) or invalid_index;
+        conflicting changes are skipped and the rest still apply.
+        """
+        result = await self.checklist_repo.update_items(checklist_id, user_id, changes)
+        if result["status"] == "not_found":
+            raise ValueError("Checklist not found.")
+        return {"version": result["version"], "items": result["items"]}
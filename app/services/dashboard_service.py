@@ -1,9 +1,9 @@
+import asyncio
 from typing import List, Optional
 from app.repositories.assignment import IAssignmentRepository
 from app.repositories.feedback_notice import INoticeRepository
 from app.repositories.daily_checklist import IDailyChecklistRepository
-from app.models.enums import AssignmentStatus, Priority
-from datetime import date
+from app.core.cache import StatsTTLCache
 
 
 class DashboardService:
@@ -12,38 +12,43 @@ class DashboardService:
         assignment_repo: IAssignmentRepository,
         notice_repo: INoticeRepository,
         checklist_repo: IDailyChecklistRepository,
+        urgent_alert_limit: int = 10,
+        summary_cache: Optional[StatsTTLCache] = None,
+        notice_cache: Optional[StatsTTLCache] = None,
     ):
         self.assignment_repo = assignment_repo
         self.notice_repo = notice_repo
         self.checklist_repo = checklist_repo
+        self.urgent_alert_limit = urgent_alert_limit
+        # Keyed by (user_id, company_id) and company_id; AssignmentService and
+        # NoticeService invalidate them on writes.
+        self.summary_cache = summary_cache
+        self.notice_cache = notice_cache
 
     async def get_summary(self, user_id: str, company_id: str) -> dict:
-        # 1. Assignment summary
-        assignments = await self.assignment_repo.list_by_assignee(user_id, company_id)
+        # Counts and urgent alerts are aggregated in the database; notices load alongside.
+        summary, notices = await asyncio.gather(
+            self._assignee_summary(user_id, company_id),
+            self._recent_notices(company_id),
+        )
 
-        total = len(assignments)
-        done = sum(1 for a in assignments if a.get("status") == AssignmentStatus.DONE.value)
-        in_progress = sum(1 for a in assignments if a.get("status") == AssignmentStatus.IN_PROGRESS.value)
-        todo = sum(1 for a in assignments if a.get("status") == AssignmentStatus.TODO.value)
+        # 1. Assignment summary
+        total = summary["total_assignments"]
+        done = summary["completed"]
         completion_rate = round(done / total * 100, 1) if total > 0 else 0
 
         assignment_summary = {
             "total_assignments": total,
             "completed": done,
-            "in_progress": in_progress,
-            "todo": todo,
+            "in_progress": summary["in_progress"],
+            "todo": summary["todo"],
             "completion_rate": completion_rate,
         }
 
-        # 2. Urgent alerts
-        urgent_alerts = [
-            {"id": a["id"], "title": a["title"], "due_date": a.get("due_date")}
-            for a in assignments
-            if a.get("priority") == Priority.URGENT.value and a.get("status") != AssignmentStatus.DONE.value
-        ]
+        # 2. Urgent alerts (open, urgent; soonest due first)
+        urgent_alerts = summary["urgent_alerts"]
 
         # 3. Recent notices
-        notices = await self.notice_repo.list_notices(company_id, limit=5)
         recent_notices = [
             {"id": n["id"], "title": n["title"], "created_at": n["created_at"]}
             for n in notices
@@ -54,3 +59,26 @@ class DashboardService:
             "urgent_alerts": urgent_alerts,
             "recent_notices": recent_notices,
         }
+
+    async def _assignee_summary(self, user_id: str, company_id: str) -> dict:
+        key = (user_id, company_id)
+        if self.summary_cache is not None:
+            cached = self.summary_cache.get(key)
+            if cached is not None:
+                return cached
+        summary = await self.assignment_repo.get_assignee_summary(
+            user_id, company_id, urgent_limit=self.urgent_alert_limit
+        )
+        if self.summary_cache is not None:
+            self.summary_cache.set(key, summary)
+        return summary
+
+    async def _recent_notices(self, company_id: str) -> List[dict]:
+        if self.notice_cache is not None:
+            cached = self.notice_cache.get(company_id)
+            if cached is not None:
+                return cached
+        notices = await self.notice_repo.list_notices(company_id, limit=5)
+        if self.notice_cache is not None:
+            self.notice_cache.set(company_id, notices)
+        return notices
@@ -1,11 +1,14 @@
 from typing import List, Optional
 from app.repositories.feedback_notice import INoticeRepository
 from app.schemas.notice import NoticeCreate
+from app.core.cache import StatsTTLCache
 
 
 class NoticeService:
-    def __init__(self, notice_repo: INoticeRepository):
+    def __init__(self, notice_repo: INoticeRepository, dashboard_notice_cache: Optional[StatsTTLCache] = None):
         self.notice_repo = notice_repo
+        # DashboardService's per-company recent-notices cache.
+        self.dashboard_notice_cache = dashboard_notice_cache
 
     async def list_notices(self, company_id: str, limit: Optional[int] = None) -> List[dict]:
         return await self.notice_repo.list_notices(company_id, limit=limit)
@@ -35,10 +38,25 @@ class NoticeService:
         }
         if body.branch_id:
             data["branch_id"] = body.branch_id
-        return await self.notice_repo.create_notice(data)
+        notice = await self.notice_repo.create_notice(data)
+        self._invalidate_dashboard(company_id)
+        return notice
 
     async def update_notice(self, notice_id: str, data: dict) -> dict:
-        return await self.notice_repo.update_notice(notice_id, data)
+        notice = await self.notice_repo.update_notice(notice_id, data)
+        if notice:
+            self._invalidate_dashboard(notice.get("company_id"))
+        return notice
 
     async def delete_notice(self, notice_id: str) -> bool:
-        return await self.notice_repo.delete_notice(notice_id)
+        notice = None
+        if self.dashboard_notice_cache is not None:
+            notice = await self.notice_repo.get_notice(notice_id)
+        deleted = await self.notice_repo.delete_notice(notice_id)
+        if notice:
+            self._invalidate_dashboard(notice.get("company_id"))
+        return deleted
+
+    def _invalidate_dashboard(self, company_id: Optional[str]) -> None:
+        if self.dashboard_notice_cache is not None and company_id:
+            self.dashboard_notice_cache.invalidate(company_id)
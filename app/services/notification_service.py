@@ -1,9 +1,12 @@
 import logging
-from typing import Optional
+from typing import List, Optional
 
 from app.repositories.notification import INotificationRepository
 from app.repositories.auth import IAuthRepository
 from app.notifications.dispatcher import NotificationDispatcher
+from app.notifications.hub import NotificationHub
+from app.core.cache import StatsTTLCache
+from app.core.pagination import split_page
 from app.schemas.notification import Notification, NotificationListResponse
 
 logger = logging.getLogger(__name__)
@@ -15,10 +18,29 @@ class NotificationService:
         notification_repo: INotificationRepository,
         auth_repo: IAuthRepository,
         dispatcher: NotificationDispatcher,
+        use_outbox: bool = False,
+        hub: Optional[NotificationHub] = None,
+        unread_cache: Optional[StatsTTLCache] = None,
     ):
         self.notification_repo = notification_repo
         self.auth_repo = auth_repo
         self.dispatcher = dispatcher
+        self.use_outbox = use_outbox
+        self.hub = hub
+        self.unread_cache = unread_cache
+
+    def _publish(self, rows: List[dict]) -> None:
+        """Push new notifications to this user's open streams."""
+        if self.unread_cache is not None:
+            for row in rows:
+                self.unread_cache.invalidate((row["user_id"], row["company_id"]))
+        if not self.hub:
+            return
+        for row in rows:
+            try:
+                self.hub.publish(row["user_id"], Notification(**row).model_dump(mode="json"))
+            except Exception as e:
+                logger.error(f"Notification publish failed: {e}")
 
     async def notify(
         self,
@@ -30,9 +52,12 @@ class NotificationService:
         reference_id: Optional[str] = None,
         reference_type: Optional[str] = None,
     ) -> None:
-        """Create in-app notification + dispatch to external channels."""
-        # 1. Create DB record (in-app notification)
-        await self.notification_repo.create({
+        """Create in-app notification + dispatch to external channels.
+
+        With the outbox enabled, only the notification and its dispatch job
+        are written here; OutboxWorker delivers to external channels.
+        """
+        data = {
             "company_id": company_id,
             "user_id": user_id,
             "type": notification_type,
@@ -40,7 +65,15 @@ class NotificationService:
             "message": message,
             "reference_id": reference_id,
             "reference_type": reference_type,
-        })
+        }
+        if self.use_outbox:
+            row = await self.notification_repo.create_with_outbox(data)
+            self._publish([row])
+            return
+
+        # 1. Create DB record (in-app notification)
+        row = await self.notification_repo.create(data)
+        self._publish([row])
 
         # 2. Look up recipient email
         user = await self.auth_repo.get_user_by_id(user_id)
@@ -59,17 +92,95 @@ class NotificationService:
         except Exception as e:
             logger.error(f"Notification dispatch failed: {e}")
 
-    async def get_notifications(self, user_id: str, company_id: str) -> NotificationListResponse:
-        notifications_data = await self.notification_repo.list_by_user(user_id, company_id)
-        unread_count = await self.notification_repo.count_unread(user_id, company_id)
+    async def notify_many(
+        self,
+        company_id: str,
+        user_ids: List[str],
+        notification_type: str,
+        title: str,
+        message: str,
+        reference_id: Optional[str] = None,
+        reference_type: Optional[str] = None,
+    ) -> None:
+        """Notify several users with one bulk insert, one email lookup and one grouped dispatch."""
+        user_ids = list(dict.fromkeys(uid for uid in user_ids if uid))
+        if not user_ids:
+            return
+
+        rows = [
+            {
+                "company_id": company_id,
+                "user_id": uid,
+                "type": notification_type,
+                "title": title,
+                "message": message,
+                "reference_id": reference_id,
+                "reference_type": reference_type,
+            }
+            for uid in user_ids
+        ]
+        if self.use_outbox:
+            created = await self.notification_repo.create_many_with_outbox(rows)
+            self._publish(created)
+            return
+
+        created = await self.notification_repo.create_many(rows)
+        self._publish(created)
+
+        emails = await self.auth_repo.get_emails_by_ids(user_ids)
+        missing = [uid for uid in user_ids if uid not in emails]
+        if missing:
+            logger.warning(f"No email found for users {missing}, skipping dispatch")
+        if not emails:
+            return
+
+        try:
+            await self.dispatcher.dispatch_many(
+                recipient_emails=list(emails.values()),
+                title=title,
+                message=message,
+                context={"reference_id": reference_id, "reference_type": reference_type},
+            )
+        except Exception as e:
+            logger.error(f"Notification dispatch failed: {e}")
+
+    async def get_notifications(
+        self, user_id: str, company_id: str, limit: int = 50, cursor: Optional[str] = None
+    ) -> NotificationListResponse:
+        rows = await self.notification_repo.list_by_user(user_id, company_id, limit=limit, cursor=cursor)
+        notifications_data, next_cursor = split_page(rows, limit)
+        unread_count = await self.count_unread(user_id, company_id)
         notifications = [Notification(**n) for n in notifications_data]
         return NotificationListResponse(
             unread_count=unread_count,
             notifications=notifications,
+            next_cursor=next_cursor,
         )
 
+    async def list_since(self, user_id: str, company_id: str, last_id: str, limit: int = 100) -> List[Notification]:
+        """Notifications created after `last_id`, oldest first (stream resume)."""
+        rows = await self.notification_repo.list_after(user_id, company_id, last_id, limit)
+        return [Notification(**n) for n in rows]
+
+    async def count_unread(self, user_id: str, company_id: str) -> int:
+        key = (user_id, company_id)
+        if self.unread_cache is not None:
+            cached = self.unread_cache.get(key)
+            if cached is not None:
+                return cached
+        count = await self.notification_repo.count_unread(user_id, company_id)
+        if self.unread_cache is not None:
+            self.unread_cache.set(key, count)
+        return count
+
     async def mark_as_read(self, notification_id: str, user_id: str) -> dict:
-        return await self.notification_repo.mark_as_read(notification_id, user_id)
+        result = await self.notification_repo.mark_as_read(notification_id, user_id)
+        if self.unread_cache is not None and result:
+            self.unread_cache.invalidate((user_id, result["company_id"]))
+        return result
 
     async def mark_all_as_read(self, user_id: str, company_id: str) -> int:
-        return await self.notification_repo.mark_all_as_read(user_id, company_id)
+        count = await self.notification_repo.mark_all_as_read(user_id, company_id)
+        if self.unread_cache is not None:
+            self.unread_cache.set((user_id, company_id), 0)
+        return count
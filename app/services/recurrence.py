@@ -0,0 +1,158 @@
+"""Recurrence rules of checklist templates and recurring assignments.
+
+The documented ``recurrence`` format (docs/DB_SPECIFICATION_V2.md §4.10):
+
+    {"type": "daily"}
+    {"type": "weekly", "days": [1, 3, 5]}       # ISO weekdays, Monday is 1
+    {"type": "weekend"}
+    {"type": "weekday"}
+    {"type": "interval", "every": 3}            # every 3 days from the anchor
+
+Extensions: ``weekly`` takes an optional ``every`` (every N weeks),
+``{"type": "monthly", "days_of_month": [1, 15], "every": 1}`` repeats on
+days of the month (days past the end of a month are skipped), and any rule
+may carry ``until`` (ISO date) to end the series.
+
+``every`` counts from the anchor: an assignment series' first due date, or
+a template's creation date. Occurrences are computed arithmetically from
+the anchor, so the cost of a window depends on the window's length, not on
+how old the series is.
+"""
+import calendar
+from datetime import date as Date, timedelta
+from typing import Iterator, List, Optional, Tuple
+
+TYPES = ("daily", "weekly", "weekend", "weekday", "interval", "monthly")
+
+_FIXED_DAYS = {"weekend": (6, 7), "weekday": (1, 2, 3, 4, 5)}
+
+
+class InvalidRecurrence(ValueError):
+    pass
+
+
+class RecurrenceRule:
+    __slots__ = ("type", "days", "every", "days_of_month", "until")
+
+    def __init__(
+        self,
+        type: str,
+        days: Tuple[int, ...] = (),
+        every: int = 1,
+        days_of_month: Tuple[int, ...] = (),
+        until: Optional[Date] = None,
+    ):
+        self.type = type
+        self.days = days
+        self.every = every
+        self.days_of_month = days_of_month
+        self.until = until
+
+    @property
+    def needs_anchor(self) -> bool:
+        """Whether occurrences depend on where the series starts."""
+        return self.type == "interval" or self.every > 1
+
+    def to_dict(self) -> dict:
+        """Canonical (documented) form stored in ``recurrence``."""
+        rule = {"type": self.type}
+        if self.type == "weekly":
+            rule["days"] = list(self.days)
+        elif self.type == "monthly":
+            rule["days_of_month"] = list(self.days_of_month)
+        if self.type == "interval" or self.every > 1:
+            rule["every"] = self.every
+        if self.until:
+            rule["until"] = self.until.isoformat()
+        return rule
+
+    def occurrences(self, anchor: Date, start: Date, end: Date) -> List[Date]:
+        """Occurrence dates within ``start..end`` (inclusive) of a series anchored at ``anchor``."""
+        start = max(start, anchor)
+        if self.until and self.until < end:
+            end = self.until
+        if start > end:
+            return []
+        if self.type in ("daily", "interval"):
+            return list(self._stepped(anchor, start, end))
+        if self.type == "monthly":
+            return list(self._monthly(anchor, start, end))
+        return list(self._weekly(anchor, start, end))
+
+    def _stepped(self, anchor: Date, start: Date, end: Date) -> Iterator[Date]:
+        offset = -(-(start - anchor).days // self.every) * self.every
+        day = anchor + timedelta(days=offset)
+        step = timedelta(days=self.every)
+        while day <= end:
+            yield day
+            day += step
+
+    def _weekly(self, anchor: Date, start: Date, end: Date) -> Iterator[Date]:
+        anchor_week = anchor - timedelta(days=anchor.weekday())
+        weeks = (start - anchor_week).days // 7
+        week = anchor_week + timedelta(weeks=weeks - weeks % self.every)
+        step = timedelta(weeks=self.every)
+        while week <= end:
+            for iso_day in self.days:
+                day = week + timedelta(days=iso_day - 1)
+                if start <= day <= end:
+                    yield day
+            week += step
+
+    def _monthly(self, anchor: Date, start: Date, end: Date) -> Iterator[Date]:
+        anchor_month = anchor.year * 12 + anchor.month - 1
+        months = start.year * 12 + start.month - 1 - anchor_month
+        month = anchor_month + months - months % self.every
+        last = end.year * 12 + end.month - 1
+        while month <= last:
+            year, month0 = divmod(month, 12)
+            length = calendar.monthrange(year, month0 + 1)[1]
+            for day_of_month in self.days_of_month:
+                if day_of_month <= length:
+                    day = Date(year, month0 + 1, day_of_month)
+                    if start <= day <= end:
+                        yield day
+            month += self.every
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _int_list(raw: dict, key: str, low: int, high: int) -> Tuple[int, ...]:
+    values = raw.get(key)
+    if not isinstance(values, list) or not values or not all(
+        _is_int(v) and low <= v <= high for v in values
+    ):
+        raise InvalidRecurrence(f"{key} must be a non-empty list of integers between {low} and {high}.")
+    return tuple(sorted(set(values)))
+
+
+def parse_recurrence(raw: dict) -> RecurrenceRule:
+    """Validate a stored or submitted rule; raises InvalidRecurrence."""
+    if not isinstance(raw, dict):
+        raise InvalidRecurrence("recurrence must be an object.")
+    kind = raw.get("type")
+    if kind not in TYPES:
+        raise InvalidRecurrence(f"recurrence type must be one of: {', '.join(TYPES)}.")
+
+    every = 1
+    if kind in ("weekly", "interval", "monthly"):
+        every = raw.get("every", None if kind == "interval" else 1)
+        if not _is_int(every) or not 1 <= every <= 366:
+            raise InvalidRecurrence("every must be an integer between 1 and 366.")
+
+    until = raw.get("until")
+    if until is not None:
+        try:
+            until = Date.fromisoformat(until)
+        except (TypeError, ValueError):
+            raise InvalidRecurrence("until must be an ISO date.")
+
+    return RecurrenceRule(
+        kind,
+        days=_int_list(raw, "days", 1, 7) if kind == "weekly" else _FIXED_DAYS.get(kind, ()),
+        every=every,
+        days_of_month=_int_list(raw, "days_of_month", 1, 31) if kind == "monthly" else (),
+        until=until,
+    )
@@ -0,0 +1,89 @@
+"""Compiled checklist template snapshots, cached by (template id, version).
+
+A snapshot holds the prototype checklist_data of a template version, so
+generating a checklist is a copy of a precompiled list instead of a
+template fetch plus a rebuild. ``checklist_templates.version`` changes
+with every edit to a template, its items or groups (migration 014), so a
+cached snapshot is only used while its version is current.
+"""
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+
+class TemplateSnapshot:
+    __slots__ = ("template_id", "version", "items", "group_ids")
+
+    def __init__(self, template_id: str, version: int, items: Tuple[dict, ...], group_ids: Optional[List[str]]):
+        self.template_id = template_id
+        self.version = version
+        self.items = items
+        self.group_ids = group_ids
+
+    def checklist_data(self) -> List[dict]:
+        """Fresh checklist_data; item values are scalars, so a shallow copy per item suffices."""
+        return [dict(item) for item in self.items]
+
+
+def compile_template(template: dict) -> TemplateSnapshot:
+    items = sorted(template.get("items") or [], key=lambda item: item.get("sort_order", 0))
+    prototype = tuple(
+        {
+            "item_id": item["id"],
+            "content": item["content"],
+            "verification_type": item.get("verification_type", "none"),
+            "is_completed": False,
+            "completed_by": None,
+            "completed_at": None,
+            "verification_data": None,
+        }
+        for item in items
+    )
+    group_ids = [g["group_id"] for g in template.get("groups") or []] or None
+    return TemplateSnapshot(template["id"], template.get("version", 0), prototype, group_ids)
+
+
+class TemplateSnapshotCache:
+    """In-process LRU of the latest compiled snapshot per template."""
+
+    def __init__(self, maxsize: int = 1000):
+        self.maxsize = maxsize
+        self._snapshots: "OrderedDict[str, TemplateSnapshot]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, template_id: str, version: int) -> Optional[TemplateSnapshot]:
+        snapshot = self._snapshots.get(template_id)
+        if snapshot is None or snapshot.version != version:
+            self.misses += 1
+            return None
+        self._snapshots.move_to_end(template_id)
+        self.hits += 1
+        return snapshot
+
+    def put(self, snapshot: TemplateSnapshot) -> None:
+        current = self._snapshots.get(snapshot.template_id)
+        if current is not None and current.version > snapshot.version:
+            return
+        self._snapshots[snapshot.template_id] = snapshot
+        self._snapshots.move_to_end(snapshot.template_id)
+        while len(self._snapshots) > self.maxsize:
+            self._snapshots.popitem(last=False)
+
+    def invalidate(self, template_id: str) -> None:
+        self._snapshots.pop(template_id, None)
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._snapshots),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
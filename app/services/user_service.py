@@ -1,27 +1,42 @@
 from typing import Optional
 from app.repositories.user import SupabaseUserRepository
 from app.repositories.auth import IAuthRepository
-from app.core.password import hash_password, verify_password
+from app.core.cache import StatsTTLCache
+from app.core.token_version import TokenVersionStore
+from app.core.password import hash_password_async, verify_password_async
 from app.schemas.user import User
 
 
 class UserService:
-    def __init__(self, user_repo: SupabaseUserRepository, auth_repo: IAuthRepository):
+    def __init__(
+        self,
+        user_repo: SupabaseUserRepository,
+        auth_repo: IAuthRepository,
+        user_cache: Optional[StatsTTLCache] = None,
+        token_versions: Optional[TokenVersionStore] = None,
+    ):
         self.user_repo = user_repo
         self.auth_repo = auth_repo
+        self.user_cache = user_cache
+        self.token_versions = token_versions
 
     async def get_profile(self, user_id: str) -> Optional[User]:
         return await self.user_repo.get_by_id(user_id)
 
     async def update_profile(self, user_id: str, data: dict) -> User:
-        return await self.user_repo.update(user_id, data)
+        user = await self.user_repo.update(user_id, data)
+        if self.user_cache is not None:
+            self.user_cache.invalidate(user_id)
+        if self.token_versions and "status" in data:
+            await self.token_versions.bump(user_id)
+        return user
 
     async def change_password(self, user_id: str, current_password: str, new_password: str) -> dict:
         user_data = await self.auth_repo.get_user_by_id(user_id)
         if not user_data or not user_data.get("password_hash"):
             raise Exception("User not found.")
-        if not verify_password(current_password, user_data["password_hash"]):
+        if not await verify_password_async(current_password, user_data["password_hash"]):
             raise Exception("Current password is incorrect.")
-        new_hash = hash_password(new_password)
+        new_hash = await hash_password_async(new_password)
         await self.auth_repo.update_password(user_id, new_hash)
         return {"message": "Password changed successfully."}
@@ -0,0 +1,51 @@
+"""Email template rendering benchmark.
+
+Compares the old read-file-and-str.replace rendering with the cached,
+precompiled renderer for the verification, reset and notification
+templates.
+
+    python -m benchmarks.email_templates [iterations]
+"""
+import sys
+import time
+
+from app.core.email import TEMPLATE_DIR, templates
+
+CASES = {
+    "verify_email.html": {"code": "123456", "expire_minutes": 10, "app_name": "TaskManager"},
+    "reset_password.html": {"code": "654321", "expire_minutes": 10, "app_name": "TaskManager"},
+    "notification_email.html": {
+        "title": "New comment on <Opening checklist>",
+        "message": "Alex commented: \"Fridge temp logged & signed.\"",
+        "app_name": "TaskManager",
+    },
+}
+
+
+def _legacy_render(name: str, **kwargs) -> str:
+    html = (TEMPLATE_DIR / name).read_text(encoding="utf-8")
+    for key, value in kwargs.items():
+        html = html.replace(f"{{{{{key}}}}}", str(value))
+    return html
+
+
+def _time(fn, name: str, kwargs: dict, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(name, **kwargs)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    templates.preload()
+
+    print(f"{'template':<26}{'legacy us':>12}{'compiled us':>14}{'speedup':>10}")
+    for name, kwargs in CASES.items():
+        legacy = _time(_legacy_render, name, kwargs, iterations)
+        compiled = _time(templates.render, name, kwargs, iterations)
+        print(f"{name:<26}{legacy:>12.2f}{compiled:>14.2f}{legacy / compiled:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
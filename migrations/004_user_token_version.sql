@@ -0,0 +1,17 @@
+-- ============================================================
+-- Migration 004: Per-user access token version
+-- Stateless access tokens (JWT_STATELESS_ACCESS_TOKENS) embed role,
+-- company_id, status and token_version. Bumping token_version revokes
+-- every access token issued before the bump.
+-- ============================================================
+
+ALTER TABLE users
+    ADD COLUMN token_version integer NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION bump_user_token_version(p_user_id uuid)
+RETURNS integer AS $$
+    UPDATE users
+       SET token_version = token_version + 1
+     WHERE id = p_user_id
+    RETURNING token_version;
+$$ LANGUAGE sql;
@@ -0,0 +1,80 @@
+-- ============================================================
+-- Migration 005: Notification outbox
+-- notify() writes the in-app notification and its dispatch job in one
+-- transaction; the outbox worker delivers jobs to external channels
+-- (email, ...) with retries and backoff.
+-- ============================================================
+
+CREATE TABLE notification_outbox (
+    id              uuid        PRIMARY KEY DEFAULT gen_random_uuid(),
+    notification_id uuid        NOT NULL REFERENCES notifications(id) ON DELETE CASCADE,
+    company_id      uuid        NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+    user_id         uuid        NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    title           varchar     NOT NULL,
+    message         text        NOT NULL,
+    context         jsonb       NOT NULL DEFAULT '{}'::jsonb,
+    status          varchar     NOT NULL DEFAULT 'pending',
+    attempts        integer     NOT NULL DEFAULT 0,
+    next_attempt_at timestamptz NOT NULL DEFAULT now(),
+    locked_until    timestamptz,
+    last_error      text,
+    created_at      timestamptz NOT NULL DEFAULT now(),
+    updated_at      timestamptz NOT NULL DEFAULT now(),
+
+    CONSTRAINT chk_notification_outbox_status CHECK (status IN ('pending', 'processing', 'sent', 'failed', 'skipped'))
+);
+
+CREATE INDEX idx_notification_outbox_due ON notification_outbox(next_attempt_at)
+    WHERE status IN ('pending', 'processing');
+
+
+-- Insert a notification and its outbox job atomically; returns the notification row.
+CREATE OR REPLACE FUNCTION create_notification_with_outbox(p_notification jsonb)
+RETURNS SETOF notifications AS $$
+DECLARE
+    v_row notifications;
+BEGIN
+    INSERT INTO notifications (company_id, user_id, type, title, message, reference_id, reference_type)
+    VALUES (
+        (p_notification->>'company_id')::uuid,
+        (p_notification->>'user_id')::uuid,
+        p_notification->>'type',
+        p_notification->>'title',
+        p_notification->>'message',
+        (p_notification->>'reference_id')::uuid,
+        p_notification->>'reference_type'
+    )
+    RETURNING * INTO v_row;
+
+    INSERT INTO notification_outbox (notification_id, company_id, user_id, title, message, context)
+    VALUES (
+        v_row.id, v_row.company_id, v_row.user_id, v_row.title, v_row.message,
+        jsonb_build_object('reference_id', v_row.reference_id, 'reference_type', v_row.reference_type)
+    );
+
+    RETURN NEXT v_row;
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- Lease up to p_limit due jobs to one worker. Jobs whose lease expired
+-- (worker crashed mid-dispatch) are claimed again. SKIP LOCKED lets
+-- several workers drain the outbox concurrently.
+CREATE OR REPLACE FUNCTION claim_notification_outbox(p_limit integer, p_lease_seconds integer)
+RETURNS SETOF notification_outbox AS $$
+    UPDATE notification_outbox o
+       SET status = 'processing',
+           attempts = o.attempts + 1,
+           locked_until = now() + make_interval(secs => p_lease_seconds),
+           updated_at = now()
+     WHERE o.id IN (
+        SELECT id
+          FROM notification_outbox
+         WHERE (status = 'pending' AND next_attempt_at <= now())
+            OR (status = 'processing' AND locked_until < now())
+         ORDER BY next_attempt_at
+         LIMIT p_limit
+           FOR UPDATE SKIP LOCKED
+     )
+    RETURNING o.*;
+$$ LANGUAGE sql;
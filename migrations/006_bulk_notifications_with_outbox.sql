@@ -0,0 +1,30 @@
+-- ============================================================
+-- Migration 006: Bulk notification insert with outbox jobs
+-- notify_many() writes N notifications and their N outbox jobs in a
+-- single round trip and transaction.
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION create_notifications_with_outbox(p_notifications jsonb)
+RETURNS SETOF notifications AS $$
+BEGIN
+    RETURN QUERY
+    WITH inserted AS (
+        INSERT INTO notifications (company_id, user_id, type, title, message, reference_id, reference_type)
+        SELECT (n->>'company_id')::uuid,
+               (n->>'user_id')::uuid,
+               n->>'type',
+               n->>'title',
+               n->>'message',
+               (n->>'reference_id')::uuid,
+               n->>'reference_type'
+          FROM jsonb_array_elements(p_notifications) AS n
+        RETURNING *
+    ), jobs AS (
+        INSERT INTO notification_outbox (notification_id, company_id, user_id, title, message, context)
+        SELECT i.id, i.company_id, i.user_id, i.title, i.message,
+               jsonb_build_object('reference_id', i.reference_id, 'reference_type', i.reference_type)
+          FROM inserted i
+    )
+    SELECT * FROM inserted;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,125 @@
+-- ============================================================
+-- Migration 007: Incrementally maintained unread-notification counters
+-- Statement-level triggers keep one counter row per (user, company) in
+-- step with inserts, is_read changes and deletes on notifications, so
+-- count_unread is a primary-key lookup instead of a count(*).
+-- reconcile_notification_unread_counters() repairs any drift.
+-- ============================================================
+
+CREATE TABLE notification_unread_counters (
+    user_id         uuid        NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    company_id      uuid        NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+    unread_count    integer     NOT NULL DEFAULT 0,
+    updated_at      timestamptz NOT NULL DEFAULT now(),
+
+    PRIMARY KEY (user_id, company_id)
+);
+
+
+-- Counter rows are created by the first unread insert, so updates and
+-- deletes only ever adjust existing rows.
+CREATE OR REPLACE FUNCTION notifications_unread_after_insert()
+RETURNS trigger AS $$
+BEGIN
+    INSERT INTO notification_unread_counters AS c (user_id, company_id, unread_count)
+    SELECT user_id, company_id, count(*)
+      FROM new_rows
+     WHERE NOT is_read
+     GROUP BY user_id, company_id
+    ON CONFLICT (user_id, company_id) DO UPDATE
+       SET unread_count = c.unread_count + EXCLUDED.unread_count,
+           updated_at = now();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION notifications_unread_after_update()
+RETURNS trigger AS $$
+BEGIN
+    INSERT INTO notification_unread_counters AS c (user_id, company_id, unread_count)
+    SELECT n.user_id, n.company_id, sum(CASE WHEN n.is_read THEN -1 ELSE 1 END)
+      FROM new_rows n
+      JOIN old_rows o ON o.id = n.id
+     WHERE o.is_read IS DISTINCT FROM n.is_read
+     GROUP BY n.user_id, n.company_id
+    ON CONFLICT (user_id, company_id) DO UPDATE
+       SET unread_count = greatest(c.unread_count + EXCLUDED.unread_count, 0),
+           updated_at = now();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION notifications_unread_after_delete()
+RETURNS trigger AS $$
+BEGIN
+    UPDATE notification_unread_counters c
+       SET unread_count = greatest(c.unread_count - d.removed, 0),
+           updated_at = now()
+      FROM (
+        SELECT user_id, company_id, count(*) AS removed
+          FROM old_rows
+         WHERE NOT is_read
+         GROUP BY user_id, company_id
+      ) d
+     WHERE c.user_id = d.user_id AND c.company_id = d.company_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_notifications_unread_insert
+    AFTER INSERT ON notifications
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notifications_unread_after_insert();
+
+CREATE TRIGGER trg_notifications_unread_update
+    AFTER UPDATE ON notifications
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notifications_unread_after_update();
+
+CREATE TRIGGER trg_notifications_unread_delete
+    AFTER DELETE ON notifications
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notifications_unread_after_delete();
+
+
+-- Recompute every counter from notifications; returns the number of rows corrected.
+CREATE OR REPLACE FUNCTION reconcile_notification_unread_counters()
+RETURNS integer AS $$
+DECLARE
+    v_fixed integer;
+    v_zeroed integer;
+BEGIN
+    WITH actual AS (
+        SELECT user_id, company_id, count(*) FILTER (WHERE NOT is_read) AS unread
+          FROM notifications
+         GROUP BY user_id, company_id
+    ), fixed AS (
+        INSERT INTO notification_unread_counters AS c (user_id, company_id, unread_count)
+        SELECT user_id, company_id, unread FROM actual
+        ON CONFLICT (user_id, company_id) DO UPDATE
+           SET unread_count = EXCLUDED.unread_count, updated_at = now()
+         WHERE c.unread_count IS DISTINCT FROM EXCLUDED.unread_count
+        RETURNING 1
+    )
+    SELECT count(*) INTO v_fixed FROM fixed;
+
+    -- Counters whose notifications are all gone.
+    WITH zeroed AS (
+        UPDATE notification_unread_counters c
+           SET unread_count = 0, updated_at = now()
+         WHERE c.unread_count <> 0
+           AND NOT EXISTS (
+            SELECT 1 FROM notifications n
+             WHERE n.user_id = c.user_id AND n.company_id = c.company_id
+           )
+        RETURNING 1
+    )
+    SELECT count(*) INTO v_zeroed FROM zeroed;
+
+    RETURN v_fixed + v_zeroed;
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- Backfill.
+SELECT reconcile_notification_unread_counters();
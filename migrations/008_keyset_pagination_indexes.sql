@@ -0,0 +1,9 @@
+-- ============================================================
+-- Migration 008: Keyset pagination indexes
+-- List endpoints page on (created_at, id) within their filter column,
+-- so each page is a single index range scan.
+-- ============================================================
+
+CREATE INDEX idx_notifications_user_keyset ON notifications(user_id, company_id, created_at DESC, id DESC);
+CREATE INDEX idx_comments_assignment_keyset ON comments(assignment_id, created_at, id);
+CREATE INDEX idx_feedbacks_company_keyset ON feedbacks(company_id, created_at DESC, id DESC);
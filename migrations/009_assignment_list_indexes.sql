@@ -0,0 +1,14 @@
+-- ============================================================
+-- Migration 009: Assignment listing indexes
+-- GET /assignments pages on (created_at, id) within a company and
+-- filters by status/priority and a due-date range. The composite
+-- indexes lead with company_id, which makes the single-column
+-- company_id index redundant; status alone is too unselective to keep.
+-- ============================================================
+
+CREATE INDEX idx_assignments_company_keyset ON assignments(company_id, created_at DESC, id DESC);
+CREATE INDEX idx_assignments_company_status_due ON assignments(company_id, status, due_date);
+CREATE INDEX idx_assignments_company_priority_keyset ON assignments(company_id, priority, created_at DESC, id DESC);
+
+DROP INDEX IF EXISTS idx_assignments_company_id;
+DROP INDEX IF EXISTS idx_assignments_status;
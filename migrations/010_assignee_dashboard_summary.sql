@@ -0,0 +1,40 @@
+-- ============================================================
+-- Migration 010: Server-side dashboard assignment summary
+-- get_assignee_dashboard_summary() returns a user's assignment status
+-- counts and a bounded list of open urgent assignments in one call, so
+-- the dashboard no longer downloads every assignment to count them.
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION get_assignee_dashboard_summary(
+    p_user_id       uuid,
+    p_company_id    uuid,
+    p_urgent_limit  integer DEFAULT 10
+)
+RETURNS jsonb AS $$
+    WITH mine AS (
+        SELECT a.id, a.title, a.status, a.priority, a.due_date, a.created_at
+          FROM assignments a
+          JOIN assignment_assignees aa ON aa.assignment_id = a.id
+         WHERE aa.user_id = p_user_id
+           AND a.company_id = p_company_id
+    ), urgent AS (
+        SELECT id, title, due_date, created_at
+          FROM mine
+         WHERE priority = 'urgent' AND status <> 'done'
+         ORDER BY due_date NULLS LAST, created_at DESC
+         LIMIT p_urgent_limit
+    )
+    SELECT jsonb_build_object(
+        'total_assignments', count(*),
+        'completed',         count(*) FILTER (WHERE status = 'done'),
+        'in_progress',       count(*) FILTER (WHERE status = 'in_progress'),
+        'todo',              count(*) FILTER (WHERE status = 'todo'),
+        'urgent_alerts',     COALESCE(
+            (SELECT jsonb_agg(
+                        jsonb_build_object('id', u.id, 'title', u.title, 'due_date', u.due_date)
+                        ORDER BY u.due_date NULLS LAST, u.created_at DESC)
+               FROM urgent u),
+            '[]'::jsonb)
+    )
+    FROM mine;
+$$ LANGUAGE sql STABLE;
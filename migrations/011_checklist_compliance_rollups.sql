@@ -0,0 +1,152 @@
+-- ============================================================
+-- Migration 011: Daily checklist compliance rollups
+-- One row per (branch, template, group, date) with completed/total item
+-- counts, kept current by a trigger on daily_checklists. The row with
+-- group_id NULL holds the template's totals for that day, so overall and
+-- per-template figures never double-count checklists shared by groups.
+-- rebuild_checklist_compliance_rollups() backfills or repairs a range.
+-- ============================================================
+
+CREATE TABLE checklist_compliance_rollups (
+    branch_id   uuid        NOT NULL REFERENCES branches(id) ON DELETE CASCADE,
+    template_id uuid        NOT NULL REFERENCES checklist_templates(id) ON DELETE CASCADE,
+    group_id    uuid        REFERENCES groups(id) ON DELETE CASCADE,
+    date        date        NOT NULL,
+    completed   integer     NOT NULL DEFAULT 0,
+    total       integer     NOT NULL DEFAULT 0,
+    checklists  integer     NOT NULL DEFAULT 0,
+    updated_at  timestamptz NOT NULL DEFAULT now(),
+
+    CONSTRAINT uq_compliance_rollups_key UNIQUE NULLS NOT DISTINCT (branch_id, template_id, group_id, date)
+);
+
+CREATE INDEX idx_compliance_rollups_branch_date ON checklist_compliance_rollups(branch_id, date);
+
+
+-- (completed, total) items of one checklist_data array.
+CREATE OR REPLACE FUNCTION checklist_item_counts(p_data jsonb, OUT completed integer, OUT total integer)
+AS $$
+    SELECT count(*) FILTER (WHERE coalesce((e->>'is_completed')::boolean, false))::integer,
+           count(*)::integer
+      FROM jsonb_array_elements(coalesce(p_data, '[]'::jsonb)) AS e;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- The rollup group keys of one checklist: NULL (the template row) and each
+-- distinct group id that still exists. daily_checklists.group_ids is not a
+-- foreign key, so ids of deleted or unknown groups are ignored here.
+CREATE OR REPLACE FUNCTION checklist_rollup_groups(p_group_ids uuid[])
+RETURNS SETOF uuid AS $$
+    SELECT NULL::uuid
+    UNION
+    SELECT g.id FROM groups g WHERE g.id = ANY(coalesce(p_group_ids, '{}'));
+$$ LANGUAGE sql STABLE;
+
+-- Add a delta to the template row and to every group row of one checklist.
+CREATE OR REPLACE FUNCTION apply_checklist_compliance_delta(
+    p_branch_id     uuid,
+    p_template_id   uuid,
+    p_group_ids     uuid[],
+    p_date          date,
+    p_completed     integer,
+    p_total         integer,
+    p_checklists    integer
+)
+RETURNS void AS $$
+    INSERT INTO checklist_compliance_rollups AS r
+           (branch_id, template_id, group_id, date, completed, total, checklists)
+    SELECT p_branch_id, p_template_id, g, p_date, p_completed, p_total, p_checklists
+      FROM checklist_rollup_groups(p_group_ids) AS g
+    ON CONFLICT (branch_id, template_id, group_id, date) DO UPDATE
+       SET completed  = r.completed + EXCLUDED.completed,
+           total      = r.total + EXCLUDED.total,
+           checklists = r.checklists + EXCLUDED.checklists,
+           updated_at = now();
+$$ LANGUAGE sql;
+
+CREATE OR REPLACE FUNCTION daily_checklists_compliance_rollup()
+RETURNS trigger AS $$
+DECLARE
+    v_old record;
+    v_new record;
+BEGIN
+    IF TG_OP = 'UPDATE'
+       AND OLD.branch_id = NEW.branch_id
+       AND OLD.template_id = NEW.template_id
+       AND OLD.date = NEW.date
+       AND OLD.group_ids IS NOT DISTINCT FROM NEW.group_ids THEN
+        -- Item toggles: one net delta on the same rows.
+        IF OLD.checklist_data IS DISTINCT FROM NEW.checklist_data THEN
+            SELECT * INTO v_old FROM checklist_item_counts(OLD.checklist_data);
+            SELECT * INTO v_new FROM checklist_item_counts(NEW.checklist_data);
+            IF (v_old.completed, v_old.total) <> (v_new.completed, v_new.total) THEN
+                PERFORM apply_checklist_compliance_delta(
+                    NEW.branch_id, NEW.template_id, NEW.group_ids, NEW.date,
+                    v_new.completed - v_old.completed, v_new.total - v_old.total, 0);
+            END IF;
+        END IF;
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        SELECT * INTO v_old FROM checklist_item_counts(OLD.checklist_data);
+        PERFORM apply_checklist_compliance_delta(
+            OLD.branch_id, OLD.template_id, OLD.group_ids, OLD.date,
+            -v_old.completed, -v_old.total, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        SELECT * INTO v_new FROM checklist_item_counts(NEW.checklist_data);
+        PERFORM apply_checklist_compliance_delta(
+            NEW.branch_id, NEW.template_id, NEW.group_ids, NEW.date,
+            v_new.completed, v_new.total, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_daily_checklists_compliance_rollup
+    AFTER INSERT OR UPDATE OR DELETE ON daily_checklists
+    FOR EACH ROW EXECUTE FUNCTION daily_checklists_compliance_rollup();
+
+
+-- Recompute the rollups for p_from..p_to (everything when both are NULL)
+-- from daily_checklists; returns the number of rollup rows written.
+CREATE OR REPLACE FUNCTION rebuild_checklist_compliance_rollups(
+    p_from  date DEFAULT NULL,
+    p_to    date DEFAULT NULL
+)
+RETURNS integer AS $$
+DECLARE
+    v_written integer;
+BEGIN
+    -- Hold off trigger deltas until the rebuilt rows are committed; they
+    -- then apply on top of a snapshot that did not include them.
+    LOCK TABLE checklist_compliance_rollups IN EXCLUSIVE MODE;
+
+    DELETE FROM checklist_compliance_rollups
+     WHERE (p_from IS NULL OR date >= p_from)
+       AND (p_to IS NULL OR date <= p_to);
+
+    WITH counted AS (
+        SELECT d.branch_id, d.template_id, d.group_ids, d.date, c.completed, c.total
+          FROM daily_checklists d
+         CROSS JOIN LATERAL checklist_item_counts(d.checklist_data) c
+         WHERE (p_from IS NULL OR d.date >= p_from)
+           AND (p_to IS NULL OR d.date <= p_to)
+    ), written AS (
+        INSERT INTO checklist_compliance_rollups
+               (branch_id, template_id, group_id, date, completed, total, checklists)
+        SELECT branch_id, template_id, g, date, sum(completed), sum(total), count(*)
+          FROM counted
+         CROSS JOIN LATERAL checklist_rollup_groups(group_ids) AS g
+         GROUP BY branch_id, template_id, g, date
+        RETURNING 1
+    )
+    SELECT count(*) INTO v_written FROM written;
+
+    RETURN v_written;
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- Backfill.
+SELECT rebuild_checklist_compliance_rollups();
@@ -0,0 +1,65 @@
+-- ============================================================
+-- Migration 012: Atomic single-item checklist updates
+-- update_daily_checklist_item() patches one element of checklist_data
+-- in place with jsonb_set and bumps daily_checklists.version, so item
+-- toggles are one round trip and never overwrite each other. Callers
+-- may pass the version they last saw to reject stale writes.
+-- ============================================================
+
+ALTER TABLE daily_checklists ADD COLUMN version integer NOT NULL DEFAULT 0;
+
+
+-- Returns {"status": "ok", "item_index", "item", "version"} on success, or
+-- {"status": "not_found" | "invalid_index" | "version_conflict", "version"}.
+CREATE OR REPLACE FUNCTION update_daily_checklist_item(
+    p_checklist_id      uuid,
+    p_item_index        integer,
+    p_user_id           uuid,
+    p_is_completed      boolean,
+    p_verification_data text DEFAULT NULL,
+    p_expected_version  integer DEFAULT NULL
+)
+RETURNS jsonb AS $$
+DECLARE
+    v_item      jsonb;
+    v_version   integer;
+    v_length    integer;
+BEGIN
+    UPDATE daily_checklists d
+       SET checklist_data = jsonb_set(
+               d.checklist_data,
+               ARRAY[p_item_index::text],
+               (d.checklist_data -> p_item_index)
+                   || jsonb_build_object(
+                          'is_completed', p_is_completed,
+                          'completed_by', CASE WHEN p_is_completed THEN p_user_id END,
+                          'completed_at', CASE WHEN p_is_completed THEN now() END)
+                   || CASE WHEN p_verification_data IS NOT NULL
+                           THEN jsonb_build_object('verification_data', p_verification_data)
+                           ELSE '{}'::jsonb END),
+           version = d.version + 1
+     WHERE d.id = p_checklist_id
+       AND p_item_index >= 0
+       AND p_item_index < jsonb_array_length(d.checklist_data)
+       AND (p_expected_version IS NULL OR d.version = p_expected_version)
+    RETURNING d.checklist_data -> p_item_index, d.version
+         INTO v_item, v_version;
+
+    IF FOUND THEN
+        RETURN jsonb_build_object(
+            'status', 'ok', 'item_index', p_item_index, 'item', v_item, 'version', v_version);
+    END IF;
+
+    SELECT jsonb_array_length(checklist_data), version
+      INTO v_length, v_version
+      FROM daily_checklists
+     WHERE id = p_checklist_id;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object('status', 'not_found', 'version', NULL);
+    ELSIF p_item_index < 0 OR p_item_index >= v_length THEN
+        RETURN jsonb_build_object('status', 'invalid_index', 'version', v_version);
+    END IF;
+    RETURN jsonb_build_object('status', 'version_conflict', 'version', v_version);
+END;
+$$ LANGUAGE plpgsql;
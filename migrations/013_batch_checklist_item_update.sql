@@ -0,0 +1,90 @@
+-- ============================================================
+-- Migration 013: Batch checklist item updates
+-- update_daily_checklist_items() applies a list of item changes to one
+-- checklist in a single locked read and a single write, and reports the
+-- outcome of every change, so a device can sync a run of ticks in one
+-- request.
+-- ============================================================
+
+-- p_changes: [{"item_index", "is_completed", "verification_data"?, "base_completed"?}]
+-- base_completed is the state the client last saw; when the item has since
+-- been changed to something else by someone, that change is a conflict.
+--
+-- Returns {"status": "ok", "version", "items": [{"item_index", "status", "item"?}]}
+-- with item status applied | unchanged | conflict | invalid_index,
+-- or {"status": "not_found"}.
+CREATE OR REPLACE FUNCTION update_daily_checklist_items(
+    p_checklist_id  uuid,
+    p_user_id       uuid,
+    p_changes       jsonb
+)
+RETURNS jsonb AS $$
+DECLARE
+    v_data      jsonb;
+    v_version   integer;
+    v_length    integer;
+    v_change    jsonb;
+    v_index     integer;
+    v_item      jsonb;
+    v_current   boolean;
+    v_target    boolean;
+    v_results   jsonb := '[]'::jsonb;
+    v_applied   integer := 0;
+BEGIN
+    SELECT checklist_data, version
+      INTO v_data, v_version
+      FROM daily_checklists
+     WHERE id = p_checklist_id
+       FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object('status', 'not_found');
+    END IF;
+    v_length := jsonb_array_length(v_data);
+
+    FOR v_change IN SELECT * FROM jsonb_array_elements(p_changes) LOOP
+        v_index := (v_change->>'item_index')::integer;
+        IF v_index IS NULL OR v_index < 0 OR v_index >= v_length THEN
+            v_results := v_results || jsonb_build_array(
+                jsonb_build_object('item_index', v_index, 'status', 'invalid_index'));
+            CONTINUE;
+        END IF;
+
+        v_item := v_data -> v_index;
+        v_current := coalesce((v_item->>'is_completed')::boolean, false);
+        v_target := (v_change->>'is_completed')::boolean;
+
+        IF v_current = v_target AND v_change->>'verification_data' IS NULL THEN
+            v_results := v_results || jsonb_build_array(
+                jsonb_build_object('item_index', v_index, 'status', 'unchanged', 'item', v_item));
+        ELSIF v_change ? 'base_completed'
+              AND (v_change->>'base_completed')::boolean <> v_current THEN
+            v_results := v_results || jsonb_build_array(
+                jsonb_build_object('item_index', v_index, 'status', 'conflict', 'item', v_item));
+        ELSE
+            v_item := v_item
+                || jsonb_build_object(
+                       'is_completed', v_target,
+                       'completed_by', CASE WHEN v_target THEN p_user_id END,
+                       'completed_at', CASE WHEN v_target THEN now() END)
+                || CASE WHEN v_change->>'verification_data' IS NOT NULL
+                        THEN jsonb_build_object('verification_data', v_change->>'verification_data')
+                        ELSE '{}'::jsonb END;
+            v_data := jsonb_set(v_data, ARRAY[v_index::text], v_item);
+            v_applied := v_applied + 1;
+            v_results := v_results || jsonb_build_array(
+                jsonb_build_object('item_index', v_index, 'status', 'applied', 'item', v_item));
+        END IF;
+    END LOOP;
+
+    IF v_applied > 0 THEN
+        UPDATE daily_checklists
+           SET checklist_data = v_data,
+               version = version + 1
+         WHERE id = p_checklist_id
+        RETURNING version INTO v_version;
+    END IF;
+
+    RETURN jsonb_build_object('status', 'ok', 'version', v_version, 'items', v_results);
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,45 @@
+-- ============================================================
+-- Migration 014: Checklist template versions
+-- checklist_templates.version increases whenever the template or any of
+-- its items or groups change, so compiled template snapshots can be
+-- cached by (template id, version) and checked with a one-column read.
+-- ============================================================
+
+ALTER TABLE checklist_templates ADD COLUMN version integer NOT NULL DEFAULT 0;
+
+
+CREATE OR REPLACE FUNCTION checklist_templates_bump_version()
+RETURNS trigger AS $$
+BEGIN
+    NEW.version := OLD.version + 1;
+    NEW.updated_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_checklist_templates_version
+    BEFORE UPDATE ON checklist_templates
+    FOR EACH ROW EXECUTE FUNCTION checklist_templates_bump_version();
+
+
+-- Item and group changes bump the parent template (via the trigger above).
+CREATE OR REPLACE FUNCTION checklist_template_children_bump_version()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE checklist_templates SET version = version WHERE id = OLD.template_id;
+    END IF;
+    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.template_id <> OLD.template_id) THEN
+        UPDATE checklist_templates SET version = version WHERE id = NEW.template_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_template_items_version
+    AFTER INSERT OR UPDATE OR DELETE ON template_items
+    FOR EACH ROW EXECUTE FUNCTION checklist_template_children_bump_version();
+
+CREATE TRIGGER trg_template_groups_version
+    AFTER INSERT OR UPDATE OR DELETE ON template_groups
+    FOR EACH ROW EXECUTE FUNCTION checklist_template_children_bump_version();
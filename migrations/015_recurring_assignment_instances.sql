@@ -0,0 +1,65 @@
+-- ============================================================
+-- Migration 015: Recurring assignment instances
+-- An assignment with a recurrence rule is a series; its future
+-- occurrences are materialized ahead of time as ordinary assignments
+-- linked by recurrence_parent_id and keyed by occurrence_date, so a
+-- re-run of the materializer never creates the same occurrence twice.
+-- recurrence_materialized_through records how far a series has been
+-- materialized, so occurrences deleted by a manager stay deleted.
+-- ============================================================
+
+ALTER TABLE assignments
+    ADD COLUMN recurrence_parent_id            uuid REFERENCES assignments(id) ON DELETE SET NULL,
+    ADD COLUMN occurrence_date                 date,
+    ADD COLUMN recurrence_materialized_through date,
+    ADD CONSTRAINT uq_assignments_occurrence UNIQUE (recurrence_parent_id, occurrence_date);
+
+-- The materializer pages through series by id.
+CREATE INDEX idx_assignments_recurring_series ON assignments(id)
+    WHERE recurrence IS NOT NULL AND recurrence_parent_id IS NULL;
+
+
+-- p_occurrences: [{"series_id", "occurrence_date", "due_date"}]
+-- Creates each missing occurrence as a copy of its series, with the
+-- series' assignees, and advances the watermark of p_series_ids to
+-- p_through. Returns the number of assignments created.
+CREATE OR REPLACE FUNCTION materialize_assignment_occurrences(
+    p_occurrences   jsonb,
+    p_series_ids    uuid[],
+    p_through       date
+)
+RETURNS integer AS $$
+DECLARE
+    v_created integer;
+BEGIN
+    WITH occurrences AS (
+        SELECT (o->>'series_id')::uuid          AS series_id,
+               (o->>'occurrence_date')::date    AS occurrence_date,
+               (o->>'due_date')::timestamptz    AS due_date
+          FROM jsonb_array_elements(p_occurrences) AS o
+    ), created AS (
+        INSERT INTO assignments
+               (company_id, branch_id, title, description, priority, status, due_date,
+                created_by, recurrence_parent_id, occurrence_date)
+        SELECT s.company_id, s.branch_id, s.title, s.description, s.priority, 'todo', o.due_date,
+               s.created_by, s.id, o.occurrence_date
+          FROM occurrences o
+          JOIN assignments s ON s.id = o.series_id
+        ON CONFLICT (recurrence_parent_id, occurrence_date) DO NOTHING
+        RETURNING id, recurrence_parent_id
+    ), assigned AS (
+        INSERT INTO assignment_assignees (assignment_id, user_id)
+        SELECT c.id, a.user_id
+          FROM created c
+          JOIN assignment_assignees a ON a.assignment_id = c.recurrence_parent_id
+    )
+    SELECT count(*) INTO v_created FROM created;
+
+    UPDATE assignments
+       SET recurrence_materialized_through = p_through
+     WHERE id = ANY(p_series_ids)
+       AND (recurrence_materialized_through IS NULL OR recurrence_materialized_through < p_through);
+
+    RETURN v_created;
+END;
+$$ LANGUAGE plpgsql;
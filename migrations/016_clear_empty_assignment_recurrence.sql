@@ -0,0 +1,8 @@
+-- ============================================================
+-- Migration 016: Clear empty assignment recurrence rules
+-- An empty rule ({}) means "no recurrence"; the API now stores it as
+-- NULL. Existing rows are cleared so the recurring-series scan and its
+-- partial index skip them.
+-- ============================================================
+
+UPDATE assignments SET recurrence = NULL WHERE recurrence = '{}'::jsonb;
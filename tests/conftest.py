@@ -1,3 +1,5 @@
+import base64
+import json
 import pytest
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
@@ -15,6 +17,12 @@ from app.services.comment_service import CommentService
 from app.services.file_service import FileService
 
 
+def cursor_key(cursor):
+    """(created_at, id) of a cursor, unvalidated: fake rows use readable ids, not UUIDs."""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return tuple(json.loads(base64.urlsafe_b64decode(padded)))
+
+
 class FakeAuthRepository(IAuthRepository):
     """In-memory fake auth repository for testing."""
 
@@ -52,6 +60,13 @@ class FakeAuthRepository(IAuthRepository):
                 return user
         return None
 
+    async def get_emails_by_ids(self, user_ids: list) -> dict:
+        return {
+            uid: self.users[uid]["email"]
+            for uid in user_ids
+            if uid in self.users and self.users[uid].get("email")
+        }
+
     async def update_password(self, user_id: str, new_password_hash: str) -> bool:
         if user_id in self.users:
             self.users[user_id]["password_hash"] = new_password_hash
@@ -72,6 +87,23 @@ class FakeAuthRepository(IAuthRepository):
                 return "Email is already registered."
         return None
 
+    async def get_token_version(self, user_id: str) -> int | None:
+        user = self.users.get(user_id)
+        if user is None:
+            return None
+        return user.get("token_version", 0)
+
+    async def bump_token_version(self, user_id: str) -> int:
+        user = self.users[user_id]
+        user["token_version"] = user.get("token_version", 0) + 1
+        return user["token_version"]
+
+    async def is_email_verified(self, email: str) -> bool:
+        return any(
+            record["email"] == email and record["used"]
+            for record in self.codes.values()
+        )
+
     async def save_verification_code(
         self, user_id: str, email: str, code: str, expires_at: datetime
     ) -> dict:
@@ -141,6 +173,9 @@ class FakeOrgRepository(IOrganizationRepository):
     async def update_company(self, id: str, data: dict):
         return MagicMock(**data)
 
+    async def list_company_ids(self):
+        return []
+
     async def list_brands(self, company_id: str):
         return []
 
@@ -156,6 +191,9 @@ class FakeOrgRepository(IOrganizationRepository):
     async def list_branches(self, brand_id=None):
         return []
 
+    async def list_company_branches(self, company_id: str):
+        return []
+
     async def create_branch(self, data: dict):
         return data
 
@@ -246,10 +284,18 @@ class FakeNotificationRepository(INotificationRepository):
 
     def __init__(self):
         self.notifications = []
+        self.outbox = []
 
-    async def list_by_user(self, user_id, company_id, limit=50):
+    async def list_by_user(self, user_id, company_id, limit=50, cursor=None):
         return [n for n in self.notifications if n["user_id"] == user_id]
 
+    async def list_after(self, user_id, company_id, after_id, limit=100):
+        ids = [n["id"] for n in self.notifications]
+        if after_id not in ids:
+            return []
+        later = self.notifications[ids.index(after_id) + 1:]
+        return [n for n in later if n["user_id"] == user_id][:limit]
+
     async def count_unread(self, user_id, company_id):
         return sum(1 for n in self.notifications if n["user_id"] == user_id and not n.get("is_read"))
 
@@ -257,6 +303,14 @@ class FakeNotificationRepository(INotificationRepository):
         return {}
 
     async def mark_all_as_read(self, user_id, company_id):
+        count = 0
+        for n in self.notifications:
+            if n["user_id"] == user_id and not n.get("is_read"):
+                n["is_read"] = True
+                count += 1
+        return count
+
+    async def reconcile_unread_counters(self):
         return 0
 
     async def create(self, data):
@@ -266,6 +320,25 @@ class FakeNotificationRepository(INotificationRepository):
         self.notifications.append(data)
         return data
 
+    async def create_many(self, rows):
+        return [await self.create(row) for row in rows]
+
+    async def create_many_with_outbox(self, rows):
+        return [await self.create_with_outbox(row) for row in rows]
+
+    async def create_with_outbox(self, data):
+        row = await self.create(data)
+        self.outbox.append({
+            "id": f"job-{len(self.outbox) + 1}",
+            "notification_id": row["id"],
+            "user_id": row["user_id"],
+            "title": row["title"],
+            "message": row["message"],
+            "status": "pending",
+            "attempts": 0,
+        })
+        return row
+
 
 class FakeCommentRepository(ICommentRepository):
     """In-memory fake comment repository for testing."""
@@ -274,7 +347,7 @@ class FakeCommentRepository(ICommentRepository):
         self.comments = []
         self._counter = 0
 
-    async def list_by_assignment(self, assignment_id):
+    async def list_by_assignment(self, assignment_id, limit=50, cursor=None):
         return [c for c in self.comments if c["assignment_id"] == assignment_id]
 
     async def create(self, data):
@@ -295,11 +368,90 @@ class FakeAssignmentRepository(IAssignmentRepository):
     def __init__(self):
         self.assignments = {}
 
-    async def get_by_id(self, id):
+    async def get_by_id(self, id, select=None):
         return self.assignments.get(id)
 
-    async def list(self, filters):
-        return list(self.assignments.values())
+    async def list(self, filters, limit=50, cursor=None, select="*"):
+        rows = list(self.assignments.values())
+        for key, value in filters.items():
+            if value is None or key in ("due_from", "due_to"):
+                continue
+            if isinstance(value, list):
+                rows = [r for r in rows if r.get(key) in value]
+            else:
+                rows = [r for r in rows if r.get(key) == value]
+        if "due_from" in filters:
+            rows = [r for r in rows if r.get("due_date") and r["due_date"] >= filters["due_from"]]
+        if "due_to" in filters:
+            rows = [r for r in rows if r.get("due_date") and r["due_date"] <= filters["due_to"]]
+        return self._page(rows, limit, cursor)
+
+    async def list_by_assignee(self, user_id, company_id, status=None, limit=None, cursor=None, select="*"):
+        rows = [
+            a for a in self.assignments.values()
+            if a.get("company_id") == company_id
+            and any(x["user_id"] == user_id for x in a.get("assignees", []))
+        ]
+        if status:
+            rows = [r for r in rows if r.get("status") in status]
+        return self._page(rows, limit, cursor)
+
+    async def get_assignee_summary(self, user_id, company_id, urgent_limit=10):
+        rows = await self.list_by_assignee(user_id, company_id)
+        urgent = [r for r in rows if r.get("priority") == "urgent" and r.get("status") != "done"]
+        urgent.sort(key=lambda r: (r.get("due_date") is None, r.get("due_date") or ""))
+        return {
+            "total_assignments": len(rows),
+            "completed": sum(1 for r in rows if r.get("status") == "done"),
+            "in_progress": sum(1 for r in rows if r.get("status") == "in_progress"),
+            "todo": sum(1 for r in rows if r.get("status") == "todo"),
+            "urgent_alerts": [
+                {"id": r["id"], "title": r.get("title"), "due_date": r.get("due_date")}
+                for r in urgent[:urgent_limit]
+            ],
+        }
+
+    @staticmethod
+    def _page(rows, limit, cursor):
+        rows = sorted(rows, key=lambda r: (r["created_at"], r["id"]), reverse=True)
+        if cursor:
+            created_at, row_id = cursor_key(cursor)
+            rows = [r for r in rows if (r["created_at"], r["id"]) < (created_at, row_id)]
+        return rows if limit is None else rows[:limit + 1]
+
+    async def list_recurring(self, after_id=None, limit=500):
+        rows = sorted(
+            (a for a in self.assignments.values() if a.get("recurrence") and not a.get("recurrence_parent_id")),
+            key=lambda r: r["id"],
+        )
+        if after_id:
+            rows = [r for r in rows if r["id"] > after_id]
+        return rows[:limit]
+
+    async def materialize_occurrences(self, occurrences, series_ids, through):
+        created = 0
+        for occurrence in occurrences:
+            series = self.assignments[occurrence["series_id"]]
+            key = (series["id"], occurrence["occurrence_date"])
+            if any((a.get("recurrence_parent_id"), a.get("occurrence_date")) == key for a in self.assignments.values()):
+                continue
+            instance_id = f"{series['id']}:{occurrence['occurrence_date']}"
+            self.assignments[instance_id] = {
+                "id": instance_id,
+                "company_id": series.get("company_id"),
+                "title": series.get("title"),
+                "status": "todo",
+                "due_date": occurrence["due_date"],
+                "recurrence_parent_id": series["id"],
+                "occurrence_date": occurrence["occurrence_date"],
+                "assignees": [{"user_id": a["user_id"]} for a in series.get("assignees", [])],
+            }
+            created += 1
+        for series_id in series_ids:
+            series = self.assignments[series_id]
+            if (series.get("recurrence_materialized_through") or "") < through:
+                series["recurrence_materialized_through"] = through
+        return created
 
     async def create(self, data):
         self.assignments[data["id"]] = data
@@ -0,0 +1,199 @@
+"""Tests for paginated, filterable assignment listing."""
+import base64
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.dependencies import get_assignment_service
+from app.core.security import get_current_principal
+from app.repositories import assignment as assignment_module
+from app.repositories.assignment import AssignmentRepository
+from app.schemas.user import Principal
+from app.services.assignment_service import AssignmentService
+
+
+class RecordingQuery:
+    """Records PostgREST builder calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.execute = AsyncMock(return_value=MagicMock(data=[]))
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return method
+
+
+def _assignment(i, **overrides):
+    row = {
+        "id": f"a-{i}",
+        "company_id": "company-1",
+        "status": "todo",
+        "priority": "normal",
+        "due_date": None,
+        "created_at": f"2026-01-01T00:00:{i:02d}+00:00",
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.mark.asyncio
+async def test_list_assignments_pages_chain(fake_assignment_repo):
+    for i in range(5):
+        await fake_assignment_repo.create(_assignment(i))
+    service = AssignmentService(fake_assignment_repo)
+
+    first, cursor = await service.list_assignments("company-1", limit=2)
+    second, cursor = await service.list_assignments("company-1", limit=2, cursor=cursor)
+    third, cursor = await service.list_assignments("company-1", limit=2, cursor=cursor)
+
+    assert [a["id"] for a in first + second + third] == ["a-4", "a-3", "a-2", "a-1", "a-0"]
+    assert cursor is None
+
+
+@pytest.mark.asyncio
+async def test_list_assignments_filters(fake_assignment_repo):
+    await fake_assignment_repo.create(_assignment(0, status="done"))
+    await fake_assignment_repo.create(_assignment(1, status="todo", due_date="2026-02-01T00:00:00+00:00"))
+    await fake_assignment_repo.create(_assignment(2, status="in_progress", due_date="2026-03-01T00:00:00+00:00"))
+    service = AssignmentService(fake_assignment_repo)
+
+    rows, _ = await service.list_assignments("company-1", {
+        "status": ["todo", "in_progress"],
+        "due_to": "2026-02-15T00:00:00+00:00",
+    })
+
+    assert [a["id"] for a in rows] == ["a-1"]
+
+
+@pytest.mark.asyncio
+async def test_repository_compiles_filters(monkeypatch):
+    query = RecordingQuery()
+    client = MagicMock()
+    client.table.return_value.select.return_value = query
+    monkeypatch.setattr(assignment_module, "async_supabase", client)
+
+    await AssignmentRepository().list({
+        "company_id": "company-1",
+        "status": ["todo", "in_progress"],
+        "branch_id": None,
+        "due_from": "2026-01-01T00:00:00+00:00",
+        "due_to": "2026-01-31T00:00:00+00:00",
+    }, limit=10)
+
+    calls = [(name, args) for name, args, _ in query.calls]
+    assert ("eq", ("company_id", "company-1")) in calls
+    assert ("in_", ("status", ["todo", "in_progress"])) in calls
+    assert ("gte", ("due_date", "2026-01-01T00:00:00+00:00")) in calls
+    assert ("lte", ("due_date", "2026-01-31T00:00:00+00:00")) in calls
+    assert not any(args and args[0] == "branch_id" for _, args in calls)
+    assert calls[-1] == ("limit", (11,))
+
+
+def _client(service):
+    app.dependency_overrides[get_current_principal] = lambda: Principal(
+        id="user-1", company_id="company-1", role="manager", status="active"
+    )
+    app.dependency_overrides[get_assignment_service] = lambda: service
+    return TestClient(app)
+
+
+def test_endpoint_parses_multi_value_filters():
+    service = MagicMock()
+    service.list_assignments = AsyncMock(return_value=([{"id": "a-1"}], "next"))
+    try:
+        response = _client(service).get("/api/v1/assignments/", params=[
+            ("status", "todo"), ("status", "in_progress"), ("priority", "urgent"),
+            ("due_from", "2026-01-01T00:00:00Z"), ("limit", "10"),
+        ])
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["X-Next-Cursor"] == "next"
+    company_id, filters = service.list_assignments.call_args.args
+    assert company_id == "company-1"
+    assert filters["status"] == ["in_progress", "todo"]
+    assert filters["priority"] == ["urgent"]
+    assert filters["due_from"].startswith("2026-01-01T00:00:00")
+    assert service.list_assignments.call_args.kwargs == {"limit": 10, "cursor": None, "select": "*"}
+
+
+@pytest.mark.parametrize("path", ["/api/v1/assignments/", "/api/v1/assignments/my"])
+def test_endpoints_reject_tampered_cursor(path):
+    raw = json.dumps(["2026-01-01T00:00:00+00:00", "a-1),id.neq.(0"]).encode("utf-8")
+    cursor = base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+    service = MagicMock()
+    service.list_assignments = AsyncMock(return_value=([], None))
+    service.get_my_assignments = AsyncMock(return_value=([], None))
+    try:
+        response = _client(service).get(path, params={"cursor": cursor})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 400
+    service.list_assignments.assert_not_called()
+    service.get_my_assignments.assert_not_called()
+
+
+def test_endpoint_rejects_unknown_status_and_inverted_range():
+    service = MagicMock()
+    service.list_assignments = AsyncMock(return_value=([], None))
+    try:
+        client = _client(service)
+        bad_status = client.get("/api/v1/assignments/", params={"status": "archived"})
+        inverted = client.get("/api/v1/assignments/", params={
+            "due_from": "2026-02-01T00:00:00Z", "due_to": "2026-01-01T00:00:00Z",
+        })
+    finally:
+        app.dependency_overrides.clear()
+
+    assert bad_status.status_code == 422
+    assert inverted.status_code == 400
+    service.list_assignments.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_by_assignee_is_one_inner_join_query(monkeypatch):
+    query = RecordingQuery()
+    query.execute = AsyncMock(return_value=MagicMock(data=[
+        {"id": "a-1", "assignees": [{"user_id": "user-1"}, {"user_id": "user-2"}], "mine": [{"user_id": "user-1"}]},
+    ]))
+    client = MagicMock()
+    client.table.return_value.select.return_value = query
+    monkeypatch.setattr(assignment_module, "async_supabase", client)
+
+    rows = await AssignmentRepository().list_by_assignee(
+        "user-1", "company-1", status=["todo"], limit=20
+    )
+
+    client.table.assert_called_once_with("assignments")
+    select = client.table.return_value.select.call_args.args[0]
+    assert "mine:assignment_assignees!inner(user_id)" in select
+    calls = [(name, args) for name, args, _ in query.calls]
+    assert ("eq", ("mine.user_id", "user-1")) in calls
+    assert ("in_", ("status", ["todo"])) in calls
+    assert calls[-1] == ("limit", (21,))
+    assert rows == [{"id": "a-1", "assignees": [{"user_id": "user-1"}, {"user_id": "user-2"}]}]
+
+
+@pytest.mark.asyncio
+async def test_my_assignments_pages_and_filters(fake_assignment_repo):
+    mine = [{"user_id": "user-1"}]
+    for i in range(4):
+        await fake_assignment_repo.create(_assignment(i, assignees=mine, status="done" if i == 3 else "todo"))
+    await fake_assignment_repo.create(_assignment(9, assignees=[{"user_id": "user-2"}]))
+    service = AssignmentService(fake_assignment_repo)
+
+    first, cursor = await service.get_my_assignments("user-1", "company-1", status=["todo"], limit=2)
+    second, cursor = await service.get_my_assignments(
+        "user-1", "company-1", status=["todo"], limit=2, cursor=cursor
+    )
+
+    assert [a["id"] for a in first + second] == ["a-2", "a-1", "a-0"]
+    assert cursor is None
@@ -0,0 +1,158 @@
+"""Tests for the checklist compliance engine."""
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.dependencies import get_admin_service
+from app.core.security import get_current_principal
+from app.schemas.user import Principal
+from app.services.admin_service import AdminService
+from app.jobs import rebuild_compliance_rollups as rebuild_job
+from app.services.compliance import count_items, summarize_checklists, summarize_rollups
+
+
+def _checklist(template_id, done, total, group_ids=None):
+    items = [{"is_completed": i < done} for i in range(total)]
+    return {"template_id": template_id, "group_ids": group_ids, "checklist_data": items}
+
+
+def test_count_items():
+    assert count_items([{"is_completed": True}, {"is_completed": False}, {}]) == (1, 3)
+    assert count_items(None) == (0, 0)
+
+
+def test_summary_by_template_and_group():
+    summary = summarize_checklists([
+        _checklist("t-open", 3, 4, ["g-kitchen", "g-hall"]),
+        _checklist("t-open", 1, 4, ["g-hall"]),
+        _checklist("t-close", 0, 2),
+    ]).to_dict()
+
+    assert summary["overall_rate"] == 40.0
+    assert (summary["completed"], summary["total"], summary["checklist_count"]) == (4, 10, 3)
+    assert summary["by_template"] == [
+        {"template_id": "t-close", "completed": 0, "total": 2, "checklist_count": 1, "rate": 0.0},
+        {"template_id": "t-open", "completed": 4, "total": 8, "checklist_count": 2, "rate": 50.0},
+    ]
+    assert summary["by_group"] == [
+        {"group_id": "g-hall", "completed": 4, "total": 8, "checklist_count": 2, "rate": 50.0},
+        {"group_id": "g-kitchen", "completed": 3, "total": 4, "checklist_count": 1, "rate": 75.0},
+    ]
+
+
+def test_empty_summary():
+    summary = summarize_checklists([]).to_dict()
+    assert summary["overall_rate"] == 0.0
+    assert summary["by_group"] == [] and summary["by_template"] == []
+
+
+def _admin_service(checklists):
+    checklist_repo = MagicMock()
+    checklist_repo.list_by_branch_range = AsyncMock(return_value=checklists)
+    service = AdminService(
+        MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+        checklist_repo=checklist_repo,
+    )
+    return service, checklist_repo
+
+
+@pytest.mark.asyncio
+async def test_service_returns_summary_and_timing():
+    service, repo = _admin_service([_checklist("t-1", 1, 2)])
+
+    result = await service.get_compliance_summary("branch-1", "2026-03-01", "2026-03-07")
+
+    repo.list_by_branch_range.assert_awaited_once()
+    assert repo.list_by_branch_range.call_args.args == ("branch-1", "2026-03-01", "2026-03-07")
+    assert result["overall_rate"] == 50.0
+    assert result["date"] is None
+    assert set(result["timing"]) == {"fetch_ms", "compute_ms", "total_ms"}
+
+
+@pytest.mark.asyncio
+async def test_single_day_keeps_date_field():
+    service, _ = _admin_service([])
+    result = await service.get_compliance_summary("branch-1", "2026-03-01")
+    assert (result["date"], result["date_from"], result["date_to"]) == ("2026-03-01",) * 3
+
+
+def test_endpoint_validates_range():
+    service = MagicMock()
+    service.get_compliance_summary = AsyncMock(return_value={})
+    app.dependency_overrides[get_current_principal] = lambda: Principal(
+        id="user-1", company_id="company-1", role="manager", status="active"
+    )
+    app.dependency_overrides[get_admin_service] = lambda: service
+    try:
+        client = TestClient(app)
+        url = "/api/v1/admin/dashboard/checklist-compliance"
+        missing = client.get(url, params={"branch_id": "b-1"})
+        inverted = client.get(url, params={"branch_id": "b-1", "date_from": "2026-03-02", "date_to": "2026-03-01"})
+        ok = client.get(url, params={"branch_id": "b-1", "date": "2026-03-01"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert missing.status_code == 400
+    assert inverted.status_code == 400
+    assert ok.status_code == 200
+    service.get_compliance_summary.assert_awaited_once_with("b-1", "2026-03-01", "2026-03-01")
+
+
+# -- Rollups --
+
+def _rollups(checklists):
+    """The rows migration 011's trigger would keep for these checklists."""
+    rows = {}
+    for c in checklists:
+        completed, total = count_items(c["checklist_data"])
+        for group_id in [None] + list(c.get("group_ids") or []):
+            row = rows.setdefault((c["template_id"], group_id), {
+                "template_id": c["template_id"], "group_id": group_id,
+                "completed": 0, "total": 0, "checklists": 0,
+            })
+            row["completed"] += completed
+            row["total"] += total
+            row["checklists"] += 1
+    return list(rows.values())
+
+
+def test_rollup_summary_matches_checklist_summary():
+    checklists = [
+        _checklist("t-open", 3, 4, ["g-kitchen", "g-hall"]),
+        _checklist("t-open", 1, 4, ["g-hall"]),
+        _checklist("t-close", 0, 2),
+    ]
+    assert summarize_rollups(_rollups(checklists)).to_dict() == summarize_checklists(checklists).to_dict()
+
+
+@pytest.mark.asyncio
+async def test_service_reads_only_rollups_when_enabled():
+    service, repo = _admin_service([])
+    service.compliance_rollups = True
+    repo.list_compliance_rollups = AsyncMock(return_value=_rollups([_checklist("t-1", 1, 4, ["g-1"])]))
+
+    result = await service.get_compliance_summary("branch-1", "2026-01-01", "2026-03-31")
+
+    repo.list_by_branch_range.assert_not_called()
+    repo.list_compliance_rollups.assert_awaited_once_with("branch-1", "2026-01-01", "2026-03-31")
+    assert result["source"] == "rollups"
+    assert result["overall_rate"] == 25.0
+    assert result["by_group"][0]["group_id"] == "g-1"
+
+
+@pytest.mark.asyncio
+async def test_backfill_job_rebuilds_in_chunks(monkeypatch):
+    repo = MagicMock()
+    repo.rebuild_compliance_rollups = AsyncMock(return_value=3)
+    monkeypatch.setattr(rebuild_job, "get_daily_checklist_repo", AsyncMock(return_value=repo))
+    monkeypatch.setattr(rebuild_job, "close_async_supabase", AsyncMock())
+
+    written = await rebuild_job.run(date(2026, 1, 1), date(2026, 1, 20), chunk_days=7)
+
+    assert written == 9
+    assert [c.args for c in repo.rebuild_compliance_rollups.call_args_list] == [
+        ("2026-01-01", "2026-01-07"), ("2026-01-08", "2026-01-14"), ("2026-01-15", "2026-01-20"),
+    ]
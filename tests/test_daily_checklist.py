@@ -0,0 +1,249 @@
+"""Tests for daily checklist item updates."""
+from datetime import date as Date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.dependencies import get_daily_checklist_service
+from app.core.security import get_current_principal
+from app.repositories import daily_checklist as checklist_module
+from app.repositories.daily_checklist import DailyChecklistRepository
+from app.schemas.user import Principal
+from app.services.daily_checklist_service import ChecklistVersionConflict, DailyChecklistService
+
+
+def _service(result):
+    repo = MagicMock()
+    repo.update_item = AsyncMock(return_value=result)
+    return DailyChecklistService(repo, MagicMock()), repo
+
+
+@pytest.mark.asyncio
+async def test_update_returns_only_changed_item_and_version():
+    item = {"item_id": "i-1", "is_completed": True, "completed_by": "user-1"}
+    service, repo = _service({"status": "ok", "item_index": 2, "item": item, "version": 8})
+
+    result = await service.update_checklist_item("c-1", 2, "user-1", True, expected_version=7)
+
+    assert result == {"item_index": 2, "item": item, "version": 8}
+    repo.update_item.assert_awaited_once_with(
+        "c-1", 2, user_id="user-1", is_completed=True, verification_data=None, expected_version=7
+    )
+    repo.get_by_id.assert_not_called()
+    repo.update_checklist_data.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status, message", [
+    ("not_found", "Checklist not found."),
+    ("invalid_index", "Invalid item index: 5"),
+])
+async def test_update_rejects_missing_checklist_and_bad_index(status, message):
+    service, _ = _service({"status": status, "version": None})
+    with pytest.raises(ValueError, match=message):
+        await service.update_checklist_item("c-1", 5, "user-1", True)
+
+
+@pytest.mark.asyncio
+async def test_stale_version_raises_conflict():
+    service, _ = _service({"status": "version_conflict", "version": 9})
+    with pytest.raises(ChecklistVersionConflict) as exc:
+        await service.update_checklist_item("c-1", 0, "user-1", True, expected_version=7)
+    assert exc.value.current_version == 9
+
+
+@pytest.mark.asyncio
+async def test_repository_updates_in_one_rpc(monkeypatch):
+    client = MagicMock()
+    client.rpc.return_value.execute = AsyncMock(return_value=MagicMock(data={"status": "ok"}))
+    monkeypatch.setattr(checklist_module, "async_supabase", client)
+
+    await DailyChecklistRepository().update_item("c-1", 0, "user-1", False)
+
+    client.rpc.assert_called_once()
+    assert client.rpc.call_args.args[0] == "update_daily_checklist_item"
+    client.table.assert_not_called()
+
+
+def test_endpoint_maps_conflict_to_409():
+    service = MagicMock()
+    service.update_checklist_item = AsyncMock(side_effect=ChecklistVersionConflict(4))
+    app.dependency_overrides[get_current_principal] = lambda: Principal(
+        id="user-1", company_id="company-1", role="staff", status="active"
+    )
+    app.dependency_overrides[get_daily_checklist_service] = lambda: service
+    try:
+        response = TestClient(app).patch(
+            "/api/v1/daily-checklists/c-1/items/0", json={"is_completed": True, "expected_version": 3}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 409
+    assert response.json()["detail"]["current_version"] == 4
+
+
+# -- Batch updates --
+
+@pytest.mark.asyncio
+async def test_batch_update_returns_per_item_results():
+    items = [
+        {"item_index": 0, "status": "applied", "item": {"is_completed": True}},
+        {"item_index": 1, "status": "conflict", "item": {"is_completed": False}},
+        {"item_index": 99, "status": "invalid_index"},
+    ]
+    repo = MagicMock()
+    repo.update_items = AsyncMock(return_value={"status": "ok", "version": 4, "items": items})
+    service = DailyChecklistService(repo, MagicMock())
+    changes = [{"item_index": 0, "is_completed": True}, {"item_index": 1, "is_completed": True, "base_completed": True}]
+
+    result = await service.update_checklist_items("c-1", "user-1", changes)
+
+    assert result == {"version": 4, "items": items}
+    repo.update_items.assert_awaited_once_with("c-1", "user-1", changes)
+
+
+@pytest.mark.asyncio
+async def test_batch_update_of_missing_checklist():
+    repo = MagicMock()
+    repo.update_items = AsyncMock(return_value={"status": "not_found"})
+    with pytest.raises(ValueError, match="Checklist not found."):
+        await DailyChecklistService(repo, MagicMock()).update_checklist_items("c-1", "user-1", [])
+
+
+def test_batch_endpoint_sends_all_changes_in_one_call():
+    service = MagicMock()
+    service.update_checklist_items = AsyncMock(return_value={"version": 2, "items": []})
+    app.dependency_overrides[get_current_principal] = lambda: Principal(
+        id="user-1", company_id="company-1", role="staff", status="active"
+    )
+    app.dependency_overrides[get_daily_checklist_service] = lambda: service
+    try:
+        client = TestClient(app)
+        response = client.patch("/api/v1/daily-checklists/c-1/items", json={"changes": [
+            {"item_index": i, "is_completed": True} for i in range(40)
+        ]})
+        empty = client.patch("/api/v1/daily-checklists/c-1/items", json={"changes": []})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    service.update_checklist_items.assert_awaited_once()
+    checklist_id, user_id, changes = service.update_checklist_items.call_args.args
+    assert (checklist_id, user_id, len(changes)) == ("c-1", "user-1", 40)
+    assert changes[0] == {"item_index": 0, "is_completed": True}
+    assert empty.status_code == 422
+
+
+# -- Bulk generation --
+
+def _bulk_service(templates, branches, existing=()):
+    checklist_repo = MagicMock()
+    checklist_repo.list_existing_keys = AsyncMock(return_value=list(existing))
+    checklist_repo.create_many = AsyncMock(side_effect=lambda rows: len(rows))
+    template_repo = MagicMock()
+    template_repo.list_active_templates = AsyncMock(return_value=templates)
+    org_repo = MagicMock()
+    org_repo.list_company_branches = AsyncMock(return_value=branches)
+    return DailyChecklistService(checklist_repo, template_repo, org_repo), checklist_repo
+
+
+def _branch(id, brand_id="brand-1"):
+    return MagicMock(id=id, brand_id=brand_id)
+
+
+@pytest.mark.asyncio
+async def test_generate_bulk_scopes_templates_and_skips_existing():
+    templates = [
+        {"id": "t-all", "items": [{"id": "i-1", "content": "Open"}], "groups": [{"group_id": "g-1"}]},
+        {"id": "t-branch", "branch_id": "b-2", "items": []},
+        {"id": "t-brand", "brand_id": "brand-2", "items": []},
+        {"id": "t-mon", "recurrence": {"type": "weekly", "days": [1]}, "items": []},
+    ]
+    branches = [_branch("b-1"), _branch("b-2"), _branch("b-3", brand_id="brand-2")]
+    existing = [{"template_id": "t-all", "branch_id": "b-1", "date": "2026-03-02"}]
+    service, repo = _bulk_service(templates, branches, existing)
+
+    # 2026-03-02 is a Monday.
+    result = await service.generate_bulk("company-1", Date(2026, 3, 2), Date(2026, 3, 3))
+
+    rows = repo.create_many.call_args.args[0]
+    keys = {(r["template_id"], r["branch_id"], r["date"]) for r in rows}
+    assert keys == {
+        ("t-all", "b-1", "2026-03-03"),
+        ("t-all", "b-2", "2026-03-02"), ("t-all", "b-2", "2026-03-03"),
+        ("t-all", "b-3", "2026-03-02"), ("t-all", "b-3", "2026-03-03"),
+        ("t-branch", "b-2", "2026-03-02"), ("t-branch", "b-2", "2026-03-03"),
+        ("t-brand", "b-3", "2026-03-02"), ("t-brand", "b-3", "2026-03-03"),
+        ("t-mon", "b-1", "2026-03-02"), ("t-mon", "b-2", "2026-03-02"), ("t-mon", "b-3", "2026-03-02"),
+    }
+    first = next(r for r in rows if r["template_id"] == "t-all")
+    assert first["group_ids"] == ["g-1"]
+    assert first["checklist_data"][0]["item_id"] == "i-1"
+    assert result == {"planned": 13, "created": 12, "skipped": 1}
+    repo.list_existing_keys.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("recurrence, expected", [
+    (None, ["02", "03", "04", "05", "06", "07", "08"]),
+    ({"type": "daily"}, ["02", "03", "04", "05", "06", "07", "08"]),
+    ({"type": "weekly", "days": [1, 3, 5]}, ["02", "04", "06"]),
+    ({"type": "weekend"}, ["07", "08"]),
+    ({"type": "weekday"}, ["02", "03", "04", "05", "06"]),
+    ({"type": "interval", "every": 3}, ["03", "06"]),
+    ({"type": "fortnightly"}, []),
+    ({"type": "weekly", "days_of_week": [0]}, []),
+])
+async def test_generate_bulk_follows_documented_recurrence(recurrence, expected):
+    # 2026-03-02 is a Monday; interval rules count from the template's creation.
+    template = {"id": "t-1", "recurrence": recurrence, "created_at": "2026-02-28T10:00:00+00:00", "items": []}
+    service, repo = _bulk_service([template], [_branch("b-1")])
+
+    await service.generate_bulk("company-1", Date(2026, 3, 2), Date(2026, 3, 8))
+
+    dates = sorted(r["date"] for r in repo.create_many.call_args.args[0]) if repo.create_many.called else []
+    assert dates == [f"2026-03-{day}" for day in expected]
+
+
+@pytest.mark.asyncio
+async def test_generate_bulk_with_nothing_missing_writes_nothing():
+    templates = [{"id": "t-1", "items": []}]
+    existing = [{"template_id": "t-1", "branch_id": "b-1", "date": "2026-03-02"}]
+    service, repo = _bulk_service(templates, [_branch("b-1")], existing)
+
+    result = await service.generate_bulk("company-1", Date(2026, 3, 2), Date(2026, 3, 2))
+
+    repo.create_many.assert_not_called()
+    assert result == {"planned": 1, "created": 0, "skipped": 1}
+
+
+def test_bulk_endpoint_requires_manager_and_bounded_range():
+    service = MagicMock()
+    service.generate_bulk = AsyncMock(return_value={"planned": 0, "created": 0, "skipped": 0})
+    app.dependency_overrides[get_daily_checklist_service] = lambda: service
+
+    def as_role(role):
+        app.dependency_overrides[get_current_principal] = lambda: Principal(
+            id="user-1", company_id="company-1", role=role, status="active"
+        )
+
+    try:
+        client = TestClient(app)
+        url = "/api/v1/daily-checklists/generate-bulk"
+        as_role("staff")
+        staff = client.post(url, json={"date_from": "2026-03-01", "date_to": "2026-03-01"})
+        as_role("manager")
+        too_long = client.post(url, json={"date_from": "2026-01-01", "date_to": "2026-12-31"})
+        ok = client.post(url, json={"date_from": "2026-03-01", "date_to": "2026-03-07"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert staff.status_code == 403
+    assert too_long.status_code == 400
+    assert ok.status_code == 200
+    service.generate_bulk.assert_awaited_once_with(
+        "company-1", Date(2026, 3, 1), Date(2026, 3, 7), branch_ids=None
+    )
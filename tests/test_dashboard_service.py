@@ -0,0 +1,164 @@
+"""Unit tests for DashboardService."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.cache import StatsTTLCache
+from app.schemas.notice import NoticeCreate
+from app.services.assignment_service import AssignmentService
+from app.services.dashboard_service import DashboardService
+from app.services.notice_service import NoticeService
+
+
+def _assignment(i, **overrides):
+    row = {
+        "id": f"a-{i}",
+        "company_id": "company-1",
+        "title": f"Task {i}",
+        "status": "todo",
+        "priority": "normal",
+        "due_date": None,
+        "created_at": f"2026-01-01T00:00:{i:02d}+00:00",
+        "assignees": [{"user_id": "user-1"}],
+    }
+    row.update(overrides)
+    return row
+
+
+def _notice_repo(notices=()):
+    repo = MagicMock()
+    repo.list_notices = AsyncMock(return_value=list(notices))
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_summary_uses_aggregated_counts(fake_assignment_repo):
+    for i, status in enumerate(["todo", "in_progress", "done", "done"]):
+        await fake_assignment_repo.create(_assignment(i, status=status))
+    await fake_assignment_repo.create(_assignment(5, priority="urgent", due_date="2026-02-01"))
+    await fake_assignment_repo.create(_assignment(6, priority="urgent", status="done"))
+    await fake_assignment_repo.create(_assignment(7, assignees=[{"user_id": "user-2"}]))
+    notices = [{"id": "n-1", "title": "Hello", "created_at": "2026-01-01", "content": "..."}]
+    service = DashboardService(fake_assignment_repo, _notice_repo(notices), MagicMock())
+
+    summary = await service.get_summary("user-1", "company-1")
+
+    assert summary["assignment_summary"] == {
+        "total_assignments": 6,
+        "completed": 3,
+        "in_progress": 1,
+        "todo": 2,
+        "completion_rate": 50.0,
+    }
+    assert summary["urgent_alerts"] == [{"id": "a-5", "title": "Task 5", "due_date": "2026-02-01"}]
+    assert summary["recent_notices"] == [{"id": "n-1", "title": "Hello", "created_at": "2026-01-01"}]
+
+
+@pytest.mark.asyncio
+async def test_urgent_alerts_are_bounded(fake_assignment_repo):
+    for i in range(5):
+        await fake_assignment_repo.create(_assignment(i, priority="urgent"))
+    service = DashboardService(fake_assignment_repo, _notice_repo(), MagicMock(), urgent_alert_limit=2)
+
+    summary = await service.get_summary("user-1", "company-1")
+
+    assert len(summary["urgent_alerts"]) == 2
+    assert summary["assignment_summary"]["total_assignments"] == 5
+
+
+@pytest.mark.asyncio
+async def test_summary_and_notices_load_concurrently():
+    started = []
+    both_started = asyncio.Event()
+
+    async def track(name, result):
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return result
+
+    assignment_repo = MagicMock()
+    assignment_repo.get_assignee_summary = lambda *a, **k: track("summary", {
+        "total_assignments": 0, "completed": 0, "in_progress": 0, "todo": 0, "urgent_alerts": [],
+    })
+    notice_repo = MagicMock()
+    notice_repo.list_notices = lambda *a, **k: track("notices", [])
+    service = DashboardService(assignment_repo, notice_repo, MagicMock())
+
+    summary = await service.get_summary("user-1", "company-1")
+
+    assert sorted(started) == ["notices", "summary"]
+    assert summary["assignment_summary"]["completion_rate"] == 0
+
+
+# -- Caching --
+
+def _cached_service(fake_assignment_repo, notice_repo):
+    return DashboardService(
+        fake_assignment_repo, notice_repo, MagicMock(),
+        summary_cache=StatsTTLCache(maxsize=100, ttl=60),
+        notice_cache=StatsTTLCache(maxsize=100, ttl=60),
+    )
+
+
+@pytest.mark.asyncio
+async def test_summary_is_served_from_cache(fake_assignment_repo):
+    await fake_assignment_repo.create(_assignment(1))
+    notice_repo = _notice_repo()
+    service = _cached_service(fake_assignment_repo, notice_repo)
+    fake_assignment_repo.get_assignee_summary = AsyncMock(
+        wraps=fake_assignment_repo.get_assignee_summary
+    )
+
+    first = await service.get_summary("user-1", "company-1")
+    second = await service.get_summary("user-1", "company-1")
+
+    assert first == second
+    fake_assignment_repo.get_assignee_summary.assert_awaited_once()
+    notice_repo.list_notices.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_assignment_writes_invalidate_assignee_summaries(fake_assignment_repo):
+    await fake_assignment_repo.create(_assignment(1))
+    dashboard = _cached_service(fake_assignment_repo, _notice_repo())
+    assignments = AssignmentService(fake_assignment_repo, dashboard_cache=dashboard.summary_cache)
+
+    before = await dashboard.get_summary("user-1", "company-1")
+    await assignments.update_status("a-1", "done")
+    after = await dashboard.get_summary("user-1", "company-1")
+
+    assert before["assignment_summary"]["completed"] == 0
+    assert after["assignment_summary"]["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_adding_an_assignee_invalidates_their_summary(fake_assignment_repo):
+    await fake_assignment_repo.create(_assignment(1))
+    dashboard = _cached_service(fake_assignment_repo, _notice_repo())
+    assignments = AssignmentService(fake_assignment_repo, dashboard_cache=dashboard.summary_cache)
+    await dashboard.get_summary("user-2", "company-1")
+    await dashboard.get_summary("user-1", "company-1")
+
+    await assignments.add_assignees("a-1", ["user-2"])
+
+    assert dashboard.summary_cache.get(("user-2", "company-1")) is None
+    assert dashboard.summary_cache.get(("user-1", "company-1")) is not None
+
+
+@pytest.mark.asyncio
+async def test_new_notice_invalidates_company_notices(fake_assignment_repo):
+    notice_repo = _notice_repo()
+    notice_repo.create_notice = AsyncMock(return_value={"id": "n-1", "company_id": "company-1"})
+    dashboard = _cached_service(fake_assignment_repo, notice_repo)
+    notices = NoticeService(notice_repo, dashboard_notice_cache=dashboard.notice_cache)
+    await dashboard.get_summary("user-1", "company-1")
+
+    await notices.create_notice(
+        NoticeCreate(title="Hi", content="..."), "user-9", "Boss", "manager", "company-1"
+    )
+    await dashboard.get_summary("user-1", "company-1")
+
+    assert notice_repo.list_notices.await_count == 2
@@ -0,0 +1,95 @@
+"""Unit tests for the application-scoped dependency container."""
+import pytest
+
+from app.core.dependencies import Container, Scope
+
+
+class _Closable:
+    def __init__(self):
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_singleton_is_built_once():
+    container = Container()
+    calls = []
+
+    @container.provider(Scope.SINGLETON)
+    def get_thing():
+        calls.append(1)
+        return object()
+
+    assert await get_thing() is await get_thing()
+    assert get_thing.sync() is await get_thing()
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_request_scoped_is_built_every_time():
+    container = Container()
+
+    @container.provider(Scope.REQUEST)
+    def get_thing():
+        return object()
+
+    assert await get_thing() is not await get_thing()
+
+
+@pytest.mark.asyncio
+async def test_singletons_share_dependencies():
+    container = Container()
+
+    @container.provider(Scope.SINGLETON)
+    def get_repo():
+        return object()
+
+    @container.provider(Scope.SINGLETON)
+    def get_service():
+        return {"repo": get_repo.sync()}
+
+    assert (await get_service())["repo"] is await get_repo()
+
+
+def test_resolvers_skip_the_threadpool():
+    """FastAPI runs sync dependencies in its threadpool; resolvers are coroutine functions."""
+    from fastapi.dependencies.models import Dependant
+    from app.core.dependencies import get_assignment_service
+
+    assert Dependant(call=get_assignment_service).is_coroutine_callable
+
+
+@pytest.mark.asyncio
+async def test_startup_builds_and_shutdown_closes():
+    container = Container()
+    built = []
+
+    @container.provider(Scope.SINGLETON)
+    def get_resource():
+        resource = _Closable()
+        built.append(resource)
+        return resource
+
+    await container.startup()
+    assert len(built) == 1
+
+    await container.shutdown()
+    assert built[0].closed is True
+    # A fresh instance is built after shutdown.
+    assert await get_resource() is not built[0]
+
+
+@pytest.mark.asyncio
+async def test_every_app_provider_resolves():
+    """Container.startup() runs in the app lifespan; a broken provider stops the app from starting."""
+    from app.core.dependencies import container
+
+    await container.startup()
+    try:
+        for name, (_, scope) in container._providers.items():
+            if scope is Scope.REQUEST:
+                container.resolve(name)
+    finally:
+        await container.shutdown()
@@ -1,6 +1,8 @@
+import os
 import pytest
 from pathlib import Path
 from app.core.email import _load_template, TEMPLATE_DIR
+from app.core.email_templates import CompiledTemplate, TemplateCache
 
 
 class TestLoadTemplate:
@@ -46,3 +48,39 @@ class TestLoadTemplate:
         assert "15" in html
         assert "ResetApp" in html
         assert "{{code}}" not in html
+
+
+class TestCompiledTemplates:
+    def test_values_are_html_escaped(self):
+        html = _load_template(
+            "notification_email.html",
+            title="<b>Hi</b>",
+            message='Tom & "Jerry"',
+            app_name="App",
+        )
+        assert "&lt;b&gt;Hi&lt;/b&gt;" in html
+        assert "Tom &amp; &quot;Jerry&quot;" in html
+        assert "<b>Hi</b>" not in html
+
+    def test_missing_value_keeps_placeholder(self):
+        tpl = CompiledTemplate("<p>{{a}} and {{b}}</p>")
+        assert tpl.render(a="x") == "<p>x and {{b}}</p>"
+
+    def test_cache_recompiles_on_mtime_change(self, tmp_path):
+        path = tmp_path / "t.html"
+        path.write_text("<p>{{name}}</p>", encoding="utf-8")
+        cache = TemplateCache(tmp_path, check_interval=0)
+        assert cache.render("t.html", name="a") == "<p>a</p>"
+
+        path.write_text("<div>{{name}}</div>", encoding="utf-8")
+        os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 10))
+        assert cache.render("t.html", name="a") == "<div>a</div>"
+
+    def test_cache_skips_stat_within_interval(self, tmp_path):
+        path = tmp_path / "t.html"
+        path.write_text("<p>{{name}}</p>", encoding="utf-8")
+        cache = TemplateCache(tmp_path, check_interval=3600)
+        cache.preload()
+
+        path.unlink()
+        assert cache.render("t.html", name="a") == "<p>a</p>"
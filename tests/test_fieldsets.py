@@ -0,0 +1,77 @@
+"""Tests for sparse fieldsets (fields= / include=)."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.dependencies import get_assignment_service
+from app.core.fieldsets import FieldSet, InvalidFieldSet
+from app.core.security import get_current_principal
+from app.repositories.assignment import ASSIGNMENT_DETAIL_FIELDS, ASSIGNMENT_LIST_FIELDS
+from app.schemas.user import Principal
+
+
+FIELDS = FieldSet(
+    ("id", "title", "status", "created_at"),
+    {"assignees": "assignees:assignment_assignees(*)", "comments": "comments(*)"},
+    required=("id", "created_at"),
+)
+
+
+def test_default_select_is_all_columns_without_embeds():
+    assert FIELDS.select() == "*"
+    assert ASSIGNMENT_LIST_FIELDS.select() == "*"
+
+
+def test_fields_are_narrowed_and_keep_required_columns():
+    assert FIELDS.select(["title", "id"]) == "id,created_at,title"
+
+
+def test_include_adds_embeds_once():
+    assert FIELDS.select(["title"], ["comments", "comments"]) == "id,created_at,title,comments(*)"
+
+
+def test_detail_embeds_assignees_by_default_but_not_comments():
+    assert ASSIGNMENT_DETAIL_FIELDS.select() == "*,assignees:assignment_assignees(*)"
+    assert ASSIGNMENT_DETAIL_FIELDS.select(include=[]) == "*"
+
+
+@pytest.mark.parametrize("fields, include", [(["password"], None), (None, ["users"])])
+def test_unknown_names_are_rejected(fields, include):
+    with pytest.raises(InvalidFieldSet):
+        FIELDS.select(fields, include)
+
+
+def _client(service):
+    app.dependency_overrides[get_current_principal] = lambda: Principal(
+        id="user-1", company_id="company-1", role="staff", status="active"
+    )
+    app.dependency_overrides[get_assignment_service] = lambda: service
+    return TestClient(app)
+
+
+def test_endpoint_passes_compiled_select():
+    service = MagicMock()
+    service.get_assignment = AsyncMock(return_value={"id": "a-1"})
+    try:
+        response = _client(service).get(
+            "/api/v1/assignments/a-1", params={"fields": "title,status", "include": "comments"}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert service.get_assignment.call_args.kwargs["select"] == "id,title,status,comments(*)"
+
+
+def test_endpoint_rejects_unknown_field():
+    service = MagicMock()
+    service.list_assignments = AsyncMock(return_value=([], None))
+    try:
+        response = _client(service).get("/api/v1/assignments/", params={"fields": "secret"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 400
+    service.list_assignments.assert_not_called()
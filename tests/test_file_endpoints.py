@@ -4,21 +4,17 @@ from unittest.mock import AsyncMock
 from fastapi.testclient import TestClient
 from app.main import app
 from app.core.dependencies import get_file_service
-from app.core.security import get_current_user
+from app.core.security import get_current_principal
 from app.services.file_service import FileService
-from app.schemas.user import User
-from datetime import datetime
+from app.schemas.user import Principal
 
 
 def _mock_user():
-    return User(
+    return Principal(
         id="user-1",
-        email="test@example.com",
-        login_id="testuser",
-        full_name="Test User",
         company_id="company-1",
-        created_at=datetime(2026, 1, 1),
-        updated_at=datetime(2026, 1, 1),
+        role="staff",
+        status="active",
     )
 
 
@@ -41,7 +37,7 @@ client = TestClient(app)
 def test_upload_success():
     mock_service = _mock_file_service()
     app.dependency_overrides[get_file_service] = lambda: mock_service
-    app.dependency_overrides[get_current_user] = _mock_user
+    app.dependency_overrides[get_current_principal] = _mock_user
     try:
         response = client.post(
             "/api/v1/files/upload",
@@ -60,7 +56,7 @@ def test_upload_too_large():
     mock_service = _mock_file_service()
     mock_service.upload_file = AsyncMock(side_effect=ValueError("File size exceeds 10MB limit."))
     app.dependency_overrides[get_file_service] = lambda: mock_service
-    app.dependency_overrides[get_current_user] = _mock_user
+    app.dependency_overrides[get_current_principal] = _mock_user
     try:
         response = client.post(
             "/api/v1/files/upload",
@@ -75,7 +71,7 @@ def test_upload_bad_type():
     mock_service = _mock_file_service()
     mock_service.upload_file = AsyncMock(side_effect=ValueError("File type '.exe' is not allowed."))
     app.dependency_overrides[get_file_service] = lambda: mock_service
-    app.dependency_overrides[get_current_user] = _mock_user
+    app.dependency_overrides[get_current_principal] = _mock_user
     try:
         response = client.post(
             "/api/v1/files/upload",
@@ -89,7 +85,7 @@ def test_upload_bad_type():
 def test_delete_success():
     mock_service = _mock_file_service()
     app.dependency_overrides[get_file_service] = lambda: mock_service
-    app.dependency_overrides[get_current_user] = _mock_user
+    app.dependency_overrides[get_current_principal] = _mock_user
     try:
         response = client.request(
             "DELETE",
@@ -105,7 +101,7 @@ def test_delete_success():
 def test_presigned_url_success():
     mock_service = _mock_file_service()
     app.dependency_overrides[get_file_service] = lambda: mock_service
-    app.dependency_overrides[get_current_user] = _mock_user
+    app.dependency_overrides[get_current_principal] = _mock_user
     try:
         response = client.post(
             "/api/v1/files/presigned-url",
@@ -1,4 +1,6 @@
 """Unit tests for INotificationChannel, EmailNotificationChannel, and NotificationDispatcher."""
+import asyncio
+import time
 import pytest
 from unittest.mock import AsyncMock, patch
 
@@ -62,3 +64,62 @@ async def test_dispatcher_empty_channels():
     """Dispatcher with no channels doesn't raise."""
     dispatcher = NotificationDispatcher(channels=[])
     await dispatcher.dispatch("user@test.com", "Title", "Message")
+
+
+class SlowChannel(FakeNotificationChannel):
+    def __init__(self, delay: float, timeout=None):
+        super().__init__()
+        self.delay = delay
+        self.timeout = timeout
+
+    async def send(self, recipient_email, title, message, context=None):
+        await asyncio.sleep(self.delay)
+        return await super().send(recipient_email, title, message, context)
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_runs_channels_concurrently():
+    """Total latency is the slowest channel, not the sum."""
+    dispatcher = NotificationDispatcher(channels=[SlowChannel(0.1), SlowChannel(0.1), SlowChannel(0.1)])
+
+    start = time.perf_counter()
+    assert await dispatcher.dispatch("user@test.com", "Title", "Message") is True
+
+    assert time.perf_counter() - start < 0.25
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_times_out_slow_channel():
+    """A channel past its deadline fails without holding back the others."""
+    slow = SlowChannel(1.0, timeout=0.05)
+    fast = FakeNotificationChannel()
+    dispatcher = NotificationDispatcher(channels=[slow, fast])
+
+    assert await dispatcher.dispatch("user@test.com", "Title", "Message") is False
+
+    assert len(fast.sent) == 1
+    metrics = dispatcher.metrics()
+    assert metrics["SlowChannel"]["timeouts"] == 1
+    assert metrics["FakeNotificationChannel"]["calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_limits_per_channel_concurrency():
+    in_flight = 0
+    peak = 0
+
+    class CountingChannel(FakeNotificationChannel):
+        max_concurrency = 2
+
+        async def send(self, recipient_email, title, message, context=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+    dispatcher = NotificationDispatcher(channels=[CountingChannel()])
+    await asyncio.gather(*(dispatcher.dispatch(f"u{i}@test.com", "T", "M") for i in range(6)))
+
+    assert peak == 2
@@ -0,0 +1,148 @@
+"""Unit tests for the notification outbox and OutboxWorker."""
+import pytest
+
+from tests.conftest import FakeNotificationChannel
+from app.notifications.dispatcher import NotificationDispatcher
+from app.notifications.outbox import OutboxWorker
+from app.repositories.notification import INotificationOutboxRepository
+
+
+class FakeOutboxRepository(INotificationOutboxRepository):
+    """Serves jobs from the fake notification repo's outbox list."""
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+
+    async def claim(self, limit, lease_seconds):
+        due = [j for j in self.jobs if j["status"] == "pending"][:limit]
+        for job in due:
+            job["status"] = "processing"
+            job["attempts"] += 1
+        return [dict(j) for j in due]
+
+    def _job(self, job_id):
+        return next(j for j in self.jobs if j["id"] == job_id)
+
+    async def mark_sent(self, job_id):
+        self._job(job_id)["status"] = "sent"
+
+    async def mark_skipped(self, job_id, reason):
+        self._job(job_id).update(status="skipped", last_error=reason)
+
+    async def mark_failed(self, job_id, error, retry_at):
+        self._job(job_id).update(
+            status="failed" if retry_at is None else "pending",
+            last_error=error,
+            retry_at=retry_at,
+        )
+
+
+def _worker(outbox_repo, auth_repo, channel, max_attempts=3):
+    return OutboxWorker(
+        outbox_repo=outbox_repo,
+        auth_repo=auth_repo,
+        dispatcher=NotificationDispatcher(channels=[channel]),
+        max_attempts=max_attempts,
+    )
+
+
+@pytest.mark.asyncio
+async def test_notify_with_outbox_does_not_dispatch_inline(
+    notification_service, fake_notification_repo, fake_auth_repo, fake_notification_channel
+):
+    fake_auth_repo.users["user-1"] = {"id": "user-1", "email": "user@test.com"}
+    notification_service.use_outbox = True
+
+    await notification_service.notify("company-1", "user-1", "comment", "Title", "Body")
+
+    assert len(fake_notification_repo.notifications) == 1
+    assert len(fake_notification_repo.outbox) == 1
+    assert fake_notification_channel.sent == []
+
+
+@pytest.mark.asyncio
+async def test_worker_delivers_pending_jobs(
+    notification_service, fake_notification_repo, fake_auth_repo, fake_notification_channel
+):
+    fake_auth_repo.users["user-1"] = {"id": "user-1", "email": "user@test.com"}
+    notification_service.use_outbox = True
+    await notification_service.notify("company-1", "user-1", "comment", "Title", "Body")
+    worker = _worker(FakeOutboxRepository(fake_notification_repo.outbox), fake_auth_repo, fake_notification_channel)
+
+    processed = await worker.run_once()
+
+    assert processed == 1
+    assert fake_notification_repo.outbox[0]["status"] == "sent"
+    assert fake_notification_channel.sent[0]["to"] == "user@test.com"
+
+
+@pytest.mark.asyncio
+async def test_worker_retries_then_gives_up(fake_auth_repo):
+    fake_auth_repo.users["user-1"] = {"id": "user-1", "email": "user@test.com"}
+    jobs = [{"id": "job-1", "user_id": "user-1", "title": "T", "message": "M", "status": "pending", "attempts": 0}]
+    worker = _worker(FakeOutboxRepository(jobs), fake_auth_repo, FakeNotificationChannel(should_fail=True), max_attempts=2)
+
+    await worker.run_once()
+    assert jobs[0]["status"] == "pending"
+    assert jobs[0]["retry_at"] is not None
+
+    await worker.run_once()
+    assert jobs[0]["status"] == "failed"
+    assert jobs[0]["attempts"] == 2
+
+
+@pytest.mark.asyncio
+async def test_worker_skips_recipient_without_email(fake_auth_repo, fake_notification_channel):
+    fake_auth_repo.users["user-1"] = {"id": "user-1"}
+    jobs = [{"id": "job-1", "user_id": "user-1", "title": "T", "message": "M", "status": "pending", "attempts": 0}]
+    worker = _worker(FakeOutboxRepository(jobs), fake_auth_repo, fake_notification_channel)
+
+    await worker.run_once()
+
+    assert jobs[0]["status"] == "skipped"
+    assert fake_notification_channel.sent == []
+
+
+@pytest.mark.asyncio
+async def test_worker_batches_lookup_and_groups_dispatch(fake_auth_repo, fake_notification_channel):
+    for uid in ("user-1", "user-2", "user-3"):
+        fake_auth_repo.users[uid] = {"id": uid, "email": f"{uid}@test.com"}
+    jobs = [
+        {"id": f"job-{i}", "user_id": uid, "title": title, "message": "M", "status": "pending", "attempts": 0}
+        for i, (uid, title) in enumerate([("user-1", "A"), ("user-2", "A"), ("user-3", "B")])
+    ]
+    lookups, grouped = [], []
+    get_emails = fake_auth_repo.get_emails_by_ids
+    fake_auth_repo.get_emails_by_ids = lambda ids: lookups.append(sorted(ids)) or get_emails(ids)
+    fake_auth_repo.get_user_by_id = None  # per-job lookups are not used
+    send_many = fake_notification_channel.send_many
+    fake_notification_channel.send_many = lambda emails, *args: grouped.append(list(emails)) or send_many(emails, *args)
+    worker = _worker(FakeOutboxRepository(jobs), fake_auth_repo, fake_notification_channel)
+
+    await worker.run_once()
+
+    assert lookups == [["user-1", "user-2", "user-3"]]
+    assert sorted(grouped) == [["user-1@test.com", "user-2@test.com"], ["user-3@test.com"]]
+    assert [j["status"] for j in jobs] == ["sent", "sent", "sent"]
+
+
+@pytest.mark.asyncio
+async def test_worker_marks_each_recipient_of_a_group(fake_auth_repo):
+    fake_auth_repo.users["user-1"] = {"id": "user-1", "email": "ok@test.com"}
+    fake_auth_repo.users["user-2"] = {"id": "user-2", "email": "bad@test.com"}
+    jobs = [
+        {"id": f"job-{uid}", "user_id": uid, "title": "T", "message": "M", "status": "pending", "attempts": 0}
+        for uid in ("user-1", "user-2")
+    ]
+
+    class PartialChannel(FakeNotificationChannel):
+        async def send(self, recipient_email, title, message, context=None):
+            return recipient_email != "bad@test.com"
+
+    worker = _worker(FakeOutboxRepository(jobs), fake_auth_repo, PartialChannel())
+
+    await worker.run_once()
+
+    assert jobs[0]["status"] == "sent"
+    assert jobs[1]["status"] == "pending"
+    assert jobs[1]["retry_at"] is not None
@@ -1,9 +1,11 @@
 """Unit tests for NotificationService.notify() method."""
 import pytest
+from unittest.mock import AsyncMock
 
 from tests.conftest import FakeNotificationChannel, FakeNotificationRepository, FakeAuthRepository
 from app.notifications.dispatcher import NotificationDispatcher
 from app.services.notification_service import NotificationService
+from app.core.cache import StatsTTLCache
 
 
 @pytest.fixture
@@ -114,3 +116,90 @@ async def test_notify_dispatch_failure_doesnt_raise(setup_notification_service):
     )
 
     assert len(notif_repo.notifications) == 1  # DB record still created
+
+
+# -- notify_many --
+
+@pytest.mark.asyncio
+async def test_notify_many_batches_round_trips(setup_notification_service):
+    """One bulk insert, one email lookup and one grouped dispatch for N users."""
+    service, notif_repo, auth_repo, channel = setup_notification_service
+    for i in range(3):
+        auth_repo.users[f"user-{i}"] = {"id": f"user-{i}", "email": f"u{i}@test.com"}
+    calls = {"create": 0, "create_many": 0, "get_user_by_id": 0, "get_emails_by_ids": 0}
+
+    def counting(name, fn):
+        async def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return await fn(*args, **kwargs)
+        return wrapper
+
+    notif_repo.create_many = counting("create_many", notif_repo.create_many)
+    auth_repo.get_user_by_id = counting("get_user_by_id", auth_repo.get_user_by_id)
+    auth_repo.get_emails_by_ids = counting("get_emails_by_ids", auth_repo.get_emails_by_ids)
+
+    await service.notify_many(
+        company_id="company-1",
+        user_ids=["user-0", "user-1", "user-2", "user-1"],
+        notification_type="comment",
+        title="Test",
+        message="Hello",
+    )
+
+    assert [n["user_id"] for n in notif_repo.notifications] == ["user-0", "user-1", "user-2"]
+    assert calls["create_many"] == 1
+    assert calls["get_emails_by_ids"] == 1
+    assert calls["get_user_by_id"] == 0
+    assert sorted(s["to"] for s in channel.sent) == ["u0@test.com", "u1@test.com", "u2@test.com"]
+
+
+@pytest.mark.asyncio
+async def test_notify_many_skips_users_without_email(setup_notification_service):
+    service, notif_repo, auth_repo, channel = setup_notification_service
+    auth_repo.users["user-1"] = {"id": "user-1", "email": "user@test.com"}
+    auth_repo.users["user-2"] = {"id": "user-2"}
+
+    await service.notify_many("company-1", ["user-1", "user-2"], "comment", "Test", "Hello")
+
+    assert len(notif_repo.notifications) == 2
+    assert [s["to"] for s in channel.sent] == ["user@test.com"]
+
+
+@pytest.mark.asyncio
+async def test_notify_many_with_outbox_only_persists(setup_notification_service):
+    service, notif_repo, auth_repo, channel = setup_notification_service
+    auth_repo.users["user-1"] = {"id": "user-1", "email": "user@test.com"}
+    service.use_outbox = True
+
+    await service.notify_many("company-1", ["user-1"], "comment", "Test", "Hello")
+
+    assert len(notif_repo.outbox) == 1
+    assert channel.sent == []
+
+
+# -- Unread counter cache --
+
+@pytest.mark.asyncio
+async def test_unread_count_served_from_cache(setup_notification_service):
+    service, notif_repo, _, _ = setup_notification_service
+    service.unread_cache = StatsTTLCache(maxsize=10, ttl=60)
+    notif_repo.count_unread = AsyncMock(return_value=3)
+
+    assert await service.count_unread("user-1", "company-1") == 3
+    assert await service.count_unread("user-1", "company-1") == 3
+    notif_repo.count_unread.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_notify_and_mark_all_keep_cached_count_current(setup_notification_service):
+    service, notif_repo, _, _ = setup_notification_service
+    service.unread_cache = StatsTTLCache(maxsize=10, ttl=60)
+    await service.count_unread("user-1", "company-1")
+
+    await service.notify("company-1", "user-1", "comment", "Test", "Hello")
+    assert await service.count_unread("user-1", "company-1") == 1
+
+    assert await service.mark_all_as_read("user-1", "company-1") == 1
+    notif_repo.count_unread = AsyncMock()
+    assert await service.count_unread("user-1", "company-1") == 0
+    notif_repo.count_unread.assert_not_awaited()
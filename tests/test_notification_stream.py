@@ -0,0 +1,137 @@
+"""Tests for the in-process notification hub and the SSE stream endpoint."""
+import json
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.dependencies import get_notification_hub, get_notification_service
+from app.core.security import get_current_principal
+from app.notifications.hub import NotificationHub
+from app.repositories import notification as notification_module
+from app.repositories.notification import NotificationRepository
+from app.schemas.notification import Notification
+from app.schemas.user import Principal
+
+LAST_ID = "6f1c2a4e-9b7d-4c3a-8e2f-1a2b3c4d5e6f"
+
+
+def _notification(notification_id: str) -> dict:
+    return {
+        "id": notification_id,
+        "company_id": "company-1",
+        "user_id": "user-1",
+        "type": "comment",
+        "title": "Title",
+        "message": "Message",
+        "is_read": False,
+        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc).isoformat(),
+    }
+
+
+def test_publish_reaches_only_that_users_streams():
+    hub = NotificationHub()
+    mine = hub.subscribe("user-1")
+    other = hub.subscribe("user-2")
+
+    hub.publish("user-1", {"id": "n-1"})
+
+    assert mine.get_nowait() == {"id": "n-1"}
+    assert other.empty()
+
+
+def test_lagging_subscriber_is_cut_off():
+    hub = NotificationHub(queue_size=2)
+    queue = hub.subscribe("user-1")
+
+    for i in range(3):
+        hub.publish("user-1", {"id": f"n-{i}"})
+
+    assert queue.get_nowait() is None
+    assert hub.subscriber_count("user-1") == 0
+
+
+@pytest.mark.asyncio
+async def test_notify_publishes_to_hub(notification_service, fake_auth_repo):
+    hub = NotificationHub()
+    notification_service.hub = hub
+    queue = hub.subscribe("user-1")
+
+    await notification_service.notify("company-1", "user-1", "comment", "Title", "Body")
+
+    assert queue.get_nowait()["title"] == "Title"
+
+
+def test_stream_replays_then_sends_live_events():
+    service = AsyncMock()
+    service.list_since = AsyncMock(return_value=[Notification(**_notification("n-2"))])
+
+    class PrefilledHub(NotificationHub):
+        def subscribe(self, user_id):
+            queue = super().subscribe(user_id)
+            queue.put_nowait(_notification("n-2"))  # already replayed, must not repeat
+            queue.put_nowait(_notification("n-3"))
+            queue.put_nowait(None)
+            return queue
+
+    hub = PrefilledHub()
+    app.dependency_overrides[get_current_principal] = lambda: Principal(
+        id="user-1", company_id="company-1", role="staff", status="active"
+    )
+    app.dependency_overrides[get_notification_service] = lambda: service
+    app.dependency_overrides[get_notification_hub] = lambda: hub
+    try:
+        response = TestClient(app).get(
+            "/api/v1/notifications/stream", headers={"Last-Event-ID": LAST_ID}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [
+        json.loads(line[len("data: "):])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert [e["id"] for e in events] == ["n-2", "n-3"]
+    service.list_since.assert_awaited_once()
+    assert service.list_since.await_args.args[2] == LAST_ID
+    assert hub.subscriber_count("user-1") == 0
+
+
+def test_stream_ignores_malformed_last_event_id():
+    service = AsyncMock()
+
+    class ClosingHub(NotificationHub):
+        def subscribe(self, user_id):
+            queue = super().subscribe(user_id)
+            queue.put_nowait(_notification("n-3"))
+            queue.put_nowait(None)
+            return queue
+
+    app.dependency_overrides[get_current_principal] = lambda: Principal(
+        id="user-1", company_id="company-1", role="staff", status="active"
+    )
+    app.dependency_overrides[get_notification_service] = lambda: service
+    app.dependency_overrides[get_notification_hub] = lambda: ClosingHub()
+    try:
+        response = TestClient(app).get(
+            "/api/v1/notifications/stream", headers={"Last-Event-ID": f"{LAST_ID}),id.gt.(0"}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert "n-3" in response.text
+    service.list_since.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_repository_ignores_malformed_after_id(monkeypatch):
+    client = MagicMock()
+    monkeypatch.setattr(notification_module, "async_supabase", client)
+
+    assert await NotificationRepository().list_after("user-1", "company-1", "n-1") == []
+    client.table.assert_not_called()
@@ -0,0 +1,129 @@
+"""Unit tests for keyset cursor pagination."""
+import base64
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.pagination import (
+    InvalidCursor, decode_cursor, encode_cursor, paginate, split_page,
+)
+from app.core.security import get_current_principal
+from app.schemas.user import Principal
+from tests.conftest import cursor_key
+
+
+class RecordingQuery:
+    """Records PostgREST builder calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return method
+
+
+ID = "6f1c2a4e-9b7d-4c3a-8e2f-1a2b3c4d5e6f"
+
+
+def _id(i):
+    return f"00000000-0000-0000-0000-{i:012d}"
+
+
+def _rows(n):
+    return [{"id": _id(i), "created_at": f"2026-01-01T00:00:{i:02d}+00:00"} for i in range(n)]
+
+
+def _raw_cursor(created_at, row_id):
+    raw = json.dumps([created_at, row_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def test_cursor_roundtrip():
+    cursor = encode_cursor({"id": ID, "created_at": "2026-01-01T00:00:00+00:00"})
+    assert decode_cursor(cursor) == ("2026-01-01T00:00:00+00:00", ID)
+
+
+def test_garbage_cursor_is_rejected():
+    with pytest.raises(InvalidCursor):
+        decode_cursor("not-a-cursor")
+
+
+@pytest.mark.parametrize("created_at, row_id", [
+    ('2026-01-01T00:00:00+00:00",id.gt.0', ID),
+    ("2026-01-01T00:00:00+00:00", f"{ID}),id.neq.(0"),
+    ("2026-01-01T00:00:00+00:00", "id-1"),
+    ("yesterday", ID),
+    (20260101, ID),
+])
+def test_tampered_cursor_is_rejected(created_at, row_id):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(_raw_cursor(created_at, row_id))
+    with pytest.raises(InvalidCursor):
+        paginate(RecordingQuery(), _raw_cursor(created_at, row_id), limit=20)
+
+
+def test_cursor_values_are_reserialized():
+    cursor = _raw_cursor("2026-01-01T00:00:00Z", ID.upper())
+    assert decode_cursor(cursor) == ("2026-01-01T00:00:00+00:00", ID)
+
+
+def test_split_page_returns_next_cursor_only_when_more_rows():
+    page, next_cursor = split_page(_rows(3), limit=2)
+    assert [r["id"] for r in page] == [_id(0), _id(1)]
+    assert decode_cursor(next_cursor) == ("2026-01-01T00:00:01+00:00", _id(1))
+
+    page, next_cursor = split_page(_rows(2), limit=2)
+    assert len(page) == 2
+    assert next_cursor is None
+
+
+def test_paginate_applies_keyset_filter():
+    cursor = encode_cursor({"id": ID, "created_at": "2026-01-01T00:00:09+00:00"})
+    query = paginate(RecordingQuery(), cursor, limit=20)
+
+    names = [c[0] for c in query.calls]
+    assert names == ["or_", "order", "order", "limit"]
+    assert query.calls[0][1][0] == (
+        'created_at.lt."2026-01-01T00:00:09+00:00",'
+        f'and(created_at.eq."2026-01-01T00:00:09+00:00",id.lt.{ID})'
+    )
+    assert query.calls[-1][1] == (21,)
+
+
+@pytest.mark.asyncio
+async def test_comment_pages_chain(comment_service, fake_comment_repo):
+    for i in range(5):
+        await fake_comment_repo.create({"assignment_id": "a-1", "user_id": "u", "content": str(i)})
+
+    async def list_page(assignment_id, limit=50, cursor=None):
+        rows = fake_comment_repo.comments
+        if cursor:
+            _, last_id = cursor_key(cursor)
+            rows = rows[[r["id"] for r in rows].index(last_id) + 1:]
+        return rows[:limit + 1]
+
+    fake_comment_repo.list_by_assignment = list_page
+
+    first, cursor = await comment_service.list_comments("a-1", limit=2)
+    second, cursor = await comment_service.list_comments("a-1", limit=2, cursor=cursor)
+    third, cursor = await comment_service.list_comments("a-1", limit=2, cursor=cursor)
+
+    assert [c.content for c in first + second + third] == ["0", "1", "2", "3", "4"]
+    assert cursor is None
+
+
+def test_invalid_cursor_returns_400():
+    app.dependency_overrides[get_current_principal] = lambda: Principal(
+        id="user-1", company_id="company-1", role="staff", status="active"
+    )
+    try:
+        response = TestClient(app).get("/api/v1/notifications/", params={"cursor": "garbage"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 400
@@ -0,0 +1,64 @@
+"""Unit tests for pooled bcrypt hashing, cost calibration and rehash-on-login."""
+import bcrypt
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core import password
+from app.core.config import settings
+from app.repositories.auth import CustomAuthRepository
+
+
+@pytest.fixture(autouse=True)
+def low_cost(monkeypatch):
+    monkeypatch.setattr(password, "_rounds", 4)
+
+
+@pytest.mark.asyncio
+async def test_async_hash_roundtrip():
+    hashed = await password.hash_password_async("secret")
+
+    assert await password.verify_password_async("secret", hashed) is True
+    assert await password.verify_password_async("wrong", hashed) is False
+    assert hashed.startswith("$2b$04$")
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects(monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_PENDING", 0)
+
+    with pytest.raises(password.PasswordHasherBusy):
+        await password.hash_password_async("secret")
+
+
+def test_needs_rehash_only_upgrades_cost(monkeypatch):
+    monkeypatch.setattr(password, "_rounds", 5)
+    weaker = bcrypt.hashpw(b"x", bcrypt.gensalt(rounds=4)).decode()
+    current = bcrypt.hashpw(b"x", bcrypt.gensalt(rounds=5)).decode()
+    stronger = bcrypt.hashpw(b"x", bcrypt.gensalt(rounds=6)).decode()
+
+    assert password.needs_rehash(weaker) is True
+    assert password.needs_rehash(current) is False
+    assert password.needs_rehash(stronger) is False
+
+
+def test_calibrate_rounds_respects_bounds():
+    assert password.calibrate_rounds(target_ms=0, min_rounds=4, max_rounds=6) == 4
+    assert password.calibrate_rounds(target_ms=10_000, min_rounds=4, max_rounds=6) == 6
+
+
+@pytest.mark.asyncio
+async def test_sign_in_rehashes_outdated_cost(monkeypatch):
+    monkeypatch.setattr(password, "_rounds", 5)
+    old_hash = bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=4)).decode()
+    repo = CustomAuthRepository(client=MagicMock())
+    repo.get_user_by_login_id = AsyncMock(
+        return_value={"id": "user-1", "login_id": "u1", "password_hash": old_hash}
+    )
+    repo.update_password = AsyncMock(return_value=True)
+
+    user = await repo.sign_in("u1", "secret")
+
+    repo.update_password.assert_awaited_once()
+    new_hash = repo.update_password.await_args.args[1]
+    assert new_hash.startswith("$2b$05$")
+    assert user["password_hash"] == new_hash
@@ -0,0 +1,123 @@
+"""Tests for assignment recurrence rules and occurrence materialization."""
+from datetime import date as Date
+
+import pytest
+
+from app.services.assignment_service import AssignmentService
+from app.services.recurrence import InvalidRecurrence, parse_recurrence
+
+
+# -- Rules --
+
+def test_interval_counts_from_anchor():
+    rule = parse_recurrence({"type": "interval", "every": 3})
+    days = rule.occurrences(Date(2026, 3, 1), Date(2026, 3, 5), Date(2026, 3, 12))
+    assert days == [Date(2026, 3, 7), Date(2026, 3, 10)]
+
+
+def test_weekly_iso_days_every_other_week():
+    # 2026-03-02 is a Monday.
+    rule = parse_recurrence({"type": "weekly", "every": 2, "days": [5, 1]})
+    days = rule.occurrences(Date(2026, 3, 4), Date(2026, 3, 4), Date(2026, 3, 31))
+    assert days == [Date(2026, 3, 6), Date(2026, 3, 16), Date(2026, 3, 20), Date(2026, 3, 30)]
+
+
+def test_monthly_skips_missing_days_and_stops_at_until():
+    rule = parse_recurrence({"type": "monthly", "days_of_month": [31], "until": "2026-06-30"})
+    days = rule.occurrences(Date(2026, 1, 31), Date(2026, 1, 1), Date(2026, 12, 31))
+    assert days == [Date(2026, 1, 31), Date(2026, 3, 31), Date(2026, 5, 31)]
+
+
+def test_weekend_and_weekday():
+    # 2026-03-06 is a Friday.
+    window = (Date(2026, 3, 1), Date(2026, 3, 6), Date(2026, 3, 9))
+    assert parse_recurrence({"type": "weekend"}).occurrences(*window) == [Date(2026, 3, 7), Date(2026, 3, 8)]
+    assert parse_recurrence({"type": "weekday"}).occurrences(*window) == [Date(2026, 3, 6), Date(2026, 3, 9)]
+
+
+def test_window_far_from_anchor():
+    rule = parse_recurrence({"type": "weekly", "days": [1]})
+    days = rule.occurrences(Date(2001, 1, 1), Date(2026, 3, 1), Date(2026, 3, 10))
+    assert days == [Date(2026, 3, 2), Date(2026, 3, 9)]
+
+
+@pytest.mark.parametrize("raw", [
+    {},
+    {"type": "yearly"},
+    {"type": "interval"},
+    {"type": "interval", "every": 0},
+    {"type": "weekly"},
+    {"type": "weekly", "days": [0]},
+    {"type": "monthly", "days_of_month": "1"},
+    {"type": "daily", "until": "soon"},
+])
+def test_invalid_rules(raw):
+    with pytest.raises(InvalidRecurrence):
+        parse_recurrence(raw)
+
+
+# -- Materialization --
+
+def _series(id, recurrence, due_date="2026-03-02T09:00:00+00:00", **extra):
+    return {
+        "id": id, "company_id": "company-1", "title": f"Task {id}", "due_date": due_date,
+        "created_at": "2026-03-01T00:00:00+00:00", "recurrence": recurrence,
+        "assignees": [{"user_id": "user-1"}], **extra,
+    }
+
+
+@pytest.mark.asyncio
+async def test_materialize_creates_occurrences_once(fake_assignment_repo):
+    fake_assignment_repo.assignments = {
+        "s-1": _series("s-1", {"type": "daily"}),
+        "s-2": _series("s-2", {"type": "weekly", "days": [3]}),
+        "s-3": _series("s-3", {"type": "hourly"}),
+    }
+    service = AssignmentService(fake_assignment_repo)
+
+    result = await service.materialize_recurrences(Date(2026, 3, 1), Date(2026, 3, 5), batch_size=2)
+
+    assert result == {"series": 2, "created": 4, "invalid": 1}
+    instance = fake_assignment_repo.assignments["s-1:2026-03-03"]
+    assert instance["due_date"] == "2026-03-03T09:00:00+00:00"
+    assert instance["assignees"] == [{"user_id": "user-1"}]
+    assert "s-1:2026-03-02" not in fake_assignment_repo.assignments  # the series row itself
+    assert "s-2:2026-03-04" in fake_assignment_repo.assignments
+
+    again = await service.materialize_recurrences(Date(2026, 3, 1), Date(2026, 3, 5), batch_size=2)
+    assert again == {"series": 0, "created": 0, "invalid": 1}
+
+
+@pytest.mark.asyncio
+async def test_materialize_resumes_after_watermark(fake_assignment_repo):
+    fake_assignment_repo.assignments = {"s-1": _series("s-1", {"type": "daily"})}
+    service = AssignmentService(fake_assignment_repo)
+    await service.materialize_recurrences(Date(2026, 3, 1), Date(2026, 3, 4))
+    del fake_assignment_repo.assignments["s-1:2026-03-04"]
+
+    result = await service.materialize_recurrences(Date(2026, 3, 1), Date(2026, 3, 6))
+
+    assert result["created"] == 2
+    assert "s-1:2026-03-04" not in fake_assignment_repo.assignments
+    assert fake_assignment_repo.assignments["s-1"]["recurrence_materialized_through"] == "2026-03-06"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("raw, stored", [
+    ({"type": "weekly", "days": [5, 1, 3]}, {"type": "weekly", "days": [1, 3, 5]}),
+    ({"type": "weekend"}, {"type": "weekend"}),
+    ({"type": "weekday"}, {"type": "weekday"}),
+    ({"type": "interval", "every": 3}, {"type": "interval", "every": 3}),
+    ({}, None),
+])
+async def test_create_accepts_documented_rules(fake_assignment_repo, raw, stored):
+    service = AssignmentService(fake_assignment_repo)
+    created = await service.create_assignment({"id": "a-1", "recurrence": raw}, [])
+    assert created["recurrence"] == stored
+
+
+@pytest.mark.asyncio
+async def test_create_rejects_invalid_rule(fake_assignment_repo):
+    service = AssignmentService(fake_assignment_repo)
+    with pytest.raises(InvalidRecurrence):
+        await service.create_assignment({"id": "a-2", "recurrence": {"type": "weekly", "every": -1}}, [])
@@ -0,0 +1,163 @@
+"""Unit tests for the pooled SMTP transport."""
+import asyncio
+import smtplib
+import threading
+import pytest
+from unittest.mock import patch
+
+from app.core.smtp import SMTPConnectionPool
+
+
+class FakeSMTP:
+    """Records sessions and messages instead of talking to a server."""
+
+    instances = []
+
+    login_error = None
+
+    def __init__(self, host, port, timeout=None):
+        self.sent = []
+        self.fail_next = None  # raised by the next MAIL FROM
+        self.fail_after_data = None  # raised once the next message was accepted
+        self.rcpt_to = None
+        self.quit_called = False
+        self.closed = False
+        FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        if FakeSMTP.login_error is not None:
+            raise FakeSMTP.login_error
+
+    def noop(self):
+        return (250, b"OK")
+
+    def ehlo_or_helo_if_needed(self):
+        pass
+
+    def mail(self, from_addr):
+        if self.fail_next is not None:
+            error, self.fail_next = self.fail_next, None
+            raise error
+        return (250, b"OK")
+
+    def rcpt(self, to_addr):
+        self.rcpt_to = to_addr
+        return (250, b"OK")
+
+    def data(self, raw):
+        self.sent.append(self.rcpt_to)
+        if self.fail_after_data is not None:
+            error, self.fail_after_data = self.fail_after_data, None
+            raise error
+        return (250, b"OK")
+
+    def rset(self):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pool():
+    FakeSMTP.instances = []
+    FakeSMTP.login_error = None
+    with patch("app.core.smtp.smtplib.SMTP", FakeSMTP):
+        yield SMTPConnectionPool(host="smtp", port=587, user="u", password="p", size=2)
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_reused(pool):
+    await pool.send("from@x", "a@x", "raw")
+    await pool.send("from@x", "b@x", "raw")
+
+    assert len(FakeSMTP.instances) == 1
+    assert FakeSMTP.instances[0].sent == ["a@x", "b@x"]
+
+
+@pytest.mark.asyncio
+async def test_dropped_session_reconnects_once(pool):
+    await pool.send("from@x", "a@x", "raw")
+    FakeSMTP.instances[0].fail_next = smtplib.SMTPServerDisconnected("gone")
+
+    await pool.send("from@x", "b@x", "raw")
+
+    assert len(FakeSMTP.instances) == 2
+    assert FakeSMTP.instances[1].sent == ["b@x"]
+
+
+@pytest.mark.asyncio
+async def test_drop_after_data_is_not_retried(pool):
+    await pool.send("from@x", "a@x", "raw")
+    FakeSMTP.instances[0].fail_after_data = smtplib.SMTPServerDisconnected("gone")
+
+    errors = await pool.send_many([("from@x", "b@x", "raw")])
+
+    assert isinstance(errors[0], smtplib.SMTPServerDisconnected)
+    assert len(FakeSMTP.instances) == 1
+    assert FakeSMTP.instances[0].sent == ["a@x", "b@x"]
+
+
+@pytest.mark.asyncio
+async def test_failed_login_closes_socket(pool):
+    FakeSMTP.login_error = smtplib.SMTPAuthenticationError(535, b"bad credentials")
+
+    with pytest.raises(smtplib.SMTPAuthenticationError):
+        await pool.send("from@x", "a@x", "raw")
+
+    assert FakeSMTP.instances[0].closed is True
+    assert pool._slots._value == 2
+
+
+@pytest.mark.asyncio
+async def test_send_many_reports_per_message_errors(pool):
+    await pool.send("from@x", "warmup@x", "raw")
+    FakeSMTP.instances[0].fail_next = smtplib.SMTPRecipientsRefused({"bad@x": (550, b"no")})
+
+    errors = await pool.send_many([
+        ("from@x", "bad@x", "raw"),
+        ("from@x", "ok@x", "raw"),
+    ])
+
+    assert isinstance(errors[0], smtplib.SMTPRecipientsRefused)
+    assert errors[1] is None
+    assert len(FakeSMTP.instances) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_send_finishes_and_returns_session(pool):
+    await pool.send("from@x", "warmup@x", "raw")
+    session = FakeSMTP.instances[0]
+    release = threading.Event()
+    original = session.data
+    session.data = lambda raw: (release.wait(5), original(raw))[1]
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(pool.send("from@x", "slow@x", "raw"), timeout=0.05)
+    assert pool._idle == []
+
+    release.set()
+    for _ in range(100):
+        if pool._idle:
+            break
+        await asyncio.sleep(0.01)
+
+    assert session.sent == ["warmup@x", "slow@x"]
+    assert [c.server for c in pool._idle] == [session]
+    assert pool._slots._value == 2
+
+
+@pytest.mark.asyncio
+async def test_aclose_quits_idle_sessions(pool):
+    await pool.send("from@x", "a@x", "raw")
+    await pool.aclose()
+
+    assert FakeSMTP.instances[0].quit_called is True
+    with pytest.raises(RuntimeError):
+        await pool.send("from@x", "a@x", "raw")
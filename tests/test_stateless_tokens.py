@@ -0,0 +1,69 @@
+"""Unit tests for stateless access tokens and token-version revocation."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import HTTPException
+
+from app.core.cache import StatsTTLCache
+from app.core.config import settings
+from app.core.jwt import build_access_claims, create_access_token
+from app.core.security import get_current_principal
+from app.core.token_version import TokenVersionStore
+from app.schemas.user import UserRole
+
+
+def _claims(version: int = 0) -> dict:
+    return build_access_claims({
+        "role": "manager",
+        "company_id": "company-1",
+        "status": "active",
+        "token_version": version,
+    })
+
+
+@pytest.fixture
+def stateless(monkeypatch):
+    monkeypatch.setattr(settings, "JWT_STATELESS_ACCESS_TOKENS", True)
+
+
+@pytest.fixture
+def version_store(fake_auth_repo):
+    fake_auth_repo.users["user-1"] = {"id": "user-1"}
+    return TokenVersionStore(auth_repo=fake_auth_repo, cache=StatsTTLCache(maxsize=10, ttl=60))
+
+
+@pytest.mark.asyncio
+async def test_principal_from_claims_skips_user_lookup(stateless, version_store):
+    token = create_access_token("user-1", extra=_claims())
+    user_repo = MagicMock()
+    user_repo.get_by_id = AsyncMock()
+
+    with patch("app.core.security.get_token_version_store", return_value=version_store), \
+            patch("app.core.security.get_user_repo", return_value=user_repo):
+        principal = await get_current_principal(f"Bearer {token}")
+
+    assert principal.id == "user-1"
+    assert principal.role == UserRole.MANAGER
+    assert principal.company_id == "company-1"
+    user_repo.get_by_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_bumped_version_revokes_token(stateless, version_store):
+    token = create_access_token("user-1", extra=_claims())
+    await version_store.bump("user-1")
+
+    with patch("app.core.security.get_token_version_store", return_value=version_store):
+        with pytest.raises(HTTPException) as exc:
+            await get_current_principal(f"Bearer {token}")
+
+    assert exc.value.status_code == 401
+    assert exc.value.detail == "Token has been revoked."
+
+
+@pytest.mark.asyncio
+async def test_version_lookup_is_cached(version_store, fake_auth_repo):
+    fake_auth_repo.get_token_version = AsyncMock(return_value=0)
+
+    assert await version_store.get("user-1") == 0
+    assert await version_store.get("user-1") == 0
+    fake_auth_repo.get_token_version.assert_awaited_once_with("user-1")
@@ -0,0 +1,111 @@
+"""Tests for compiled checklist template snapshots."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.admin_service import AdminService
+from app.services.daily_checklist_service import DailyChecklistService
+from app.services.template_snapshots import TemplateSnapshotCache, compile_template
+
+
+def _template(version=1):
+    return {
+        "id": "t-1",
+        "version": version,
+        "items": [
+            {"id": "i-2", "content": "Close", "sort_order": 2, "verification_type": "photo"},
+            {"id": "i-1", "content": "Open", "sort_order": 1},
+        ],
+        "groups": [{"group_id": "g-1"}],
+    }
+
+
+def test_compile_orders_items_and_copies_per_checklist():
+    snapshot = compile_template(_template())
+
+    data = snapshot.checklist_data()
+    assert [item["item_id"] for item in data] == ["i-1", "i-2"]
+    assert data[0]["verification_type"] == "none"
+    assert data[1]["is_completed"] is False
+    assert snapshot.group_ids == ["g-1"]
+
+    data[0]["is_completed"] = True
+    assert snapshot.checklist_data()[0]["is_completed"] is False
+
+
+def test_cache_serves_only_the_current_version():
+    cache = TemplateSnapshotCache(maxsize=10)
+    cache.put(compile_template(_template(version=1)))
+
+    assert cache.get("t-1", 1) is not None
+    assert cache.get("t-1", 2) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+    cache.put(compile_template(_template(version=2)))
+    cache.put(compile_template(_template(version=1)))
+    assert cache.get("t-1", 2) is not None
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TemplateSnapshotCache(maxsize=2)
+    for template_id in ("t-1", "t-2"):
+        cache.put(compile_template({**_template(), "id": template_id}))
+    cache.get("t-1", 1)
+    cache.put(compile_template({**_template(), "id": "t-3"}))
+
+    assert len(cache) == 2
+    assert cache.get("t-2", 1) is None
+    assert cache.get("t-1", 1) is not None
+
+
+def _service(version=1):
+    checklist_repo = MagicMock()
+    checklist_repo.get_by_template_branch_date = AsyncMock(return_value=None)
+    checklist_repo.create = AsyncMock(side_effect=lambda data: data)
+    template_repo = MagicMock()
+    template_repo.get_template_version = AsyncMock(return_value=version)
+    template_repo.get_template_by_id = AsyncMock(return_value=_template(version))
+    cache = TemplateSnapshotCache()
+    return DailyChecklistService(checklist_repo, template_repo, template_snapshots=cache), template_repo, cache
+
+
+@pytest.mark.asyncio
+async def test_generation_fetches_template_once_per_version():
+    service, template_repo, _ = _service()
+
+    first = await service.generate_from_template("t-1", "b-1", "2026-03-02")
+    second = await service.generate_from_template("t-1", "b-2", "2026-03-02")
+
+    template_repo.get_template_by_id.assert_awaited_once_with("t-1")
+    assert first["checklist_data"] == second["checklist_data"]
+    assert first["checklist_data"] is not second["checklist_data"]
+
+    template_repo.get_template_version.return_value = 2
+    template_repo.get_template_by_id.return_value = _template(2)
+    await service.generate_from_template("t-1", "b-3", "2026-03-02")
+    assert template_repo.get_template_by_id.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_generation_of_missing_template():
+    service, template_repo, _ = _service(version=None)
+    with pytest.raises(ValueError, match="Template not found."):
+        await service.generate_from_template("t-1", "b-1", "2026-03-02")
+    template_repo.get_template_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_admin_template_changes_invalidate_snapshot():
+    cache = TemplateSnapshotCache()
+    cache.put(compile_template(_template()))
+    template_repo = MagicMock()
+    template_repo.update_template = AsyncMock(return_value={"id": "t-1"})
+    service = AdminService(
+        MagicMock(), MagicMock(), template_repo, MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+        template_snapshots=cache,
+    )
+
+    await service.update_checklist_template("t-1", {"name": "Opening"})
+
+    assert len(cache) == 0
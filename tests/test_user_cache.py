@@ -0,0 +1,106 @@
+"""Unit tests for the authenticated-user cache."""
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.cache import StatsTTLCache
+from app.core.jwt import create_access_token
+from app.core.security import get_current_user
+from app.schemas.user import User
+from app.services.admin_service import AdminService
+from app.services.user_service import UserService
+
+
+def _make_user(user_id: str = "user-1", **overrides) -> User:
+    now = datetime.now(timezone.utc)
+    data = {
+        "id": user_id,
+        "email": "user@test.com",
+        "login_id": "user1",
+        "full_name": "User One",
+        "company_id": "company-1",
+        "created_at": now,
+        "updated_at": now,
+    }
+    data.update(overrides)
+    return User(**data)
+
+
+def test_cache_counts_hits_and_misses():
+    cache = StatsTTLCache(maxsize=10, ttl=60)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = StatsTTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_reads_db_once():
+    cache = StatsTTLCache(maxsize=10, ttl=60)
+    repo = MagicMock()
+    repo.get_by_id = AsyncMock(return_value=_make_user())
+    token = create_access_token("user-1")
+
+    with patch("app.core.security.get_user_cache", return_value=cache), \
+            patch("app.core.security.get_user_repo", return_value=repo):
+        first = await get_current_user(f"Bearer {token}")
+        second = await get_current_user(f"Bearer {token}")
+
+    assert first.id == second.id == "user-1"
+    repo.get_by_id.assert_awaited_once_with("user-1")
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_update_profile_invalidates_cache():
+    cache = StatsTTLCache(maxsize=10, ttl=60)
+    cache.set("user-1", _make_user())
+    user_repo = MagicMock()
+    user_repo.update = AsyncMock(return_value=_make_user(full_name="Renamed"))
+    service = UserService(user_repo=user_repo, auth_repo=MagicMock(), user_cache=cache)
+
+    await service.update_profile("user-1", {"full_name": "Renamed"})
+
+    assert cache.get("user-1") is None
+
+
+@pytest.mark.asyncio
+async def test_approve_and_reject_staff_invalidate_cache():
+    cache = StatsTTLCache(maxsize=10, ttl=60)
+    user_repo = MagicMock()
+    user_repo.update = AsyncMock(return_value=_make_user(status="active"))
+    service = AdminService(
+        user_repo=user_repo,
+        org_repo=MagicMock(),
+        template_repo=MagicMock(),
+        assignment_repo=MagicMock(),
+        feedback_repo=MagicMock(),
+        notice_repo=MagicMock(),
+        notification_service=MagicMock(),
+        user_cache=cache,
+    )
+
+    cache.set("user-1", _make_user())
+    await service.approve_staff("user-1")
+    assert cache.get("user-1") is None
+    user_repo.update.assert_awaited_with("user-1", {"status": "active"})
+
+    cache.set("user-1", _make_user())
+    await service.reject_staff("user-1")
+    assert cache.get("user-1") is None
+    user_repo.update.assert_awaited_with("user-1", {"status": "inactive"})